@@ -0,0 +1,2 @@
+# Copyright (c) 2018 Stephen Bunn (stephen@bunn.io)
+# MIT License <https://opensource.org/licenses/MIT>
@@ -0,0 +1,123 @@
+# Copyright (c) 2018 Stephen Bunn (stephen@bunn.io)
+# MIT License <https://opensource.org/licenses/MIT>
+
+"""Compares the memory of content groups and slotted content against dict content.
+
+Usage::
+
+    python -m benchmarks.bench_content [posts]
+"""
+
+import sys
+import datetime
+import tracemalloc
+from typing import List, Callable, Iterable
+
+import attr
+from furl import furl
+
+from qetch.content import ContentGroup
+from qetch.extractors import fourchan
+from qetch.extractors._common import BaseExtractor
+
+THREAD_URL = "https://boards.4chan.org/g/thread/12345678"
+
+
+@attr.s
+class LegacyContent(object):
+    """The content as it was before it was slotted."""
+
+    uid = attr.ib(type=str)
+    source = attr.ib(type=str, converter=furl, repr=False)
+    fragments = attr.ib(type=List[str], repr=False)
+    extractor = attr.ib(type=BaseExtractor, repr=False)
+    extension = attr.ib(type=str, default=None, repr=False)
+    title = attr.ib(type=str, default=None, repr=False)
+    description = attr.ib(type=str, default=None, repr=False)
+    quality = attr.ib(type=float, default=0.0)
+    uploaded_by = attr.ib(type=str, default=None, repr=False)
+    uploaded_date = attr.ib(type=datetime.datetime, default=None, repr=False)
+    metadata = attr.ib(type=dict, default={}, repr=False)
+
+
+def get_thread_data(posts: int) -> dict:
+    return {
+        "posts": [
+            {
+                "no": 12345678 + index,
+                "time": 1520000000 + index,
+                "tim": 1520000000000 + index,
+                "ext": ".webm",
+                "md5": f"{index:024d}",
+                "filename": f"file-{index}",
+                "name": "Anonymous",
+                "com": f"&gt;&gt;{12345678 + index - 1}<br>post {index}",
+            }
+            for index in range(posts)
+        ]
+    }
+
+
+def build_legacy(groups: Iterable[ContentGroup]) -> list:
+    """Builds the content lists extractors yielded before content was slotted."""
+
+    return [
+        [
+            LegacyContent(
+                uid=variant.uid,
+                source=group.source,
+                fragments=variant.fragments,
+                extractor=group.extractor,
+                extension=variant.extension,
+                title=group.title,
+                description=str(group.description),
+                quality=variant.quality,
+                uploaded_by=group.uploaded_by,
+                uploaded_date=group.uploaded_date,
+                metadata=group.metadata,
+            )
+            for variant in group.variants
+        ]
+        for group in groups
+    ]
+
+
+def build_slotted(groups: Iterable[ContentGroup]) -> list:
+    """Builds lists of slotted content by materializing every variant."""
+
+    return [list(group) for group in groups]
+
+
+def build_groups(groups: Iterable[ContentGroup]) -> list:
+    """Keeps the content groups (with their shared fields and variants)."""
+
+    return list(groups)
+
+
+def measure(build: Callable[[Iterable[ContentGroup]], list], data: dict) -> tuple:
+    """Measures the bytes allocated per variant while extracting a thread."""
+
+    extractor = fourchan.FourChanExtractor()
+    tracemalloc.start()
+    posts = data["posts"]
+    built = build(extractor._build_thread_content(THREAD_URL, "g", "12345678", posts))
+    (allocated, _) = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+
+    count = sum(len(group) for group in built)
+    return (count, allocated / count)
+
+
+def main(posts: int = 1000):
+    data = get_thread_data(posts)
+    for (label, build) in (
+        ("legacy", build_legacy),
+        ("slotted", build_slotted),
+        ("group", build_groups),
+    ):
+        (count, per_variant) = measure(build, data)
+        print(f"{label:>8}: {per_variant:8.1f} bytes/variant ({count} variants)")
+
+
+if __name__ == "__main__":
+    main(*[int(arg) for arg in sys.argv[1:2]])
@@ -0,0 +1,167 @@
+# Copyright (c) 2018 Stephen Bunn (stephen@bunn.io)
+# MIT License <https://opensource.org/licenses/MIT>
+
+"""Compares fetching many small files over HTTP/1.1 and multiplexed HTTP/2.
+
+Files are served by local servers which answer each request after a delay,
+standing in for the round trip to a remote host such as ``i.4cdn.org``.
+HTTP/1.1 requests are limited to the pool of each host (one request per
+connection), HTTP/2 requests share a single connection.
+
+Requires the optional ``httpx[http2]`` dependency.
+
+Usage::
+
+    python -m benchmarks.bench_http2 [files] [latency_ms] [workers]
+"""
+
+import sys
+import time
+import heapq
+import select
+import socket
+import threading
+from http.server import HTTPServer, BaseHTTPRequestHandler
+from socketserver import ThreadingMixIn
+from concurrent.futures import ThreadPoolExecutor
+
+import h2.config
+import h2.events
+import h2.connection
+
+from qetch.sessions import SessionManager
+from qetch.transports import HTTPXTransport, Urllib3Transport
+
+FILE_SIZE = 8 * 1024
+BODY = bytes(index % 251 for index in range(FILE_SIZE))
+
+
+class HTTP1Handler(BaseHTTPRequestHandler):
+    """Answers every request with the file body after a delay."""
+
+    protocol_version = "HTTP/1.1"
+    disable_nagle_algorithm = True
+    latency = 0.0
+
+    def do_GET(self):
+        time.sleep(self.latency)
+        self.send_response(200)
+        self.send_header("Content-Length", str(len(BODY)))
+        self.end_headers()
+        self.wfile.write(BODY)
+
+    def log_message(self, *args):
+        pass
+
+
+class HTTP1Server(ThreadingMixIn, HTTPServer):
+    daemon_threads = True
+
+
+class HTTP2Server(object):
+    """A cleartext HTTP/2 server answering every stream after a delay."""
+
+    def __init__(self, latency: float):
+        self.latency = latency
+        self.socket = socket.socket()
+        self.socket.bind(("127.0.0.1", 0))
+        self.socket.listen()
+        self.port = self.socket.getsockname()[1]
+
+    def serve_forever(self):
+        while True:
+            (connection, _) = self.socket.accept()
+            threading.Thread(
+                target=self.handle, args=(connection,), daemon=True
+            ).start()
+
+    def handle(self, connection: socket.socket):
+        h2_connection = h2.connection.H2Connection(
+            config=h2.config.H2Configuration(client_side=False)
+        )
+        h2_connection.initiate_connection()
+        connection.sendall(h2_connection.data_to_send())
+        (due, pending) = ([], {})
+
+        while True:
+            timeout = max(0.0, due[0][0] - time.monotonic()) if due else None
+            (readable, _, _) = select.select([connection], [], [], timeout)
+            if readable:
+                data = connection.recv(2 ** 16)
+                if not data:
+                    return
+                for event in h2_connection.receive_data(data):
+                    if isinstance(event, h2.events.RequestReceived):
+                        heapq.heappush(
+                            due, (time.monotonic() + self.latency, event.stream_id)
+                        )
+                    elif isinstance(event, h2.events.StreamReset):
+                        pending.pop(event.stream_id, None)
+
+            while due and due[0][0] <= time.monotonic():
+                (_, stream_id) = heapq.heappop(due)
+                h2_connection.send_headers(
+                    stream_id,
+                    [(":status", "200"), ("content-length", str(len(BODY)))],
+                )
+                pending[stream_id] = BODY
+
+            for (stream_id, remaining) in list(pending.items()):
+                size = min(
+                    len(remaining),
+                    h2_connection.local_flow_control_window(stream_id),
+                    h2_connection.max_outbound_frame_size,
+                )
+                if size > 0:
+                    h2_connection.send_data(
+                        stream_id, remaining[:size], end_stream=size == len(remaining)
+                    )
+                    pending[stream_id] = remaining[size:]
+                if not pending[stream_id]:
+                    del pending[stream_id]
+            connection.sendall(h2_connection.data_to_send())
+
+
+def fetch_all(transport, url: str, files: int, workers: int) -> float:
+    def fetch(index: int):
+        response = transport.get(f"{url}/{index}")
+        assert len(response.content) == FILE_SIZE
+
+    with ThreadPoolExecutor(max_workers=workers) as executor:
+        started = time.perf_counter()
+        list(executor.map(fetch, range(files)))
+        return time.perf_counter() - started
+
+
+def main(files: int = 2000, latency_ms: int = 20, workers: int = 64):
+    latency = latency_ms / 1000.0
+    HTTP1Handler.latency = latency
+    http1_server = HTTP1Server(("127.0.0.1", 0), HTTP1Handler)
+    http2_server = HTTP2Server(latency)
+    for server in (http1_server, http2_server):
+        threading.Thread(target=server.serve_forever, daemon=True).start()
+
+    print(
+        f"{files} files of {FILE_SIZE} bytes, {latency_ms}ms latency, "
+        f"{workers} workers, {SessionManager().pool_maxsize} connections per host"
+    )
+    for (label, transport, url) in (
+        (
+            "http/1.1",
+            Urllib3Transport(),
+            f"http://127.0.0.1:{http1_server.server_port}",
+        ),
+        (
+            "http/2",
+            HTTPXTransport(max_connections=1, prior_knowledge=True),
+            f"http://127.0.0.1:{http2_server.port}",
+        ),
+    ):
+        elapsed = fetch_all(transport, url, files, workers)
+        print(f"{label:>8}: {files / elapsed:8.1f} files/s ({elapsed:.3f}s total)")
+        transport.close()
+    http1_server.shutdown()
+
+
+if __name__ == "__main__":
+    main(*[int(arg) for arg in sys.argv[1:4]])
@@ -0,0 +1,128 @@
+# Copyright (c) 2018 Stephen Bunn (stephen@bunn.io)
+# MIT License <https://opensource.org/licenses/MIT>
+
+"""Compares static byte ranges and dynamic range splitting with a slow connection.
+
+Bytes are served by a local HTTP server throttling every ``connections``-th
+connection it accepts (starting with the first), standing in for a host
+throttling some of the connections of a download. Static ranges are measured
+by never splitting segments.
+
+Usage::
+
+    python -m benchmarks.bench_ranges [megabytes] [connections] [throttle_mbps]
+"""
+
+import os
+import sys
+import time
+import itertools
+import threading
+import tempfile
+from http.server import HTTPServer, BaseHTTPRequestHandler
+from socketserver import ThreadingMixIn
+
+from qetch.downloaders import HTTPDownloader
+from qetch.extractors import GenericExtractor
+from qetch.transports import Urllib3Transport
+
+PIECE_SIZE = 2 ** 16
+
+
+class ThrottlingHandler(BaseHTTPRequestHandler):
+    """Serves a single in-memory body, throttling some connections."""
+
+    protocol_version = "HTTP/1.1"
+    disable_nagle_algorithm = True
+    body = b""
+
+    def setup(self):
+        super().setup()
+        index = next(self.server.accepted)
+        self.throttled = index % self.server.throttle_every == 0
+
+    def do_HEAD(self):
+        self.send_response(200)
+        self.send_header("Accept-Ranges", "bytes")
+        self.send_header("Content-Length", str(len(self.body)))
+        self.end_headers()
+
+    def do_GET(self):
+        (start, _, end) = self.headers["Range"].replace("bytes=", "").partition("-")
+        (start, stop) = (int(start), int(end) + 1)
+        self.send_response(206)
+        self.send_header("Content-Length", str(stop - start))
+        self.end_headers()
+        for offset in range(start, stop, PIECE_SIZE):
+            piece_stop = min(offset + PIECE_SIZE, stop)
+            self.wfile.write(self.body[offset:piece_stop])
+            if self.throttled:
+                time.sleep((piece_stop - offset) / self.server.throttle_rate)
+
+    def log_message(self, *args):
+        pass
+
+
+class Server(ThreadingMixIn, HTTPServer):
+    daemon_threads = True
+
+    def __init__(self, *args, throttle_every: int = 4, throttle_rate: float = 0.0):
+        super().__init__(*args)
+        self.accepted = itertools.count()
+        self.throttle_every = throttle_every
+        self.throttle_rate = throttle_rate
+
+    def handle_error(self, request, client_address):
+        # NOTE: downloads drop connections of segments split by other connections
+        if not isinstance(sys.exc_info()[1], ConnectionError):
+            super().handle_error(request, client_address)
+
+
+def download(url: str, connections: int, min_segment: int) -> float:
+    (content,) = next(GenericExtractor().extract(url))
+    HTTPDownloader.transport = Urllib3Transport()
+    HTTPDownloader.min_segment = min_segment
+    with tempfile.TemporaryDirectory() as temporary_dir:
+        started = time.perf_counter()
+        HTTPDownloader().download(
+            content,
+            os.path.join(temporary_dir, "download"),
+            max_connections=connections,
+        )
+        elapsed = time.perf_counter() - started
+    HTTPDownloader.transport.close()
+    return elapsed
+
+
+def main(megabytes: int = 128, connections: int = 4, throttle_mbps: int = 8):
+    size = megabytes * 2 ** 20
+    ThrottlingHandler.body = os.urandom(size)
+    server = Server(
+        ("127.0.0.1", 0),
+        ThrottlingHandler,
+        throttle_every=connections,
+        throttle_rate=throttle_mbps * 2 ** 20,
+    )
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    url = f"http://127.0.0.1:{server.server_port}/file.bin"
+
+    print(
+        f"{megabytes}MB, {connections} connections, every {connections}th "
+        f"connection throttled to {throttle_mbps}MB/s"
+    )
+    try:
+        for (label, min_segment) in (
+            ("static", size),
+            ("dynamic", HTTPDownloader.min_segment),
+        ):
+            server.accepted = itertools.count()
+            elapsed = download(url, connections, min_segment)
+            print(
+                f"{label:>8}: {megabytes / elapsed:8.1f} MB/s ({elapsed:.3f}s total)"
+            )
+    finally:
+        server.shutdown()
+
+
+if __name__ == "__main__":
+    main(*[int(arg) for arg in sys.argv[1:4]])
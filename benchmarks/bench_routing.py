@@ -0,0 +1,66 @@
+# Copyright (c) 2018 Stephen Bunn (stephen@bunn.io)
+# MIT License <https://opensource.org/licenses/MIT>
+
+"""Compares the indexed router against the previous linear extractor scan.
+
+Usage::
+
+    python -m benchmarks.bench_routing [iterations]
+"""
+
+import sys
+import timeit
+import inspect
+
+import qetch
+from qetch import extractors
+from qetch.extractors._common import BaseExtractor
+
+IGNORED_EXTRACTORS = (BaseExtractor, extractors.GenericExtractor)
+
+URLS = [
+    "https://gfycat.com/ExampleGfycatName",
+    "https://giant.gfycat.com/ExampleGfycatName.webm",
+    "https://imgur.com/a/abc123",
+    "https://i.imgur.com/abc123.jpg",
+    "https://boards.4chan.org/g/thread/12345678",
+    "https://i.4cdn.org/g/1520000000000.png",
+    "https://example.com/some/media/file.mp4",
+    "https://www.example.org/archive/video.webm",
+]
+
+
+def linear_get_extractor(url: str):
+    """The extractor lookup as it was before the router existed."""
+
+    for (_, extractor_class) in inspect.getmembers(
+        extractors, predicate=inspect.isclass
+    ):
+        if extractor_class not in IGNORED_EXTRACTORS:
+            if extractor_class.can_handle(url):
+                return extractor_class
+    if extractors.GenericExtractor.can_handle(url):
+        return extractors.GenericExtractor
+
+
+def routed_get_extractor(url: str):
+    return qetch.ROUTER.route(url)[0]
+
+
+def main(iterations: int = 20000):
+    for url in URLS:
+        assert linear_get_extractor(url) is routed_get_extractor(url), url
+
+    for (label, func) in (
+        ("linear", linear_get_extractor),
+        ("router", routed_get_extractor),
+    ):
+        elapsed = timeit.timeit(
+            lambda: [func(url) for url in URLS], number=iterations
+        )
+        per_url = (elapsed / (iterations * len(URLS))) * 1e6
+        print(f"{label:>8}: {per_url:8.3f} us/url ({elapsed:.3f}s total)")
+
+
+if __name__ == "__main__":
+    main(*[int(arg) for arg in sys.argv[1:2]])
@@ -0,0 +1,94 @@
+# Copyright (c) 2018 Stephen Bunn (stephen@bunn.io)
+# MIT License <https://opensource.org/licenses/MIT>
+
+"""Compares downloading through the requests and urllib3 transports.
+
+Bytes are served by a local HTTP server so the transports' overhead (rather
+than the network) is measured.
+
+Usage::
+
+    python -m benchmarks.bench_transports [megabytes] [connections]
+"""
+
+import os
+import sys
+import time
+import threading
+import tempfile
+from http.server import HTTPServer, SimpleHTTPRequestHandler
+from socketserver import ThreadingMixIn
+
+from qetch.downloaders import HTTPDownloader
+from qetch.extractors import GenericExtractor
+from qetch.transports import RequestsTransport, Urllib3Transport
+
+
+class RangeHandler(SimpleHTTPRequestHandler):
+    """Serves a single in-memory body honoring ``Range`` headers."""
+
+    protocol_version = "HTTP/1.1"
+    body = b""
+
+    def do_HEAD(self):
+        self.send_response(200)
+        self.send_header("Accept-Ranges", "bytes")
+        self.send_header("Content-Length", str(len(self.body)))
+        self.end_headers()
+
+    def do_GET(self):
+        (start, _, end) = self.headers["Range"].replace("bytes=", "").partition("-")
+        stop = int(end) + 1
+        chunk = self.body[int(start):stop]
+        self.send_response(206)
+        self.send_header("Content-Length", str(len(chunk)))
+        self.end_headers()
+        self.wfile.write(chunk)
+
+    def log_message(self, *args):
+        pass
+
+
+class Server(ThreadingMixIn, HTTPServer):
+    daemon_threads = True
+
+    def handle_error(self, request, client_address):
+        # NOTE: downloads drop connections of segments split by other connections
+        if not isinstance(sys.exc_info()[1], ConnectionError):
+            super().handle_error(request, client_address)
+
+
+def download(url: str, transport, connections: int) -> float:
+    (content,) = next(GenericExtractor().extract(url))
+    HTTPDownloader.transport = transport
+    with tempfile.TemporaryDirectory() as temporary_dir:
+        started = time.perf_counter()
+        HTTPDownloader().download(
+            content,
+            os.path.join(temporary_dir, "download"),
+            max_connections=connections,
+        )
+        return time.perf_counter() - started
+
+
+def main(megabytes: int = 256, connections: int = 4):
+    RangeHandler.body = os.urandom(megabytes * 2 ** 20)
+    server = Server(("127.0.0.1", 0), RangeHandler)
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    url = f"http://127.0.0.1:{server.server_port}/file.bin"
+
+    try:
+        for (label, transport) in (
+            ("requests", RequestsTransport()),
+            ("urllib3", Urllib3Transport()),
+        ):
+            elapsed = download(url, transport, connections)
+            print(
+                f"{label:>8}: {megabytes / elapsed:8.1f} MB/s ({elapsed:.3f}s total)"
+            )
+    finally:
+        server.shutdown()
+
+
+if __name__ == "__main__":
+    main(*[int(arg) for arg in sys.argv[1:3]])
@@ -1,17 +1,78 @@
 # Copyright (c) 2018 Stephen Bunn (stephen@bunn.io)
 # MIT License <https://opensource.org/licenses/MIT>
 
-import inspect
+from __future__ import annotations
 
-from . import exceptions, extractors, downloaders
-from .content import Content
+import importlib
+import threading
+from typing import (
+    TYPE_CHECKING,
+    Any,
+    List,
+    Match,
+    Tuple,
+    Callable,
+    Hashable,
+    Iterable,
+    Generator,
+)
+from concurrent.futures import ThreadPoolExecutor
 
-IGNORED_EXTRACTORS = (extractors._common.BaseExtractor, extractors.GenericExtractor)
-IGNORED_DOWNLOADERS = (downloaders._common.BaseDownloader,)
+from . import plugins, routing, exceptions, extractors, downloaders
+
+if TYPE_CHECKING:
+    from .content import Content, ContentGroup
+
+# built once at import, extractor and downloader modules are imported on first use
+ROUTER = routing.Router.build(
+    extractors.PLUGINS,
+    fallback=extractors.FALLBACK_PLUGIN,
+    discover=lambda: plugins.discover(plugins.EXTRACTORS_GROUP),
+)
+DISPATCHER = routing.Dispatcher.build(
+    downloaders.PLUGINS, discover=lambda: plugins.discover(plugins.DOWNLOADERS_GROUP)
+)
+
+
+def __getattr__(name: str):
+    if name == "Content":
+        return importlib.import_module(".content", __name__).Content
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+
+def route(url: str) -> routing.Route:
+    """Resolves the extractor class, handle name and match for a given url.
+
+    Args:
+        url (str): The url that needs to be extracted
+
+    Raises:
+        exceptions.ExtractionError: If no extractor can handle the url.
+
+    Returns:
+        tuple[type[BaseExtractor], str, Match]: The resolved
+            ``(extractor_class, handle_name, match)`` triple.
+
+    Examples:
+        Passing the resolved handle to the extractor avoids matching the url
+        a second time...
+
+        >>> import qetch
+        >>> (extractor_class, handle_name, match) = qetch.route(GFYCAT_URL)
+        >>> for content_list in extractor_class().extract(
+        ...     GFYCAT_URL, handle=(handle_name, match)
+        ... ):
+        ...     print(content_list)
+    """
+
+    resolved = ROUTER.route(url)
+    if resolved is None:
+        raise exceptions.ExtractionError(f"no existing extractor can handle {url!r}")
+    return resolved
 
 
 def get_extractor(
-    url: str, init: bool = False, *args, **kwargs
+    url: str, init: bool = False, *args, asynchronous: bool = False, **kwargs
 ) -> extractors._common.BaseExtractor:
     """Gets the first extractor that can handle a given url.
 
@@ -19,6 +80,11 @@ def get_extractor(
         url (str): The url that needs to be extracted
         init (bool, optional): If True initializes the class, otherwise returns
             the class
+        asynchronous (bool, optional): If True, gets the asynchronous
+            counterpart of the extractor
+
+    Raises:
+        exceptions.ExtractionError: If no extractor can handle the url.
 
     Returns:
         extractors._common.BaseExtractor: The extractor that can
@@ -33,34 +99,247 @@ def get_extractor(
         <GfycatExtractor "gfycat">
     """
 
-    for (extractor_name, extractor_class) in inspect.getmembers(
-        extractors, predicate=inspect.isclass
-    ):
-        if extractor_class not in IGNORED_EXTRACTORS:
-            if extractor_class.can_handle(url):
-                return (
-                    extractor_class if not init else extractor_class(*args, **kwargs)
+    resolved = ROUTER.resolve(url)
+    if resolved is None:
+        raise exceptions.ExtractionError(f"no existing extractor can handle {url!r}")
+
+    extractor_class = resolved[0].load_async() if asynchronous else resolved[0].load()
+    return extractor_class if not init else extractor_class(*args, **kwargs)
+
+
+def route_many(
+    urls: Iterable[str],
+    *args,
+    batch_size: int = 1000,
+    reject_hook: Callable[[str], None] = None,
+    **kwargs,
+) -> Generator[Tuple[extractors._common.BaseExtractor, str, List[str]], None, None]:
+    """Routes many urls, grouping them into buckets of the same extractor handle.
+
+    Note:
+        Only one extractor instance is created per extractor class (initialized
+        with the given ``args`` and ``kwargs``) and is shared between all of
+        the buckets for that class.
+
+        Buckets are yielded as soon as they reach ``batch_size`` urls, any
+        remaining partial buckets are yielded once ``urls`` is exhausted.
+
+    Args:
+        urls (iterable[str]): The urls to route.
+        batch_size (int, optional): The maximum number of urls in a bucket.
+        reject_hook (callable, optional): A hook that accepts the argument
+            ``(url,)`` for each url that no extractor can handle, if not given
+            these urls are skipped.
+
+    Yields:
+        tuple[BaseExtractor, str, list[str]]: A bucket of
+            ``(extractor, handle_name, urls)``.
+
+    Examples:
+        Basic usage...
+
+        >>> import qetch
+        >>> rejected = []
+        >>> for (extractor, handle_name, bucket) in qetch.route_many(
+        ...     urls, reject_hook=rejected.append
+        ... ):
+        ...     print(extractor, handle_name, len(bucket))
+        <GfycatExtractor "gfycat"> basic 1000
+        <ImgurExtractor "imgur"> album 281
+    """
+
+    assert batch_size > 0, f"'batch_size' must be at least 1, received {batch_size!r}"
+
+    instances = {}
+    buckets = {}
+    for url in urls:
+        resolved = ROUTER.route(url)
+        if resolved is None:
+            if callable(reject_hook):
+                reject_hook(url)
+            continue
+
+        (extractor_class, handle_name, _) = resolved
+        bucket = buckets.setdefault((extractor_class, handle_name), [])
+        bucket.append(url)
+        if len(bucket) >= batch_size:
+            if extractor_class not in instances:
+                instances[extractor_class] = extractor_class(*args, **kwargs)
+            yield (instances[extractor_class], handle_name, bucket)
+            del buckets[(extractor_class, handle_name)]
+
+    for ((extractor_class, handle_name), bucket) in buckets.items():
+        if extractor_class not in instances:
+            instances[extractor_class] = extractor_class(*args, **kwargs)
+        yield (instances[extractor_class], handle_name, bucket)
+
+
+def _resolve_many(
+    urls: Iterable[str], reject_hook: Callable[[str], None] = None
+) -> Generator[Tuple[Hashable, Tuple[plugins.Plugin, str, Any]], None, None]:
+    for url in urls:
+        resolved = ROUTER.resolve(url)
+        if resolved is None:
+            if callable(reject_hook):
+                reject_hook(url)
+            continue
+        (plugin, handle_name, match) = resolved
+        yield (routing.get_group(plugin, url), (plugin, url, (handle_name, match)))
+
+
+def extract_many(
+    urls: Iterable[str],
+    *args,
+    max_workers: int = 16,
+    per_domain: int = 4,
+    auth_tuple: Tuple[str, str] = None,
+    reject_hook: Callable[[str], None] = None,
+    error_hook: Callable[[str, Exception], None] = None,
+    backlog: int = 1024,
+    **kwargs,
+) -> Generator[Tuple[str, List[ContentGroup]], None, None]:
+    """Extracts many urls concurrently, yielding results as they complete.
+
+    Note:
+        Urls are grouped by the :attr:`~.extractors._common.BaseExtractor.domains`
+        of the extractor handling them (urls handled by the fallback extractor
+        are grouped by their host), and no more than ``per_domain`` urls of the
+        same group are extracted at the same time.
+        Urls are only read from ``urls`` while workers are idle, so ``urls``
+        can be a lazy iterable, and a finishing worker immediately starts the
+        next url that is ready (even while the caller is consuming results),
+        see :class:`~.routing.DomainDispatcher`.
+
+        Each worker thread initializes its own extractor instances with the
+        given ``args`` and ``kwargs``.
+        Before the first url of an extractor is dispatched, the connection
+        pools of its transport are grown to hold ``per_domain`` times the
+        extractor's :attr:`~.extractors._common.BaseExtractor.max_connections`
+        connections per host, so concurrent extractions never wait for a
+        pooled connection.
+
+    Args:
+        urls (iterable[str]): The urls to extract.
+        max_workers (int, optional): The maximum number of urls being extracted
+            at the same time.
+        per_domain (int, optional): The maximum number of urls of the same
+            domain group being extracted at the same time.
+        auth_tuple (tuple[str, str], optional): The auth tuple passed to each
+            extraction.
+        reject_hook (callable, optional): A hook that accepts the argument
+            ``(url,)`` for each url that no extractor can handle, if not given
+            these urls are skipped.
+        error_hook (callable, optional): A hook that accepts the arguments
+            ``(url, exception)`` for each url whose extraction raised, if not
+            given the exception is raised (once the extractions already
+            running are finished and yielded).
+        backlog (int, optional): The maximum number of read urls waiting for
+            their domain group, urls are no longer read while it is full.
+
+    Yields:
+        tuple[str, list[ContentGroup]]: A tuple of ``(url, content_groups)`` in
+            the order the extractions complete.
+
+    Examples:
+        Basic usage...
+
+        >>> import qetch
+        >>> for (url, content_groups) in qetch.extract_many(
+        ...     urls, max_workers=32, per_domain=8
+        ... ):
+        ...     print(url, len(content_groups))
+        https://imgur.com/a/abc123 12
+        https://gfycat.com/ExampleGfycatName 1
+    """
+
+    assert max_workers > 0, (
+        f"'max_workers' must be at least 1, received {max_workers!r}"
+    )
+
+    local = threading.local()
+
+    def extract(item: Tuple[plugins.Plugin, str, Tuple[str, Match]]) -> list:
+        (plugin, url, handle) = item
+        instances = local.__dict__.setdefault("instances", {})
+        extractor_class = plugin.load()
+        if extractor_class not in instances:
+            instances[extractor_class] = extractor_class(*args, **kwargs)
+        extractor = instances[extractor_class]
+        return list(extractor.extract(url, auth_tuple=auth_tuple, handle=handle))
+
+    def reserve(
+        resolved: Iterable[Tuple[Hashable, Tuple[plugins.Plugin, str, Any]]]
+    ) -> Generator[Tuple[Hashable, Tuple[plugins.Plugin, str, Any]], None, None]:
+        reserved = set()
+        for (group, item) in resolved:
+            extractor_class = item[0].load()
+            if extractor_class not in reserved:
+                reserved.add(extractor_class)
+                extractor = extractor_class(*args, **kwargs)
+                extractor.session.reserve(
+                    min(per_domain, max_workers) * extractor.max_connections
                 )
-    # if no extractor can handle, try GenericExtractor
-    if extractors.GenericExtractor.can_handle(url):
-        return (
-            extractors.GenericExtractor
-            if not init
-            else extractors.GenericExtractor(*args, **kwargs)
+            yield (group, item)
+
+    resolved = reserve(_resolve_many(urls, reject_hook=reject_hook))
+    error = None
+    with ThreadPoolExecutor(max_workers=max_workers) as executor:
+        dispatcher = routing.DomainDispatcher(
+            executor,
+            extract,
+            max_workers=max_workers,
+            per_domain=per_domain,
+            backlog=backlog,
         )
+        try:
+            dispatcher.fill(resolved)
+            while len(dispatcher) > 0:
+                ((_, url, _), future) = dispatcher.get()
+                exception = future.exception()
+                if exception is not None and not callable(error_hook):
+                    # NOTE: extractions already running are still yielded
+                    dispatcher.stop()
+                    error = error or exception
+
+                # keep the workers busy while the caller consumes the results
+                dispatcher.fill(resolved)
+                if exception is None:
+                    yield (url, future.result())
+                elif callable(error_hook):
+                    error_hook(url, exception)
+        finally:
+            dispatcher.stop()
 
-    raise exceptions.ExtractionError(f"no existing extractor can handle {url!r}")
+    if error is not None:
+        raise error
 
 
 def get_downloader(
-    content: Content, init: bool = False, *args, **kwargs
+    content: Content,
+    init: bool = False,
+    *args,
+    requires: Iterable[downloaders._common.DownloadCapabilities] = None,
+    probe: bool = False,
+    **kwargs,
 ) -> downloaders._common.BaseDownloader:
     """Gets the first downloader that can handle a given content.
 
+    Note:
+        Downloaders are chosen by the schemes of the content's fragments and the
+        capabilities they declare, so no requests are made unless ``probe`` is
+        True.
+
     Args:
         content (Content): The content that needs to be downloaded
         init (bool, optional): If True initializes the class, otherwise
             returns the class
+        requires (list[DownloadCapabilities], optional): The capabilities the
+            downloader must declare
+        probe (bool, optional): If True, also checks that the content's
+            fragments are alive (results are memoized per fragment)
+
+    Raises:
+        exceptions.DownloadError: If no downloader can handle the content.
 
     Returns:
         downloaders._common.BaseDownloader: The downloader that can handle the
@@ -77,11 +356,7 @@ def get_downloader(
         <HTTPDownloader at 0xABCDEF1234567890>
     """
 
-    for (downloader_name, downloader_class) in inspect.getmembers(
-        downloaders, predicate=inspect.isclass
-    ):
-        if downloader_class not in IGNORED_DOWNLOADERS:
-            if downloader_class.can_handle(content):
-                return (
-                    downloader_class if not init else downloader_class(*args, **kwargs)
-                )
+    downloader_class = DISPATCHER.dispatch(content, requires=requires, probe=probe)
+    if downloader_class is None:
+        raise exceptions.DownloadError(f"no existing downloader can handle {content!r}")
+    return downloader_class if not init else downloader_class(*args, **kwargs)
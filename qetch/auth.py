@@ -1,14 +1,21 @@
 # Copyright (c) 2018 Stephen Bunn <stephen@bunn.io>
 # MIT License <https://opensource.org/licenses/MIT>
 
+import os
 import enum
+import time
 import inspect
-from typing import Any, Union, Generator
-from collections import Iterable, MutableMapping
+import threading
+import contextlib
+from typing import Any, Tuple, Union, Callable, Optional, Awaitable, Generator
+from collections.abc import Iterable, MutableMapping
 
 import attr
 
-from .extractors._common import BaseExtractor
+try:
+    import fcntl
+except ImportError:  # pragma: no cover
+    fcntl = None
 
 
 class AuthTypes(enum.Enum):
@@ -64,3 +71,305 @@ class AuthRegistry(MutableMapping):
 
     def to_dict(self) -> dict:
         return attr.asdict(self)
+
+
+@attr.s
+class Token(object):
+    """A cached access token.
+
+    Attributes:
+        value (str): The access token.
+        expires (float, optional): The timestamp the token expires at, None if
+            the token does not expire.
+    """
+
+    value = attr.ib(type=str, repr=False)
+    expires = attr.ib(type=float, default=None)
+
+    def expires_within(self, seconds: float) -> bool:
+        """Determines if the token expires within the given seconds.
+
+        Args:
+            seconds (float): The seconds from now.
+
+        Returns:
+            bool: True if the token expires within the seconds, otherwise False.
+        """
+
+        return self.expires is not None and time.time() + seconds >= self.expires
+
+
+class TokenCache(object):
+    """The process-wide cache of access tokens.
+
+    Implements the borg pattern for shared state between instances.
+
+    Note:
+        Tokens are refreshed in the background once they are within
+        ``refresh_margin`` seconds of expiring, and concurrent refreshes of a
+        token result in a single request.
+        If a ``path`` is set, tokens are also stored in (and loaded from) that
+        JSON file so they are shared between processes.
+        The file is re-read whenever it changes and merged into the tokens
+        before each write, so tokens stored by other processes are kept.
+
+    Attributes:
+        path (str): The path of the file tokens are stored in, tokens are only
+            kept in memory if None.
+        refresh_margin (float): The seconds before a token expires it is
+            refreshed at.
+
+    Examples:
+        Basic usage where ``request_token`` returns a tuple of an access token
+        and the seconds it expires in...
+
+        >>> from qetch.auth import (TokenCache,)
+        >>> TokenCache().get("gfycat:CLIENT_ID", request_token)
+        'ACCESS_TOKEN'
+    """
+
+    __shared_state = {}
+
+    def __init__(self):
+        self.__dict__ = self.__shared_state
+        if "_tokens" not in self.__dict__:
+            self.path = None
+            self.refresh_margin = 60.0
+            self._tokens = {}
+            self._loaded_path = None
+            self._loaded_stamp = None
+            self._lock = threading.RLock()
+            self._key_locks = {}
+            self._refreshing = set()
+            self._tasks = {}
+
+    def _get_stamp(self) -> Optional[Tuple[int, int, int]]:
+        try:
+            stat = os.stat(os.path.expanduser(self.path))
+        except OSError:
+            return None
+        # NOTE: the file is replaced on writes so its inode changes as well
+        return (stat.st_ino, stat.st_mtime_ns, stat.st_size)
+
+    def _load(self):
+        if self.path is None:
+            return
+        stamp = self._get_stamp()
+        if self.path == self._loaded_path and stamp == self._loaded_stamp:
+            return
+        # NOTE: imported here as the auth module is loaded when importing qetch
+        import ujson
+
+        try:
+            with open(os.path.expanduser(self.path), "r") as file_handle:
+                entries = ujson.load(file_handle)
+        except FileNotFoundError:
+            entries = {}
+        except (OSError, ValueError):
+            return
+        tokens = {key: Token(**entry) for (key, entry) in entries.items()}
+        if self.path != self._loaded_path:
+            # tokens kept before the path was set are merged, preferring the
+            # token which expires last
+            for (key, token) in self._tokens.items():
+                stored = tokens.get(key)
+                if stored is None or (
+                    stored.expires is not None
+                    and (token.expires is None or token.expires > stored.expires)
+                ):
+                    tokens[key] = token
+        # NOTE: every change is written as it is made, so once a path is loaded
+        # the file holds the latest tokens (including removals by other
+        # processes)
+        self._tokens = tokens
+        (self._loaded_path, self._loaded_stamp) = (self.path, stamp)
+
+    @contextlib.contextmanager
+    def _lock_file(self) -> Generator[None, None, None]:
+        if self.path is None or fcntl is None:
+            yield
+            return
+        path = os.path.expanduser(self.path)
+        os.makedirs(os.path.dirname(path) or ".", exist_ok=True)
+        # held while the file is re-read, changed and written so writes from
+        # other processes are never lost
+        with open(f"{path}.lock", "a") as file_handle:
+            fcntl.flock(file_handle, fcntl.LOCK_EX)
+            try:
+                yield
+            finally:
+                fcntl.flock(file_handle, fcntl.LOCK_UN)
+
+    def _save(self):
+        if self.path is None:
+            return
+        import ujson
+
+        path = os.path.expanduser(self.path)
+        os.makedirs(os.path.dirname(path) or ".", exist_ok=True)
+        # written to a private temporary file first so readers never see a
+        # partial file and other users never see the tokens
+        temp_path = f"{path}.{os.getpid()}.{threading.get_ident()}"
+        file_descriptor = os.open(
+            temp_path, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o600
+        )
+        with os.fdopen(file_descriptor, "w") as file_handle:
+            ujson.dump(
+                {key: attr.asdict(token) for (key, token) in self._tokens.items()},
+                file_handle,
+            )
+        os.replace(temp_path, path)
+        (self._loaded_path, self._loaded_stamp) = (self.path, self._get_stamp())
+
+    def _get_key_lock(self, key: str) -> threading.Lock:
+        with self._lock:
+            return self._key_locks.setdefault(key, threading.Lock())
+
+    def get_token(self, key: str) -> Optional[Token]:
+        """Gets the unexpired token of a key.
+
+        Args:
+            key (str): The key of the token (such as ``{extractor}:{client_id}``).
+
+        Returns:
+            Token: The token, or None if no unexpired token exists.
+        """
+
+        with self._lock:
+            self._load()
+            token = self._tokens.get(key)
+        return token if token is not None and not token.expires_within(0) else None
+
+    def set_token(self, key: str, value: str, expires_in: float = None) -> Token:
+        """Stores the token of a key.
+
+        Args:
+            key (str): The key of the token.
+            value (str): The access token.
+            expires_in (float, optional): The seconds the token expires in.
+
+        Returns:
+            Token: The stored token.
+        """
+
+        token = Token(
+            value=value,
+            expires=(time.time() + float(expires_in) if expires_in else None),
+        )
+        with self._lock, self._lock_file():
+            self._load()
+            self._tokens[key] = token
+            self._save()
+        return token
+
+    def invalidate(self, key: str):
+        """Removes the token of a key (such as when it is rejected).
+
+        Args:
+            key (str): The key of the token.
+        """
+
+        with self._lock, self._lock_file():
+            self._load()
+            if self._tokens.pop(key, None) is not None:
+                self._save()
+
+    def clear(self):
+        """Removes all tokens.
+        """
+
+        with self._lock, self._lock_file():
+            self._tokens.clear()
+            self._save()
+
+    def _refresh(self, key: str, request: Callable[[], Tuple[str, float]]) -> str:
+        (value, expires_in) = request()
+        return self.set_token(key, value, expires_in=expires_in).value
+
+    def _refresh_in_background(
+        self, key: str, request: Callable[[], Tuple[str, float]]
+    ):
+        with self._lock:
+            if key in self._refreshing:
+                return
+            self._refreshing.add(key)
+
+        def refresh():
+            try:
+                with self._get_key_lock(key):
+                    token = self.get_token(key)
+                    if token is None or token.expires_within(self.refresh_margin):
+                        self._refresh(key, request)
+            except Exception:
+                # the current token is still used until it expires
+                pass
+            finally:
+                with self._lock:
+                    self._refreshing.discard(key)
+
+        threading.Thread(target=refresh, daemon=True).start()
+
+    def get(self, key: str, request: Callable[[], Tuple[str, float]]) -> str:
+        """Gets the access token of a key, requesting a new one if necessary.
+
+        Args:
+            key (str): The key of the token (such as ``{extractor}:{client_id}``).
+            request (callable): Requests a new token, returning a tuple of the
+                access token and the seconds it expires in (or None).
+
+        Returns:
+            str: The access token.
+        """
+
+        token = self.get_token(key)
+        if token is not None:
+            if token.expires_within(self.refresh_margin):
+                self._refresh_in_background(key, request)
+            return token.value
+
+        with self._get_key_lock(key):
+            # another thread may have refreshed the token while waiting
+            token = self.get_token(key)
+            if token is not None:
+                return token.value
+            return self._refresh(key, request)
+
+    async def aget(
+        self, key: str, request: Callable[[], Awaitable[Tuple[str, float]]]
+    ) -> str:
+        """Asynchronously gets the access token of a key.
+
+        Note:
+            Refreshes of a key are coalesced per event loop, see
+            :func:`TokenCache.get`.
+
+        Args:
+            key (str): The key of the token (such as ``{extractor}:{client_id}``).
+            request (callable): Requests a new token asynchronously, returning
+                a tuple of the access token and the seconds it expires in.
+
+        Returns:
+            str: The access token.
+        """
+
+        import asyncio
+
+        token = self.get_token(key)
+        if token is not None and not token.expires_within(self.refresh_margin):
+            return token.value
+
+        async def refresh() -> str:
+            (value, expires_in) = await request()
+            return self.set_token(key, value, expires_in=expires_in).value
+
+        loop = asyncio.get_running_loop()
+        task = self._tasks.get(key)
+        if task is None or task.done() or task.get_loop() is not loop:
+            task = loop.create_task(refresh())
+            # failed background refreshes are retried by the next call
+            task.add_done_callback(lambda task: task.cancelled() or task.exception())
+            self._tasks[key] = task
+
+        if token is not None:
+            return token.value
+        return await asyncio.shield(task)
@@ -0,0 +1,377 @@
+# Copyright (c) 2018 Stephen Bunn (stephen@bunn.io)
+# MIT License <https://opensource.org/licenses/MIT>
+
+import os
+import abc
+import time
+import hashlib
+import sqlite3
+import threading
+from typing import Dict, Tuple, Mapping, Optional
+from email.utils import parsedate_to_datetime
+
+import attr
+import ujson
+
+
+def parse_cache_control(value: str) -> Dict[str, Optional[str]]:
+    """Parses the directives of a ``Cache-Control`` header.
+
+    Args:
+        value (str): The value of the header.
+
+    Returns:
+        dict[str, str]: A dictionary of lowercased directives to their values
+            (None for directives without a value).
+
+    Examples:
+        >>> parse_cache_control('public, max-age=60, no-cache="Set-Cookie"')
+        {'public': None, 'max-age': '60', 'no-cache': 'Set-Cookie'}
+    """
+
+    directives = {}
+    for directive in value.split(","):
+        (name, _, argument) = directive.strip().partition("=")
+        if name:
+            directives[name.lower()] = argument.strip('"') if argument else None
+    return directives
+
+
+def get_expires(
+    headers: Mapping[str, str], now: float, default_ttl: float = 0.0
+) -> Optional[float]:
+    """Gets the timestamp a response stops being fresh at.
+
+    Note:
+        ``Cache-Control`` takes precedence over ``Expires``.
+        Responses without either are fresh for ``default_ttl`` seconds, after
+        which they are revalidated with a conditional request.
+
+    Args:
+        headers (Mapping[str, str]): The headers of the response.
+        now (float): The timestamp the response was received at.
+        default_ttl (float, optional): The seconds a response without any
+            freshness information is fresh for.
+
+    Returns:
+        float: The timestamp the response stops being fresh at, or None if the
+            response must not be stored.
+    """
+
+    directives = parse_cache_control(headers.get("Cache-Control", ""))
+    if "no-store" in directives:
+        return None
+    if "no-cache" in directives:
+        return now
+    if "max-age" in directives:
+        try:
+            return now + max(0, int(directives["max-age"]))
+        except (TypeError, ValueError):
+            return now
+
+    expires = headers.get("Expires")
+    if expires is not None:
+        try:
+            return parsedate_to_datetime(expires).timestamp()
+        except (TypeError, ValueError):
+            return now
+    return now + default_ttl
+
+
+@attr.s
+class CacheEntry(object):
+    """A cached response.
+
+    Attributes:
+        status (int): The status of the response.
+        text (str): The text of the response.
+        etag (str, optional): The ``ETag`` of the response.
+        last_modified (str, optional): The ``Last-Modified`` of the response.
+        expires (float, optional): The timestamp the entry stops being fresh at.
+    """
+
+    status = attr.ib(type=int)
+    text = attr.ib(type=str, repr=False)
+    etag = attr.ib(type=str, default=None)
+    last_modified = attr.ib(type=str, default=None)
+    expires = attr.ib(type=float, default=0.0)
+
+    @property
+    def is_fresh(self) -> bool:
+        """Indicates if the entry can be served without contacting the server.
+
+        Returns:
+            bool: True if the entry is fresh, otherwise False.
+        """
+
+        return time.time() < self.expires
+
+    @property
+    def conditional_headers(self) -> Dict[str, str]:
+        """The headers to revalidate the entry with.
+
+        Returns:
+            dict[str, str]: The ``If-None-Match`` and ``If-Modified-Since``
+                headers for the entry (negative entries are never revalidated).
+        """
+
+        headers = {}
+        if self.status == 200:
+            if self.etag is not None:
+                headers["If-None-Match"] = self.etag
+            if self.last_modified is not None:
+                headers["If-Modified-Since"] = self.last_modified
+        return headers
+
+    @property
+    def response(self) -> Tuple[int, str]:
+        """The cached response.
+
+        Returns:
+            tuple[int, str]: A tuple of the response status and text.
+        """
+
+        return (self.status, self.text)
+
+
+@attr.s
+class BaseCache(abc.ABC):
+    """The base response cache.
+    `All response caches should extend this.`
+
+    Note:
+        Caches are shared between threads (for example by
+        :func:`~qetch.extract_many`), so storages must be thread safe.
+
+    Attributes:
+        default_ttl (float): The seconds a response without any freshness
+            information is served without revalidating.
+        negative_ttl (float): The seconds a ``404`` response is served without
+            contacting the server again.
+    """
+
+    default_ttl = attr.ib(type=float, default=0.0)
+    negative_ttl = attr.ib(type=float, default=60.0)
+
+    @abc.abstractmethod
+    def get(self, url: str) -> Optional[CacheEntry]:
+        """Gets the cached entry for a url.
+
+        Args:
+            url (str): The url of the entry.
+
+        Returns:
+            CacheEntry: The cached entry, or None if no entry exists.
+        """
+
+        raise NotImplementedError()
+
+    @abc.abstractmethod
+    def set(self, url: str, entry: CacheEntry):
+        """Stores the entry of a url.
+
+        Args:
+            url (str): The url of the entry.
+            entry (CacheEntry): The entry to store.
+        """
+
+        raise NotImplementedError()
+
+    @abc.abstractmethod
+    def delete(self, url: str):
+        """Removes the entry of a url if it exists.
+
+        Args:
+            url (str): The url of the entry.
+        """
+
+        raise NotImplementedError()
+
+    @abc.abstractmethod
+    def clear(self):
+        """Removes all entries.
+        """
+
+        raise NotImplementedError()
+
+    def update(
+        self,
+        url: str,
+        entry: Optional[CacheEntry],
+        status: int,
+        headers: Mapping[str, str],
+        text: str,
+    ) -> Tuple[int, str]:
+        """Updates the cache with the response of a (possibly conditional) request.
+
+        Args:
+            url (str): The requested url.
+            entry (CacheEntry, optional): The entry the request revalidated.
+            status (int): The status of the response.
+            headers (Mapping[str, str]): The headers of the response.
+            text (str): The text of the response.
+
+        Returns:
+            tuple[int, str]: A tuple of the status and text to use, the cached
+                ones if the server responded ``304 Not Modified``.
+        """
+
+        now = time.time()
+        if status == 304 and entry is not None:
+            expires = get_expires(headers, now, default_ttl=self.default_ttl)
+            entry = attr.evolve(
+                entry,
+                etag=headers.get("ETag", entry.etag),
+                last_modified=headers.get("Last-Modified", entry.last_modified),
+                expires=(now if expires is None else expires),
+            )
+            self.set(url, entry)
+            return entry.response
+
+        if status == 200:
+            expires = get_expires(headers, now, default_ttl=self.default_ttl)
+            if expires is None:
+                self.delete(url)
+            else:
+                self.set(
+                    url,
+                    CacheEntry(
+                        status=status,
+                        text=text,
+                        etag=headers.get("ETag"),
+                        last_modified=headers.get("Last-Modified"),
+                        expires=expires,
+                    ),
+                )
+        elif status == 404 and self.negative_ttl > 0:
+            self.set(
+                url,
+                CacheEntry(status=status, text=text, expires=(now + self.negative_ttl)),
+            )
+        return (status, text)
+
+
+@attr.s
+class MemoryCache(BaseCache):
+    """A response cache kept in memory for the lifetime of the process.
+    """
+
+    _entries = attr.ib(type=dict, default=attr.Factory(dict), init=False, repr=False)
+    _lock = attr.ib(default=attr.Factory(threading.Lock), init=False, repr=False)
+
+    def get(self, url: str) -> Optional[CacheEntry]:
+        return self._entries.get(url)
+
+    def set(self, url: str, entry: CacheEntry):
+        with self._lock:
+            self._entries[url] = entry
+
+    def delete(self, url: str):
+        with self._lock:
+            self._entries.pop(url, None)
+
+    def clear(self):
+        with self._lock:
+            self._entries.clear()
+
+
+@attr.s
+class SQLiteCache(BaseCache):
+    """A response cache stored in a single SQLite database.
+
+    Attributes:
+        path (str): The path of the database file.
+    """
+
+    path = attr.ib(type=str, kw_only=True)
+
+    _connection = attr.ib(default=None, init=False, repr=False)
+    _lock = attr.ib(default=attr.Factory(threading.Lock), init=False, repr=False)
+
+    def __attrs_post_init__(self):
+        self._connection = sqlite3.connect(
+            os.path.expanduser(self.path), check_same_thread=False
+        )
+        with self._lock, self._connection:
+            self._connection.execute(
+                "CREATE TABLE IF NOT EXISTS entries ("
+                "url TEXT PRIMARY KEY, status INTEGER, text TEXT, etag TEXT, "
+                "last_modified TEXT, expires REAL)"
+            )
+
+    def get(self, url: str) -> Optional[CacheEntry]:
+        with self._lock:
+            row = self._connection.execute(
+                "SELECT status, text, etag, last_modified, expires FROM entries "
+                "WHERE url = ?",
+                (url,),
+            ).fetchone()
+        return CacheEntry(*row) if row is not None else None
+
+    def set(self, url: str, entry: CacheEntry):
+        with self._lock, self._connection:
+            self._connection.execute(
+                "INSERT OR REPLACE INTO entries VALUES (?, ?, ?, ?, ?, ?)",
+                (url,) + attr.astuple(entry),
+            )
+
+    def delete(self, url: str):
+        with self._lock, self._connection:
+            self._connection.execute("DELETE FROM entries WHERE url = ?", (url,))
+
+    def clear(self):
+        with self._lock, self._connection:
+            self._connection.execute("DELETE FROM entries")
+
+    def close(self):
+        """Closes the database connection.
+        """
+
+        with self._lock:
+            self._connection.close()
+
+
+@attr.s
+class DirectoryCache(BaseCache):
+    """A response cache stored as one JSON file per url in a directory.
+
+    Attributes:
+        path (str): The path of the directory.
+    """
+
+    path = attr.ib(type=str, kw_only=True)
+
+    def __attrs_post_init__(self):
+        self.path = os.path.expanduser(self.path)
+        os.makedirs(self.path, exist_ok=True)
+
+    def _get_filepath(self, url: str) -> str:
+        return os.path.join(
+            self.path, f"{hashlib.sha1(url.encode('utf-8')).hexdigest()}.json"
+        )
+
+    def get(self, url: str) -> Optional[CacheEntry]:
+        try:
+            with open(self._get_filepath(url), "r") as file_handle:
+                return CacheEntry(**ujson.load(file_handle))
+        except (OSError, ValueError, TypeError):
+            return None
+
+    def set(self, url: str, entry: CacheEntry):
+        filepath = self._get_filepath(url)
+        # written to a temporary file first so readers never see a partial entry
+        temp_filepath = f"{filepath}.{os.getpid()}.{threading.get_ident()}"
+        with open(temp_filepath, "w") as file_handle:
+            ujson.dump(attr.asdict(entry), file_handle)
+        os.replace(temp_filepath, filepath)
+
+    def delete(self, url: str):
+        try:
+            os.remove(self._get_filepath(url))
+        except FileNotFoundError:
+            pass
+
+    def clear(self):
+        for filename in os.listdir(self.path):
+            if filename.endswith(".json"):
+                os.remove(os.path.join(self.path, filename))
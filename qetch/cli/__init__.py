@@ -6,19 +6,24 @@ from typing import Tuple
 from pathlib import Path
 
 from .. import __version__, exceptions, get_extractor, get_downloader
-from ..auth import AuthRegistry
+from ..auth import TokenCache, AuthRegistry
 from . import utils
 
 import click
-import click_completion
 from yaspin.yaspin import Yaspin
 from plumbum import colors
 
 
 CONFIG_DIR = Path.home() / f".{__version__.__name__}"
 AUTH_PATH = CONFIG_DIR / "auth.json"
+TOKENS_PATH = CONFIG_DIR / "tokens.json"
+COMPLETE_VAR = f"_{__version__.__name__.upper()}_COMPLETE"
 
-click_completion.init()
+# NOTE: completion is only setup when the shell is actually requesting completions
+if COMPLETE_VAR in os.environ:
+    import click_completion
+
+    click_completion.init()
 
 
 @click.group(
@@ -38,7 +43,10 @@ def cli(
     verbose: bool = False,
     completion: bool = False,
 ):
+    utils.load_colors()
     if completion:
+        import click_completion
+
         print(click_completion.get_code(shell="fish", prog_name=__version__.__name__))
     ctx.obj = ctx.params
 
@@ -106,6 +114,20 @@ def cli_auth_remove(spinner: Yaspin, registry: AuthRegistry, extractor: str):
     default=1,
     help="Threaded downloader connections.",
 )
+@click.option(
+    "--http2",
+    "http2",
+    is_flag=True,
+    default=False,
+    help="Multiplex requests over HTTP/2 (requires httpx[http2]).",
+)
+@click.option(
+    "--resume",
+    "resume",
+    is_flag=True,
+    default=False,
+    help="Keep partial downloads to resume them when run again.",
+)
 @utils.use_auth_registry(AUTH_PATH)
 @utils.use_spinner(
     text="downloading...", side="right", color="cyan", attrs=["bold"], report=False
@@ -118,9 +140,12 @@ def cli_download(
     url: str,
     out_dir: str,
     connections: int,
+    http2: bool = False,
+    resume: bool = False,
     help_flag: bool = False,
 ):
     out_dir = Path(out_dir)
+    TokenCache().path = TOKENS_PATH.as_posix()
     spinner.text = f"getting extractor..."
     try:
         extractor = get_extractor(url)
@@ -128,11 +153,11 @@ def cli_download(
     except exceptions.ExtractionError:
         raise ValueError(f"no extractor for {colors.debug | url}")
 
-    extractor = extractor()
+    extractor = extractor(transport="httpx" if http2 else "requests")
     spinner.text = "extracting..."
     spinner.start()
     try:
-        content_list = list(extractor.extract(url))
+        content_list = list(extractor.extract(url, max_variants=1))
         spinner.ok(colors.success | f"{len(content_list)} content")
     except exceptions.AuthenticationError as exc:
         raise ValueError(
@@ -147,18 +172,20 @@ def cli_download(
     for content_variants in content_list:
         content = content_variants[0]
         if not downloader:
-            downloader = get_downloader(content)
-            spinner.ok(colors.success | downloader.__name__)
-            downloader = downloader()
+            downloader = get_downloader(content, init=True)
+            spinner.ok(colors.success | type(downloader).__name__)
+            if http2 and downloader.transport is not None:
+                downloader.transport = "httpx"
 
         write_to = out_dir / f"{content.uid}.{content.extension}"
         spinner.text = f"downloading {colors.info | content.uid}..."
         spinner.start()
-        downloader.download(content, write_to, max_connections=connections)
+        downloader.download(
+            content, write_to, max_connections=connections, resume=resume
+        )
         spinner.ok(colors.success | write_to.as_posix())
 
 
-utils.load_colors()
 cli_auth.add_command(cli_auth_list)
 cli_auth.add_command(cli_auth_add)
 cli_auth.add_command(cli_auth_remove)
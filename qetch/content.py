@@ -2,26 +2,52 @@
 # MIT License <https://opensource.org/licenses/MIT>
 
 import datetime
-from typing import Any, Dict, List
+from typing import (
+    Any,
+    Dict,
+    List,
+    Tuple,
+    Union,
+    TypeVar,
+    Callable,
+    Iterator,
+    FrozenSet,
+    Iterable,
+    Optional,
+    NamedTuple,
+)
 
 import attr
 from furl import furl
 
+from .utils import LazyText
 from .extractors._common import BaseExtractor
 
+T = TypeVar("T")
+# the fields stored once by a content group for all of its variants
+SHARED_FIELDS = ("title", "description", "uploaded_by", "uploaded_date", "metadata")
 
-@attr.s
+
+@attr.s(slots=True)
 class Content(object):
     """The resulting content instance yielded by extractors.
 
+    Note:
+        Content is slotted to keep the many variants yielded by extractors
+        compact. The source url is stored as a string and only parsed into a
+        :class:`furl.furl` the first time :attr:`~Content.source` is accessed.
+
     Attributes:
         uid (str): The unique id for the discovered content.
-        source (str): The source url given to the extractor.
+        source (str): The source url given to the extractor, accessed as a
+            :class:`furl.furl`.
         fragments (list[str]): A list of urls which represent the raw content.
         extractor (BaseExtractor): The extractor which discovered the content.
         extension (str): The extension for the resulting file.
         title (str, optional): A title for the content.
-        description (str, optional): A description for the content.
+        description (str, optional): A description for the content, may be
+            given as a :class:`~qetch.utils.LazyText` which is rendered on
+            first access.
         quality (float, optional): A level of quality for the content in
             relation to other content with the same source.
         uploaded_by (str, optional): A string of the uploader's name.
@@ -31,24 +57,455 @@ class Content(object):
             the discovered content.
     """
     uid = attr.ib(type=str)
-    source = attr.ib(type=str, converter=furl, repr=False)
+    _source = attr.ib(type=str, converter=str, repr=False)
     fragments = attr.ib(type=List[str], repr=False)
     extractor = attr.ib(type=BaseExtractor, repr=False)
     extension = attr.ib(type=str, default=None, repr=False)
     title = attr.ib(type=str, default=None, repr=False)
-    description = attr.ib(type=str, default=None, repr=False)
+    _description = attr.ib(type=str, default=None, repr=False)
     quality = attr.ib(type=float, default=0.0)
     uploaded_by = attr.ib(type=str, default=None, repr=False)
     uploaded_date = attr.ib(type=datetime.datetime, default=None, repr=False)
     metadata = attr.ib(type=dict, default={}, repr=False)
 
-    def get_size(self):
+    _source_furl = attr.ib(type=furl, default=None, init=False, repr=False, eq=False)
+
+    @property
+    def source(self) -> furl:
+        """The parsed source url given to the extractor.
+
+        Returns:
+            furl: The source url.
+        """
+
+        if self._source_furl is None:
+            self._source_furl = furl(self._source)
+        return self._source_furl
+
+    @source.setter
+    def source(self, source: str):
+        self._source = str(source)
+        self._source_furl = None
+
+    @property
+    def description(self) -> str:
+        """The description of the content.
+
+        Returns:
+            str: The description of the content, or None if it has none.
+        """
+
+        if isinstance(self._description, LazyText):
+            return str(self._description)
+        return self._description
+
+    @description.setter
+    def description(self, description: str):
+        self._description = description
+
+    def get_size(self, transport=None):
         """ Returns the sum of the length of the fragments.
 
+        Args:
+            transport (BaseTransport, optional): The transport to request the
+                headers of the fragments through, defaults to the extractor's
+                session.
+
         Returns:
             int: The sum of the length of the fragments.
         """
+        transport = transport if transport is not None else self.extractor.session
         return sum(
-            int(self.extractor.session.head(fragment).headers["Content-Length"])
+            int(transport.head(fragment).headers["Content-Length"])
             for fragment in self.fragments
         )
+
+
+class Variant(NamedTuple):
+    """The fields of a content which differ between the variants of a group.
+
+    Attributes:
+        uid (str): The unique id for the variant.
+        fragments (list[str]): A list of urls which represent the raw content.
+        extension (str): The extension for the resulting file.
+        quality (float): The level of quality of the variant.
+    """
+
+    uid: str
+    fragments: List[str]
+    extension: Optional[str] = None
+    quality: float = 0.0
+
+
+def sort_variants(variants: Iterable[Variant]) -> Tuple[Variant, ...]:
+    """Sorts variants from the best to the worst quality.
+
+    Args:
+        variants (iterable[Variant]): The variants to sort.
+
+    Returns:
+        tuple[Variant]: The sorted variants, equal qualities keep their order.
+    """
+
+    return tuple(
+        sorted(
+            (
+                (variant if isinstance(variant, Variant) else Variant(*variant))
+                for variant in variants
+            ),
+            key=lambda variant: variant.quality,
+            reverse=True,
+        )
+    )
+
+
+def _read_only(name: str) -> Callable[..., None]:
+    def method(self, *args, **kwargs):
+        raise TypeError(
+            f"{type(self).__name__!r} is read-only, use filter() to select variants "
+            f"(or list() it for a mutable copy), {name!r} is not supported"
+        )
+
+    method.__name__ = name
+    return method
+
+
+@attr.s(slots=True, eq=False, repr=False)
+class ContentGroup(list):
+    """The quality variants of a single discovered content.
+
+    Note:
+        The fields shared by all variants are stored once, each variant only
+        stores its :class:`Variant` fields.
+        The group is the (read-only) list of content extractors used to
+        yield, ordered from the best to the worst quality, but its items are
+        the variants themselves until they are accessed, so a
+        :class:`Content` is only built for a variant the first time it is
+        accessed (and then replaces the variant).
+        Methods mutating the list raise a :class:`TypeError`.
+
+    Attributes:
+        source (str): The source url given to the extractor.
+        extractor (BaseExtractor): The extractor which discovered the content.
+        variants (tuple[Variant]): The variants of the content.
+        title (str, optional): A title for the content.
+        description (str, optional): A description for the content.
+        uploaded_by (str, optional): A string of the uploader's name.
+        uploaded_date (datetime.datetime, optional): A datetime instance for
+            when the content was uploaded.
+        metadata (dict[str,....], optional): Any additional metadata about
+            the discovered content.
+
+    Examples:
+        Basic usage...
+
+        >>> content_group = next(GfycatExtractor().extract(GFYCAT_URL))
+        >>> print(content_group.best())
+        <Content (1.0) "gfycat-GFYCAT_ID-mp4Url">
+        >>> print(list(content_group.filter(extensions=["webm"])))
+        [<Content (0.5) "gfycat-GFYCAT_ID-webmUrl">]
+    """
+
+    source = attr.ib(type=str, converter=str, repr=False)
+    extractor = attr.ib(type=BaseExtractor, repr=False)
+    _variants = attr.ib(type=Tuple[Variant, ...], converter=sort_variants)
+    title = attr.ib(type=str, default=None, repr=False)
+    _description = attr.ib(type=Union[str, LazyText], default=None, repr=False)
+    uploaded_by = attr.ib(type=str, default=None, repr=False)
+    uploaded_date = attr.ib(type=datetime.datetime, default=None, repr=False)
+    metadata = attr.ib(type=dict, default={}, repr=False)
+
+    def __attrs_post_init__(self):
+        # NOTE: the variants are only held by the list, which is their one copy
+        # (initializing preallocates exactly the items, extending overallocates)
+        list.__init__(self, self._variants)
+        self._variants = ()
+
+    def __repr__(self) -> str:
+        return f"<{type(self).__name__} ({len(self)}) {self.source!r}>"
+
+    @property
+    def variants(self) -> Tuple[Variant, ...]:
+        """The variants of the content, from the best to the worst quality.
+
+        Returns:
+            tuple[Variant]: The variants of the content.
+        """
+
+        return tuple(
+            Variant(item.uid, item.fragments, item.extension, item.quality)
+            if isinstance(item, Content)
+            else item
+            for item in list.__iter__(self)
+        )
+
+    def _get_content(self, index: int) -> Content:
+        content = list.__getitem__(self, index)
+        if not isinstance(content, Content):
+            variant = content
+            content = Content(
+                uid=variant.uid,
+                source=self.source,
+                fragments=variant.fragments,
+                extractor=self.extractor,
+                extension=variant.extension,
+                title=self.title,
+                description=self._description,
+                quality=variant.quality,
+                uploaded_by=self.uploaded_by,
+                uploaded_date=self.uploaded_date,
+                metadata=self.metadata,
+            )
+            list.__setitem__(self, index, content)
+        return content
+
+    def __getitem__(self, index: Union[int, slice]) -> Union[Content, List[Content]]:
+        if isinstance(index, slice):
+            (start, stop, step) = index.indices(len(self))
+            return [self._get_content(item) for item in range(start, stop, step)]
+        return self._get_content(index)
+
+    def __iter__(self) -> Iterator[Content]:
+        for index in range(len(self)):
+            yield self._get_content(index)
+
+    def __reversed__(self) -> Iterator[Content]:
+        for index in reversed(range(len(self))):
+            yield self._get_content(index)
+
+    def __contains__(self, content: Any) -> bool:
+        return any(item == content for item in self)
+
+    def __eq__(self, other: Any) -> bool:
+        if not isinstance(other, list):
+            return NotImplemented
+        return list(self) == list(other)
+
+    def __ne__(self, other: Any) -> bool:
+        equal = self.__eq__(other)
+        return equal if equal is NotImplemented else not equal
+
+    def __add__(self, other: List[Any]) -> List[Any]:
+        return list(self) + list(other)
+
+    def __radd__(self, other: List[Any]) -> List[Any]:
+        return list(other) + list(self)
+
+    def __mul__(self, count: int) -> List[Content]:
+        return list(self) * count
+
+    __rmul__ = __mul__
+
+    def __reduce__(self) -> Tuple[type, tuple]:
+        return (
+            type(self),
+            (
+                self.source,
+                self.extractor,
+                self.variants,
+                self.title,
+                self._description,
+                self.uploaded_by,
+                self.uploaded_date,
+                self.metadata,
+            ),
+        )
+
+    def copy(self) -> List[Content]:
+        return list(self)
+
+    def index(self, content: Any, *args) -> int:
+        return list(self).index(content, *args)
+
+    def count(self, content: Any) -> int:
+        return list(self).count(content)
+
+    # NOTE: mutating the list would get the content out of quality order
+    __setitem__ = _read_only("__setitem__")
+    __delitem__ = _read_only("__delitem__")
+    __iadd__ = _read_only("__iadd__")
+    __imul__ = _read_only("__imul__")
+    append = _read_only("append")
+    extend = _read_only("extend")
+    insert = _read_only("insert")
+    remove = _read_only("remove")
+    pop = _read_only("pop")
+    clear = _read_only("clear")
+    sort = _read_only("sort")
+    reverse = _read_only("reverse")
+
+    @property
+    def description(self) -> str:
+        """The description shared by the variants.
+
+        Returns:
+            str: The description of the content, or None if it has none.
+        """
+
+        if isinstance(self._description, LazyText):
+            return str(self._description)
+        return self._description
+
+    @description.setter
+    def description(self, description: str):
+        self._description = description
+
+    def update(self, **fields: Any):
+        """Updates the fields shared by all variants (for example when enriched).
+
+        Note:
+            Content which was already built for the variants is updated too.
+
+        Args:
+            fields (....): The new values of ``title``, ``description``,
+                ``uploaded_by``, ``uploaded_date`` or ``metadata``.
+
+        Raises:
+            ValueError: If a field is not shared by the variants.
+        """
+
+        for (name, value) in fields.items():
+            if name not in SHARED_FIELDS:
+                raise ValueError(
+                    f"field {name!r} is not shared by the variants of {self!r}"
+                )
+            setattr(self, name, value)
+            for content in list.__iter__(self):
+                if isinstance(content, Content):
+                    setattr(content, name, value)
+
+    def best(self) -> Optional[Content]:
+        """Gets the variant with the best quality.
+
+        Returns:
+            Content: The best quality content, or None if the group is empty.
+        """
+
+        return self[0] if len(self) > 0 else None
+
+    def worst(self) -> Optional[Content]:
+        """Gets the variant with the worst quality.
+
+        Returns:
+            Content: The worst quality content, or None if the group is empty.
+        """
+
+        return self[-1] if len(self) > 0 else None
+
+    def filter(self, extensions: Iterable[str] = None) -> "ContentGroup":
+        """Gets a group of only the variants matching the given criteria.
+
+        Args:
+            extensions (list[str], optional): The extensions (case insensitive)
+                the variants must have.
+
+        Returns:
+            ContentGroup: A new group sharing the fields of this group.
+        """
+
+        variants = self.variants
+        if extensions is not None:
+            extensions = {extension.lower() for extension in extensions}
+            variants = [
+                variant
+                for variant in variants
+                if (variant.extension or "").lower() in extensions
+            ]
+        return attr.evolve(self, variants=variants)
+
+
+def _to_extensions(extensions: Iterable[str]) -> FrozenSet[str]:
+    return frozenset(extension.lower().lstrip(".") for extension in extensions)
+
+
+@attr.s(frozen=True, slots=True)
+class VariantSelector(object):
+    """Selects which variants extractors should build.
+
+    Note:
+        Extractors check candidate variants against the selector before
+        building them, so discarded variants are never built.
+        Only quality is known before any request is made, so ``"smallest"``
+        prefers the lowest quality variants.
+
+    Attributes:
+        prefer (str): Either ``"best"`` or ``"smallest"``, which variants are
+            kept when more than ``max_variants`` are available.
+        min_quality (float, optional): The minimum quality of the variants.
+        extensions (frozenset[str], optional): The allowed extensions
+            (case insensitive, without a leading dot).
+        max_variants (int, optional): The maximum number of variants per item.
+
+    Examples:
+        >>> selector = VariantSelector(extensions=["mp4", "webm"], max_variants=1)
+        >>> qualities = {"mp4": 1.0, "webm": 0.5, "gif": 0.1}
+        >>> selector.select(["webm", "mp4", "gif"], qualities.get, extension=str)
+        ['mp4']
+    """
+
+    prefer = attr.ib(
+        type=str, default="best", validator=attr.validators.in_(("best", "smallest"))
+    )
+    min_quality = attr.ib(type=float, default=None)
+    extensions = attr.ib(
+        type=FrozenSet[str],
+        default=None,
+        converter=attr.converters.optional(_to_extensions),
+    )
+    max_variants = attr.ib(type=int, default=None)
+
+    @max_variants.validator
+    def _check_max_variants(self, attribute: attr.Attribute, value: int):
+        if value is not None and value <= 0:
+            raise ValueError(
+                f"{attribute.name!r} must be at least 1, received {value!r}"
+            )
+
+    def accepts(self, quality: float, extension: str) -> bool:
+        """Determines if a variant of the given quality and extension is allowed.
+
+        Args:
+            quality (float): The quality of the variant.
+            extension (str): The extension of the variant.
+
+        Returns:
+            bool: True if the variant is allowed, otherwise False.
+        """
+
+        if self.min_quality is not None and quality < self.min_quality:
+            return False
+        if self.extensions is not None:
+            return (extension or "").lower() in self.extensions
+        return True
+
+    def select(
+        self,
+        candidates: Iterable[T],
+        quality: Callable[[T], float],
+        extension: Callable[[T], str],
+    ) -> List[T]:
+        """Selects the candidates variants should be built for.
+
+        Args:
+            candidates (iterable[T]): The candidates of the variants, such as
+                the API keys of an item's urls.
+            quality (callable): Gets the quality of a candidate.
+            extension (callable): Gets the extension of a candidate.
+
+        Returns:
+            list[T]: The selected candidates.
+        """
+
+        selected = [
+            candidate
+            for candidate in candidates
+            if self.accepts(quality(candidate), extension(candidate))
+        ]
+        if self.max_variants is not None and len(selected) > self.max_variants:
+            selected.sort(key=quality, reverse=(self.prefer == "best"))
+            del selected[self.max_variants:]
+        return selected
+
+
+# selects every variant, used when extractors are given no selection
+DEFAULT_SELECTOR = VariantSelector()
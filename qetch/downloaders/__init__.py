@@ -1,4 +1,26 @@
 # Copyright (c) 2018 Stephen Bunn (stephen@bunn.io)
 # MIT License <https://opensource.org/licenses/MIT>
 
-from .http import HTTPDownloader
+from .. import plugins
+
+# NOTE: downloader modules are only imported once one of their schemes is dispatched
+PLUGINS = (
+    plugins.Plugin(
+        name="http",
+        target="qetch.downloaders.http:HTTPDownloader",
+        schemes=("http", "https"),
+    ),
+)
+
+__all__ = [plugin.attribute for plugin in PLUGINS]
+
+
+def __getattr__(name: str):
+    for plugin in PLUGINS:
+        if plugin.attribute == name:
+            return plugin.load()
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+
+def __dir__():
+    return sorted(set(globals()) | set(__all__))
@@ -3,20 +3,26 @@
 
 import os
 import abc
+import errno
+import json
 import enum
 import time
 import uuid
+import threading
 import shutil
 import itertools
-from typing import Any, List, Tuple, Callable
+import contextlib
+from typing import Any, List, Tuple, Mapping, Callable, Iterable, Optional
+from urllib.parse import urlsplit
 from tempfile import TemporaryDirectory
-from concurrent.futures import ThreadPoolExecutor
+from concurrent.futures import FIRST_EXCEPTION, Future, ThreadPoolExecutor, wait
 
 import attr
 import blinker
 
 from .. import __version__
 from ..content import Content
+from ..exceptions import DownloadError
 
 
 class DownloadState(enum.Enum):
@@ -35,16 +41,661 @@ class DownloadState(enum.Enum):
     FINISHED = "finished"
 
 
+class DownloadCapabilities(enum.Enum):
+    """An enum of capabilities a downloader may declare.
+
+    Values:
+        - ``RANGES``: indicates the downloader can fetch byte ranges of a
+            fragment over multiple connections
+        - ``FRAGMENTS``: indicates the downloader can download multiple
+            fragments in parallel
+        - ``RESUME``: indicates the downloader can resume partial fragments
+            of a failed download
+    """
+
+    RANGES = "ranges"
+    FRAGMENTS = "fragments"
+    RESUME = "resume"
+
+
+@attr.s(slots=True)
+class ProgressCounter(object):
+    """The count of downloaded bytes of a single connection.
+
+    Note:
+        Each counter is only written by the thread of its connection, so counts
+        are never lost without locking on every segment.
+
+    Attributes:
+        tracker (ProgressTracker): The tracker the counter belongs to.
+        value (int): The number of downloaded bytes.
+    """
+
+    tracker = attr.ib(type="ProgressTracker", repr=False)
+    value = attr.ib(type=int, default=0)
+
+    def add(self, size: int):
+        """Adds downloaded bytes to the counter.
+
+        Args:
+            size (int): The number of downloaded bytes.
+        """
+
+        self.value += size
+        self.tracker.notify()
+
+
+@attr.s
+class ProgressTracker(object):
+    """The progress of a single download.
+
+    Note:
+        Progress is counted by a :class:`ProgressCounter` per connection and
+        events are emitted from the threads of the connections as bytes are
+        counted, coalesced to at most one event every ``update_delay`` seconds.
+        The final progress is always emitted by
+        :meth:`~ProgressTracker.finish`.
+
+    Attributes:
+        download_id (str): The unique id of the download.
+        total (int): The total size of the download, if known.
+        update_delay (float): The minimum seconds between emitted events.
+        hooks (list[callable]): The hooks of the download, called with the
+            arguments ``(download_id, current=current, total=total)``.
+        signal (blinker.Signal): A signal also sent every event, with the
+            download id as its sender.
+        clock (callable): The clock the delay between events is measured with.
+    """
+
+    download_id = attr.ib(type=str)
+    total = attr.ib(type=int, default=None)
+    update_delay = attr.ib(type=float, default=0.1, repr=False)
+    hooks = attr.ib(type=List[Callable], factory=list, repr=False)
+    signal = attr.ib(type=blinker.Signal, default=None, repr=False)
+    clock = attr.ib(type=Callable[[], float], default=time.monotonic, repr=False)
+
+    _counters = attr.ib(type=list, factory=list, init=False, repr=False)
+    _lock = attr.ib(factory=threading.Lock, init=False, repr=False)
+    _emit_lock = attr.ib(factory=threading.Lock, init=False, repr=False)
+    _last_emit = attr.ib(type=float, default=None, init=False, repr=False)
+
+    @property
+    def current(self) -> int:
+        """The number of downloaded bytes of all connections.
+
+        Returns:
+            int: The number of downloaded bytes.
+        """
+
+        return sum(counter.value for counter in self._counters)
+
+    def counter(self) -> ProgressCounter:
+        """Creates the counter of a new connection.
+
+        Returns:
+            ProgressCounter: The counter of the connection.
+        """
+
+        counter = ProgressCounter(self)
+        with self._lock:
+            self._counters = self._counters + [counter]
+        return counter
+
+    def _emit(self):
+        (current, total) = (self.current, self.total)
+        for hook in self.hooks:
+            hook(self.download_id, current=current, total=total)
+        if self.signal is not None:
+            self.signal.send(self.download_id, current=current, total=total)
+
+    def notify(self):
+        """Emits an event unless one was emitted within the update delay.
+        """
+
+        if not (self.hooks or (self.signal is not None and self.signal.receivers)):
+            return
+        now = self.clock()
+        if self._last_emit is not None and now - self._last_emit < self.update_delay:
+            return
+        # NOTE: threads never wait on another thread's event, it covers their bytes
+        if self._emit_lock.acquire(blocking=False):
+            try:
+                self._last_emit = now
+                self._emit()
+            finally:
+                self._emit_lock.release()
+
+    def finish(self):
+        """Emits the final event of the download.
+        """
+
+        with self._emit_lock:
+            self._last_emit = self.clock()
+            self._emit()
+
+
+@attr.s
+class ChunkJournal(object):
+    """The journal of the byte ranges already written to a partial fragment.
+
+    Note:
+        The journal is stored as JSON next to the partial file and replaced
+        atomically on every update, ranges are only recorded once their bytes
+        are flushed to disk.
+        Ranges are only resumed if the fragment still has the same url, size
+        and validator (a strong ``ETag``, or else its ``Last-Modified`` date)
+        which is sent as the ``If-Range`` of range requests.
+
+    Attributes:
+        path (str): The path of the journal.
+        url (str): The url of the fragment.
+        size (int): The size of the fragment.
+        validator (str): The validator of the fragment.
+        ranges (list[tuple[int, int]]): The sorted and merged ``(start, end)``
+            byte ranges already written (end exclusive).
+    """
+
+    path = attr.ib(type=str)
+    url = attr.ib(type=str)
+    size = attr.ib(type=int)
+    validator = attr.ib(type=str)
+    ranges = attr.ib(type=List[Tuple[int, int]], factory=list, repr=False)
+
+    _lock = attr.ib(factory=threading.Lock, init=False, repr=False)
+
+    @staticmethod
+    def get_validator(headers: Mapping[str, str]) -> Optional[str]:
+        """Gets the validator ranges of a response can be resumed with.
+
+        Args:
+            headers (Mapping[str, str]): The headers of the response.
+
+        Returns:
+            str: The strong ``ETag`` or ``Last-Modified`` header, or None if
+                the response has neither.
+        """
+
+        etag = headers.get("ETag")
+        if etag and not etag.startswith("W/"):
+            return etag
+        return headers.get("Last-Modified")
+
+    @classmethod
+    def load(cls, path: str) -> Optional["ChunkJournal"]:
+        """Loads a journal.
+
+        Args:
+            path (str): The path of the journal.
+
+        Returns:
+            ChunkJournal: The journal, or None if it does not exist or is
+                unreadable.
+        """
+
+        try:
+            with open(path, "r") as file_:
+                data = json.load(file_)
+            return cls(
+                path,
+                data["url"],
+                data["size"],
+                data["validator"],
+                ranges=[tuple(range_) for range_ in data["ranges"]],
+            )
+        except (OSError, ValueError, KeyError, TypeError):
+            return None
+
+    @property
+    def completed(self) -> int:
+        """The number of bytes already written.
+
+        Returns:
+            int: The number of bytes.
+        """
+
+        return sum(end - start for (start, end) in self.ranges)
+
+    def matches(self, url: str, size: int, validator: str) -> bool:
+        """Determines if the journal's ranges can be resumed.
+
+        Args:
+            url (str): The url of the fragment.
+            size (int): The current size of the fragment.
+            validator (str): The current validator of the fragment.
+
+        Returns:
+            bool: True if the fragment is unchanged, otherwise False.
+        """
+
+        return validator is not None and (url, size, validator) == (
+            self.url,
+            self.size,
+            self.validator,
+        )
+
+    def pending(self, ranges: List[Tuple[int, int]]) -> List[Tuple[int, int]]:
+        """Removes the already written bytes from some byte ranges.
+
+        Args:
+            ranges (list[tuple[int, int]]): The ``(start, end)`` byte ranges.
+
+        Returns:
+            list[tuple[int, int]]: The parts of the byte ranges not yet written.
+        """
+
+        pending = []
+        for (start, end) in ranges:
+            for (written_start, written_end) in self.ranges:
+                if written_end <= start or written_start >= end:
+                    continue
+                if written_start > start:
+                    pending.append((start, written_start))
+                start = max(start, written_end)
+            if start < end:
+                pending.append((start, end))
+        return pending
+
+    def add(self, start: int, end: int):
+        """Records a written byte range and saves the journal.
+
+        Args:
+            start (int): The first written byte.
+            end (int): The end of the written bytes (exclusive).
+        """
+
+        with self._lock:
+            ranges = []
+            for (range_start, range_end) in sorted(self.ranges + [(start, end)]):
+                if ranges and range_start <= ranges[-1][1]:
+                    ranges[-1] = (ranges[-1][0], max(ranges[-1][1], range_end))
+                else:
+                    ranges.append((range_start, range_end))
+            self.ranges = ranges
+            self.save()
+
+    def save(self):
+        """Atomically writes the journal to its path.
+        """
+
+        temporary_path = f"{self.path}.tmp"
+        with open(temporary_path, "w") as file_:
+            json.dump(
+                {
+                    "url": self.url,
+                    "size": self.size,
+                    "validator": self.validator,
+                    "ranges": self.ranges,
+                },
+                file_,
+            )
+        os.replace(temporary_path, self.path)
+
+    def discard(self):
+        """Removes the journal, so none of its ranges are resumed.
+        """
+
+        with self._lock:
+            self.ranges = []
+            if os.path.isfile(self.path):
+                os.remove(self.path)
+
+
+@attr.s
+class Segment(object):
+    """A byte range of a fragment assigned to a single connection.
+
+    Note:
+        The end of a segment shrinks whenever a connection without work takes
+        over the second half of its remaining bytes.
+
+    Attributes:
+        scheduler (RangeScheduler): The scheduler the segment belongs to.
+        start (int): The first byte of the segment.
+        end (int): The end of the segment (exclusive).
+        position (int): The end of the bytes already accepted.
+    """
+
+    scheduler = attr.ib(type="RangeScheduler", repr=False)
+    start = attr.ib(type=int)
+    end = attr.ib(type=int)
+    position = attr.ib(type=int)
+
+    @position.default
+    def _position_default(self) -> int:
+        return self.start
+
+    @property
+    def remaining(self) -> int:
+        """The number of bytes of the segment not yet accepted.
+
+        Returns:
+            int: The number of bytes.
+        """
+
+        return self.end - self.position
+
+    def advance(self, size: int) -> int:
+        """Accepts received bytes of the segment.
+
+        Args:
+            size (int): The number of received bytes.
+
+        Returns:
+            int: The number of received bytes which are still part of the
+                segment, fewer than ``size`` once it was split.
+        """
+
+        with self.scheduler.lock:
+            accepted = max(0, min(size, self.end - self.position))
+            self.position += accepted
+            return accepted
+
+
+@attr.s
+class RangeScheduler(object):
+    """Hands out the byte ranges of a fragment to its connections.
+
+    Note:
+        Connections take the given ranges first. Once none are left, a
+        connection running out of work splits the segment with the most
+        remaining bytes and takes over its second half, so a slow connection
+        never holds up the others for long.
+        Segments are only split if both halves get at least ``min_segment``
+        bytes.
+
+    Attributes:
+        ranges (list[tuple[int, int]]): The ``(start, end)`` byte ranges not
+            yet assigned (end exclusive).
+        min_segment (int): The minimum number of bytes of a split segment.
+    """
+
+    ranges = attr.ib(type=List[Tuple[int, int]], converter=list)
+    min_segment = attr.ib(type=int, default=2 ** 20)
+
+    lock = attr.ib(factory=threading.Lock, init=False, repr=False)
+    _segments = attr.ib(type=list, factory=list, init=False, repr=False)
+
+    def next(self) -> Optional[Segment]:
+        """Assigns the next segment to a connection.
+
+        Returns:
+            Segment: The segment, or None if there is no work left to take.
+        """
+
+        with self.lock:
+            if self.ranges:
+                (start, end) = self.ranges.pop(0)
+                segment = Segment(self, start, end)
+            else:
+                victim = max(
+                    self._segments, key=lambda active: active.remaining, default=None
+                )
+                if victim is None or victim.remaining < 2 * self.min_segment:
+                    return None
+                middle = victim.position + victim.remaining // 2
+                (segment, victim.end) = (Segment(self, middle, victim.end), middle)
+            self._segments.append(segment)
+            return segment
+
+    def release(self, segment: Segment):
+        """Releases a segment its connection stopped working on.
+
+        Args:
+            segment (Segment): The segment to release.
+        """
+
+        with self.lock:
+            self._segments.remove(segment)
+
+
+@attr.s
+class PartialFile(object):
+    """A fragment file shared by the connections writing to it.
+
+    Note:
+        The file is opened once and written at absolute offsets through
+        ``os.pwrite``, so connections never share (or race on) a file position.
+
+    Attributes:
+        path (str): The path of the file.
+        fd (int): The file descriptor of the open file.
+    """
+
+    path = attr.ib(type=str)
+    fd = attr.ib(type=int, default=None, init=False, repr=False)
+
+    def __enter__(self) -> "PartialFile":
+        self.open()
+        return self
+
+    def __exit__(self, *args):
+        self.close()
+
+    def open(self):
+        """Opens the file without truncating it.
+        """
+
+        if self.fd is None:
+            self.fd = os.open(self.path, os.O_RDWR | os.O_CREAT, 0o644)
+
+    def preallocate(self, size: int):
+        """Truncates the file and allocates its blocks on disk.
+
+        Note:
+            Blocks are allocated through ``posix_fallocate`` where the platform
+            and filesystem support it, otherwise the file is only extended.
+
+        Args:
+            size (int): The size of the file.
+
+        Raises:
+            DownloadError: If there is not enough free disk space.
+        """
+
+        os.ftruncate(self.fd, 0)
+        free = shutil.disk_usage(os.path.dirname(os.path.abspath(self.path))).free
+        if free < size:
+            raise DownloadError(
+                f"{size} bytes required to write {self.path!r}, only {free} bytes "
+                "of disk space are free"
+            )
+
+        if size > 0 and hasattr(os, "posix_fallocate"):
+            try:
+                os.posix_fallocate(self.fd, 0, size)
+                return
+            except OSError as exc:
+                if exc.errno not in (errno.EINVAL, errno.EOPNOTSUPP):
+                    raise
+        os.ftruncate(self.fd, size)
+
+    def write(self, data: bytes, offset: int):
+        """Writes bytes at an absolute offset of the file.
+
+        Args:
+            data (bytes): The bytes to write.
+            offset (int): The offset to write the bytes at.
+        """
+
+        view = memoryview(data)
+        while view:
+            written = os.pwrite(self.fd, view, offset)
+            (view, offset) = (view[written:], offset + written)
+
+    def sync(self):
+        """Flushes the written bytes of the file to disk.
+        """
+
+        os.fsync(self.fd)
+
+    def close(self):
+        """Closes the file.
+        """
+
+        if self.fd is not None:
+            os.close(self.fd)
+            self.fd = None
+
+
+@attr.s
+class ChunkWriter(object):
+    """Buffers the bytes of a chunk and writes them to a file in aligned blocks.
+
+    Note:
+        Bytes are written once the buffer crosses a multiple of ``block_size``,
+        up to that offset, so every write except a chunk's first and last
+        covers whole blocks.
+        Written bytes are recorded in the ``journal`` every
+        ``journal_interval`` bytes (once synced to disk) and when the writer
+        is closed.
+
+    Attributes:
+        file (PartialFile): The file to write to.
+        position (int): The offset of the next byte of the chunk.
+        block_size (int): The size of the blocks to write.
+        journal (ChunkJournal): The journal of the file, if resumable.
+        journal_interval (int): The minimum bytes between journal updates.
+    """
+
+    file = attr.ib(type=PartialFile)
+    position = attr.ib(type=int)
+    block_size = attr.ib(type=int, default=2 ** 20)
+    journal = attr.ib(type=ChunkJournal, default=None, repr=False)
+    journal_interval = attr.ib(type=int, default=2 ** 23, repr=False)
+
+    _buffer = attr.ib(type=bytearray, factory=bytearray, init=False, repr=False)
+    _offset = attr.ib(type=int, init=False, repr=False)
+    _recorded = attr.ib(type=int, init=False, repr=False)
+
+    @_offset.default
+    def _offset_default(self) -> int:
+        return self.position
+
+    @_recorded.default
+    def _recorded_default(self) -> int:
+        return self.position
+
+    def _record(self):
+        # NOTE: bytes are only journaled once they are durably written
+        self.file.sync()
+        self.journal.add(self._recorded, self._offset)
+        self._recorded = self._offset
+
+    def _flush(self, end: int):
+        size = end - self._offset
+        with memoryview(self._buffer) as view:
+            self.file.write(view[:size], self._offset)
+        del self._buffer[:size]
+        self._offset = end
+        if (
+            self.journal is not None
+            and self._offset - self._recorded >= self.journal_interval
+        ):
+            self._record()
+
+    def write(self, data: bytes):
+        """Buffers bytes of the chunk.
+
+        Args:
+            data (bytes): The next bytes of the chunk.
+        """
+
+        self._buffer += data
+        self.position += len(data)
+        boundary = self.position - self.position % self.block_size
+        if len(self._buffer) >= self.block_size and boundary > self._offset:
+            self._flush(boundary)
+
+    def close(self):
+        """Writes all buffered bytes and records them in the journal.
+        """
+
+        if self._buffer:
+            self._flush(self.position)
+        if self.journal is not None and self._offset > self._recorded:
+            self._record()
+
+
 @attr.s
 class BaseDownloader(abc.ABC):
     """The base abstract base downloader.
     `All downloaders must extend from this class.`
     """
 
+    schemes = ()
+    capabilities = frozenset()
+    # sent the progress events of every download (with the download id as the
+    # sender), use ``progress_hook`` to only receive a single download's events
     on_progress = blinker.Signal()
+    # the transport (or name of the transport) requests are made through, shared
+    # by all instances unless an instance is given a transport of its own
+    transport = None
 
     download_state = attr.ib(type=dict, default={}, init=False, repr=False)
-    progress_store = attr.ib(type=dict, default={}, init=False, repr=False)
+    _trackers = attr.ib(type=dict, factory=dict, init=False, repr=False)
+
+    @classmethod
+    def can_dispatch(cls, content: Content, requires: Iterable = None) -> bool:
+        """Determines if a downloader can handle a content without any requests.
+
+        Args:
+            content (Content): The content to check.
+            requires (list[DownloadCapabilities], optional): The capabilities
+                the downloader must declare.
+
+        Returns:
+            bool: True if every fragment's scheme is in
+                :attr:`~BaseDownloader.schemes` and every required capability
+                is in :attr:`~BaseDownloader.capabilities`, otherwise False.
+        """
+
+        if requires and not cls.capabilities.issuperset(requires):
+            return False
+        return len(content.fragments) > 0 and all(
+            urlsplit(fragment).scheme.lower() in cls.schemes
+            for fragment in content.fragments
+        )
+
+    @classmethod
+    def get_transport(cls):
+        """Gets the transport shared by all instances of the downloader.
+
+        Note:
+            Transports given by name are only created on first use.
+
+        Returns:
+            BaseTransport: The shared transport, or None if the downloader has
+                no transport.
+        """
+
+        if isinstance(cls.transport, str):
+            from ..transports import get_transport
+
+            cls.transport = get_transport(cls.transport)
+        return cls.transport
+
+    @property
+    def session(self):
+        """The transport the downloader instance requests through.
+
+        Note:
+            This is the transport shared by all instances (see
+            :meth:`~BaseDownloader.get_transport`), unless the instance's
+            ``transport`` is set (such as ``downloader.transport = "httpx"``).
+
+        Returns:
+            BaseTransport: The instance's transport, or None if the downloader
+                has no transport.
+        """
+
+        transport = vars(self).get("transport")
+        if transport is None:
+            return self.get_transport()
+        if isinstance(transport, str):
+            from ..transports import get_transport
+
+            self.transport = transport = get_transport(transport)
+        return transport
 
     @abc.abstractclassmethod
     def can_handle(cls, content: Content):
@@ -70,7 +721,7 @@ class BaseDownloader(abc.ABC):
         """
 
         (start, end) = itertools.tee(
-            list(range(0, content_length, (content_length // max_connections)))
+            list(range(0, content_length, max(1, content_length // max_connections)))
             + [content_length]
         )
         next(end, None)
@@ -80,45 +731,95 @@ class BaseDownloader(abc.ABC):
             del ranges[-1]
         return ranges
 
-    def handle_progress(
-        self, download_id: str, content_length: int, update_delay: float = 0.1
-    ):
-        """The progress reporting handler.
+    def get_tracker(self, download_id: str) -> ProgressTracker:
+        """Gets the progress tracker of a download.
+
+        Args:
+            download_id (str): The unique id of the download request.
+
+        Returns:
+            ProgressTracker: The tracker of the download, or a detached tracker
+                if the download is not running through
+                :meth:`~BaseDownloader.download`.
+        """
+
+        tracker = self._trackers.get(download_id)
+        return tracker if tracker is not None else ProgressTracker(download_id)
+
+    @contextlib.contextmanager
+    def stage(self, download_id: str, to_path: str, resume: bool = False):
+        """Creates the directory the fragments of a download are staged in.
+
+        Note:
+            Resumable downloads are staged in the ``{to_path}.part`` directory,
+            which is only removed once the download succeeds.
+            Downloaders which support resuming (see
+            :attr:`~DownloadCapabilities.RESUME`) keep a
+            :class:`ChunkJournal` next to each partial fragment.
+
+        Args:
+            download_id (str): The unique id of the download request.
+            to_path (str): The path the download is saved to.
+            resume (bool, optional): If True, the download is resumable.
+
+        Yields:
+            str: The path of the staging directory.
+        """
+
+        if not resume:
+            with TemporaryDirectory(
+                prefix=f"{__version__.__name__}[{download_id}]-"
+            ) as temporary_dir:
+                yield temporary_dir
+            return
+
+        partial_dir = f"{os.fspath(to_path)}.part"
+        os.makedirs(partial_dir, exist_ok=True)
+        yield partial_dir
+        # NOTE: only reached if the download succeeds, failures keep their bytes
+        shutil.rmtree(partial_dir, ignore_errors=True)
+
+    def gather(self, download_id: str, futures: List[Future]) -> List[Any]:
+        """Waits for the futures of a download to complete.
+
+        Note:
+            Returns as soon as the last future completes.
+            The first failing future (or an interrupt while waiting) stops the
+            download from the failing future's thread, futures which have not
+            started yet are cancelled and running futures are expected to
+            return once they see the download's :attr:`~DownloadState.STOPPED`
+            state.
 
         Args:
             download_id (str): The unique id of the download request.
-            content_length (int): The total size of the downloading content.
-            update_delay (float, optional): The frequency (in seconds) which \
-                progress updates are emitted.
+            futures (list[Future]): The futures of the download.
+
+        Raises:
+            Exception: The exception of the first failing future.
+
+        Returns:
+            list[Any]: The results of the futures in the given order.
         """
 
+        def stop(future: Future = None):
+            if future is None or (
+                not future.cancelled() and future.exception() is not None
+            ):
+                self.download_state[download_id] = DownloadState.STOPPED
+                for sibling in futures:
+                    sibling.cancel()
+
+        for future in futures:
+            future.add_done_callback(stop)
         try:
-            # setup sync values if they don't exists (race-condition fix)
-            if download_id not in self.download_state:
-                self.download_state[download_id] = DownloadState.PREPARING
-            if download_id not in self.progress_store:
-                self.progress_store[download_id] = 0
-
-            while True:
-                if self.progress_store[download_id] < content_length:
-                    self.on_progress.send(
-                        download_id,
-                        current=self.progress_store[download_id],
-                        total=content_length,
-                    )
-                elif self.progress_store[
-                    download_id
-                ] >= content_length or self.download_state[
-                    download_id
-                ] == DownloadState.STOPPED:
-                    break
-
-                time.sleep(update_delay)
-        finally:
-            del self.progress_store[download_id]
-            self.on_progress.send(
-                download_id, current=content_length, total=content_length
-            )
+            (done, _) = wait(futures, return_when=FIRST_EXCEPTION)
+        except BaseException:
+            stop()
+            raise
+        for future in futures:
+            if future in done and not future.cancelled() and future.exception():
+                raise future.exception()
+        return [future.result() for future in futures]
 
     def download(
         self,
@@ -128,6 +829,7 @@ class BaseDownloader(abc.ABC):
         max_connections: int = 8,
         progress_hook: Callable[[Any], None] = None,
         update_delay: float = 0.1,
+        resume: bool = False,
     ) -> str:
         """The simplified download method.
 
@@ -151,9 +853,13 @@ class BaseDownloader(abc.ABC):
                 allow for downloading a single fragment.
             progress_hook (callable, optional): A progress hook that accepts
                 the arguments ``(download_id, current_size, total_size)`` for
-                progress updates.
-            update_delay (float, optional): The frequency (in seconds) where
-                progress updates are sent to the given ``progress_hook``.
+                progress updates, only subscribed for this download.
+            update_delay (float, optional): The minimum seconds between the
+                progress updates sent to the given ``progress_hook``.
+            resume (bool, optional): If True, fragments are staged in a
+                ``{to_path}.part`` directory kept when the download fails, and
+                a later download to the same path only fetches their missing
+                bytes, see :meth:`~BaseDownloader.stage`.
 
         Returns:
             str: The downloaded file's local path.
@@ -173,7 +879,7 @@ class BaseDownloader(abc.ABC):
             $HOME/Downloads/saved_content.mp4
 
             Similar basic usage, but with a given progress hook sent updates
-            every 0.1 seconds.
+            at most every 0.1 seconds.
 
             >>> def progress(download_id, current, total):
             ...     print(f'{((current / total) * 100.0):6.2f}')
@@ -182,8 +888,7 @@ class BaseDownloader(abc.ABC):
             ...     os.path.expanduser('~/Downloads/saved_content.mp4'),
             ...     progress_hook=progress,
             ...     update_delay=0.1)
-              0.00
-              0.00
+              4.87
              23.01
              54.32
              73.09
@@ -203,47 +908,43 @@ class BaseDownloader(abc.ABC):
 
         # generate unique download id for state & progress syncing
         download_id = str(uuid.uuid4())
-        with TemporaryDirectory(
-            prefix=f"{__version__.__name__}[{download_id}]-"
-        ) as temporary_dir:
-            # +1 worker is for progress handler
-            with ThreadPoolExecutor(max_workers=(max_fragments + 1)) as executor:
-                if callable(progress_hook):
-                    self.on_progress.connect(progress_hook)
-                    executor.submit(
-                        self.handle_progress,
-                        *(download_id, content.get_size()),
-                        **{"update_delay": update_delay},
-                    )
-
-                download_futures = []
-                for (fragment_idx, fragment) in enumerate(content.fragments):
-                    download_futures.append(
-                        executor.submit(
-                            self.handle_download,
-                            *(
-                                download_id,
-                                fragment,
-                                os.path.join(temporary_dir, str(fragment_idx)),
-                            ),
-                            **{"max_connections": max_connections},
+        tracker = ProgressTracker(
+            download_id,
+            update_delay=update_delay,
+            hooks=[progress_hook] if callable(progress_hook) else [],
+            signal=self.on_progress,
+        )
+        if tracker.hooks or self.on_progress.receivers:
+            tracker.total = content.get_size(self.session)
+
+        self._trackers[download_id] = tracker
+        self.download_state[download_id] = DownloadState.PREPARING
+        try:
+            with self.stage(download_id, to_path, resume=resume) as staging_dir:
+                with ThreadPoolExecutor(max_workers=max_fragments) as executor:
+                    download_futures = []
+                    for (fragment_idx, fragment) in enumerate(content.fragments):
+                        download_futures.append(
+                            executor.submit(
+                                self.handle_download,
+                                *(
+                                    download_id,
+                                    fragment,
+                                    os.path.join(staging_dir, str(fragment_idx)),
+                                ),
+                                max_connections=max_connections,
+                                resume=resume,
+                            )
                         )
-                    )
 
-                # FIXME: handle KeyboardInterrupt with parent thread correctly
-                try:
-                    while all(future.running() for future in download_futures):
-                        time.sleep(update_delay)
+                    results = self.gather(download_id, download_futures)
                     self.download_state[download_id] = DownloadState.FINISHED
-                except Exception as exc:
-                    self.download_state[download_id] = DownloadState.STOPPED
-                    raise exc
-
-                # apply content extractors merge and move result (one step)
-                shutil.move(
-                    content.extractor.merge(
-                        [future.result() for future in download_futures]
-                    ),
-                    to_path,
-                )
-                return to_path
+
+                    # apply content extractors merge and move result (one step)
+                    shutil.move(content.extractor.merge(results), to_path)
+                    return to_path
+        finally:
+            # NOTE: the download's hooks are dropped with its tracker
+            del self._trackers[download_id]
+            self.download_state.pop(download_id, None)
+            tracker.finish()
@@ -1,14 +1,26 @@
 # Copyright (c) 2018 Stephen Bunn (stephen@bunn.io)
 # MIT License <https://opensource.org/licenses/MIT>
 
+import os
+import threading
+import collections
+from typing import Union, Mapping, Optional
 from concurrent.futures import ThreadPoolExecutor
 
 import attr
-import blinker
-from requests_html import HTMLSession
 
-from ._common import DownloadState, BaseDownloader
+from ._common import (
+    Segment,
+    ChunkWriter,
+    PartialFile,
+    ChunkJournal,
+    RangeScheduler,
+    DownloadState,
+    BaseDownloader,
+    DownloadCapabilities,
+)
 from ..content import Content
+from ..exceptions import DownloadError
 
 
 @attr.s
@@ -16,11 +28,86 @@ class HTTPDownloader(BaseDownloader):
     """The downloader for HTTP served content.
     """
 
-    _session = HTMLSession()
+    schemes = ("http", "https")
+    capabilities = frozenset(
+        [
+            DownloadCapabilities.RANGES,
+            DownloadCapabilities.FRAGMENTS,
+            DownloadCapabilities.RESUME,
+        ]
+    )
+
+    # NOTE: bytes are streamed through the lean urllib3 transport by default
+    transport = "urllib3"
+    # the size of the aligned blocks connections write their bytes in
+    block_size = 2 ** 20
+    # the bytes written by a connection between updates of a resumable journal
+    journal_interval = 2 ** 23
+    # the minimum bytes of a segment split off for a connection without work
+    min_segment = 2 ** 20
+
+    # the maximum number of alive fragments remembered by probe
+    probe_cache_size = 4096
+    _probed = collections.OrderedDict()
+    _probed_lock = threading.Lock()
+
+    @classmethod
+    def probe(cls, fragment: str) -> bool:
+        """Determines if a fragment is alive by requesting its headers.
+
+        Note:
+            Only alive fragments are remembered (the most recently probed
+            :attr:`~HTTPDownloader.probe_cache_size` of them), so fragments
+            failing because of a transient error are requested again by the
+            next probe.
+            Use :meth:`~HTTPDownloader.clear_probes` to forget them.
+
+        Args:
+            fragment (str): The fragment url to probe.
+
+        Returns:
+            bool: True if the fragment responds with a 200 status, otherwise
+                False (also if the request fails without a response).
+        """
+
+        key = (cls, fragment)
+        with cls._probed_lock:
+            if key in cls._probed:
+                cls._probed.move_to_end(key)
+                return True
+
+        transport = cls.get_transport()
+        try:
+            alive = transport.head(fragment).status_code == 200
+        except transport.errors:
+            return False
+        if alive:
+            with cls._probed_lock:
+                cls._probed[key] = None
+                while len(cls._probed) > cls.probe_cache_size:
+                    cls._probed.popitem(last=False)
+        return alive
+
+    @classmethod
+    def clear_probes(cls):
+        """Forgets the fragments remembered alive by :meth:`~HTTPDownloader.probe`.
+
+        Note:
+            This forgets the fragments probed by subclasses as well.
+        """
+
+        with cls._probed_lock:
+            cls._probed.clear()
 
     @classmethod
     def can_handle(cls, content: Content) -> bool:
-        """Determines if a given content can be handled by this downloader.
+        """Determines if a given content is alive and can be handled by this \
+            downloader.
+
+        Note:
+            This requests the headers of every fragment not yet probed alive, use
+            :func:`~qetch.downloaders._common.BaseDownloader.can_dispatch` to
+            check without any requests.
 
         Args:
             content (Content): The content the check.
@@ -29,48 +116,204 @@ class HTTPDownloader(BaseDownloader):
             bool: True if the content can be handled, otherwise False.
         """
 
-        return all(
-            cls._session.head(fragment).status_code == 200
-            for fragment in content.fragments
+        return cls.can_dispatch(content) and all(
+            cls.probe(fragment) for fragment in content.fragments
+        )
+
+    def download(
+        self,
+        content: Content,
+        to_path: str,
+        max_fragments: int = 1,
+        max_connections: int = 8,
+        **kwargs,
+    ) -> str:
+        """Downloads a content through connection pools sized for the download.
+
+        Note:
+            The transport's pool of each host is grown to hold the
+            ``(max_fragments * max_connections)`` concurrent connections of the
+            download, see :meth:`~qetch.downloaders._common.BaseDownloader.download`.
+
+        Args:
+            content (Content): The content instance to download.
+            to_path (str): The path to save the resulting download to.
+            max_fragments (int, optional): The number of fragments to process
+                in parallel.
+            max_connections (int, optional): The number of connections to
+                allow for downloading a single fragment.
+
+        Returns:
+            str: The downloaded file's local path.
+        """
+
+        self.session.reserve(max_fragments * max_connections)
+        return super().download(
+            content,
+            to_path,
+            max_fragments=max_fragments,
+            max_connections=max_connections,
+            **kwargs,
         )
 
     def handle_chunk(
         self,
         download_id: str,
         url: str,
-        to_path: str,
+        to_path: Union[str, PartialFile],
         start: int,
         end: int,
-        chunk_size: int = 1024,
+        chunk_size: int = 2 ** 16,
+        journal: ChunkJournal = None,
+        segment: Segment = None,
     ):
         """Handles downloading a specific range of bytes for a url.
 
+        Note:
+            Bytes are buffered and written in blocks of
+            :attr:`~HTTPDownloader.block_size` bytes (see
+            :class:`~qetch.downloaders._common.ChunkWriter`), they are recorded
+            in the given ``journal`` every
+            :attr:`~HTTPDownloader.journal_interval` bytes and once the chunk
+            stops (even if it fails).
+            The chunk stops early once the given ``segment`` is split by
+            another connection of the download.
+
         Args:
             download_id (str): The unique id of the download request.
             url (str): The url to download.
-            to_path (str): The local path to save the download.
+            to_path (Union[str, PartialFile]): The local path to save the
+                download, or the already open file of the download.
             start (int): The starting byte position to download.
-            end (int): The ending byte position to download.
+            end (int): The ending byte position to download (exclusive).
             chunk_size (int, optional): The size of the chunks to stream in.
+            journal (ChunkJournal, optional): The journal of the download's
+                partial file.
+            segment (Segment, optional): The scheduled segment of the byte
+                range.
+
+        Raises:
+            DownloadError: If a resumed url changed since its journal was
+                written.
         """
 
-        with open(to_path, "wb") as file_:
-            file_.seek(start)
-            with self._session.get(
-                url, headers={"range": f"bytes={start}-{end}"}, stream=True
+        if not isinstance(to_path, PartialFile):
+            with PartialFile(to_path) as partial_file:
+                return self.handle_chunk(
+                    *(download_id, url, partial_file, start, end),
+                    chunk_size=chunk_size,
+                    journal=journal,
+                    segment=segment,
+                )
+
+        counter = self.get_tracker(download_id).counter()
+        headers = {"range": f"bytes={start}-{end - 1}"}
+        if journal is not None:
+            headers["if-range"] = journal.validator
+        writer = ChunkWriter(
+            to_path,
+            start,
+            block_size=self.block_size,
+            journal=journal,
+            journal_interval=self.journal_interval,
+        )
+        try:
+            with self.session.get(
+                url, headers=headers, stream=True
             ) as request_stream:
-                for segment in request_stream.iter_content(chunk_size=chunk_size):
+                if journal is not None and request_stream.status_code != 206:
+                    journal.discard()
+                    raise DownloadError(
+                        f"{url!r} changed since it was partially downloaded"
+                    )
+                for data in request_stream.iter_content(chunk_size=chunk_size):
                     if self.download_state[download_id] == DownloadState.STOPPED:
                         return
+                    # NOTE: bytes past a split segment belong to another connection
+                    size = len(data)
+                    if segment is not None:
+                        size = segment.advance(size)
+
+                    writer.write(data[:size])
+                    counter.add(size)
+                    if segment is not None and writer.position >= segment.end:
+                        break
+        finally:
+            writer.close()
+
+    def handle_segments(
+        self,
+        download_id: str,
+        url: str,
+        to_path: Union[str, PartialFile],
+        scheduler: RangeScheduler,
+        journal: ChunkJournal = None,
+    ):
+        """Handles downloading the segments of a url a connection is assigned.
 
-                    file_.write(segment)
+        Args:
+            download_id (str): The unique id of the download request.
+            url (str): The url to download.
+            to_path (Union[str, PartialFile]): The local path to save the
+                download, or the already open file of the download.
+            scheduler (RangeScheduler): The scheduler of the url's byte ranges.
+            journal (ChunkJournal, optional): The journal of the download's
+                partial file.
+        """
 
-                    if download_id not in self.progress_store:
-                        self.progress_store[download_id] = 0
-                    self.progress_store[download_id] += len(segment)
+        segment = scheduler.next()
+        while segment is not None:
+            try:
+                self.handle_chunk(
+                    *(download_id, url, to_path, segment.start, segment.end),
+                    journal=journal,
+                    segment=segment,
+                )
+            finally:
+                scheduler.release(segment)
+            if self.download_state[download_id] == DownloadState.STOPPED:
+                return
+            segment = scheduler.next()
+
+    def get_journal(
+        self, url: str, to_path: str, headers: Mapping[str, str], size: int
+    ) -> Optional[ChunkJournal]:
+        """Gets the journal of a resumable fragment.
+
+        Args:
+            url (str): The url of the fragment.
+            to_path (str): The local path of the partial fragment.
+            headers (Mapping[str, str]): The current headers of the fragment.
+            size (int): The current size of the fragment.
+
+        Returns:
+            ChunkJournal: The journal of the fragment (without any ranges if
+                the partial fragment can not be resumed), or None if the
+                fragment does not support resuming.
+        """
+
+        validator = ChunkJournal.get_validator(headers)
+        if validator is None or headers.get("Accept-Ranges", "").lower() != "bytes":
+            return None
+
+        journal_path = f"{to_path}.journal"
+        journal = ChunkJournal.load(journal_path)
+        if (
+            journal is not None
+            and journal.matches(url, size, validator)
+            and os.path.isfile(to_path)
+            and os.path.getsize(to_path) == size
+        ):
+            return journal
+        return ChunkJournal(journal_path, url, size, validator)
 
     def handle_download(
-        self, download_id: str, url: str, to_path: str, max_connections: int = 8
+        self,
+        download_id: str,
+        url: str,
+        to_path: str,
+        max_connections: int = 8,
+        resume: bool = False,
     ):
         """Handles downloading a specific url.
 
@@ -84,30 +327,47 @@ class HTTPDownloader(BaseDownloader):
             to_path (str): The local path to save the download.
             max_connections (int, optional): The number of allowed \
                 connections for parallel downloading of the url.
+            resume (bool, optional): If True, written bytes are journaled and \
+                only the bytes missing from a previous attempt are downloaded.
         """
 
-        self.download_state[download_id] = DownloadState.PREPARING
-        headers = self._session.head(url).headers
+        # NOTE: a download already stopped by a failing sibling stays stopped
+        self.download_state.setdefault(download_id, DownloadState.PREPARING)
+        headers = self.session.head(url).headers
         content_length = int(headers["Content-Length"])
+        journal = (
+            self.get_journal(url, to_path, headers, content_length) if resume else None
+        )
 
-        # preallocate file with content size
-        with open(to_path, "wb") as file_:
-            file_.seek(content_length - 1)
-            file_.write(b"\x00")
-
-        if headers.get("Accept-Ranges").lower() != "bytes":
+        if headers.get("Accept-Ranges", "").lower() != "bytes":
             max_connections = 1
 
-        chunk_futures = []
-        # start thread pool for chunks url with max connections
-        with ThreadPoolExecutor(max_workers=max_connections) as executor:
-            for (start, end) in self._calc_ranges(content_length, max_connections):
-                if self.download_state[download_id] != DownloadState.RUNNING:
-                    self.download_state[download_id] = DownloadState.RUNNING
-                chunk_futures.append(
+        ranges = self._calc_ranges(content_length, max_connections)
+        if journal is not None:
+            ranges = journal.pending(ranges)
+
+        scheduler = RangeScheduler(ranges, min_segment=self.min_segment)
+        if self.download_state[download_id] == DownloadState.PREPARING:
+            self.download_state[download_id] = DownloadState.RUNNING
+        # NOTE: connections share a single descriptor of the fragment's file
+        with PartialFile(to_path) as partial_file:
+            if journal is None or not journal.ranges:
+                # NOTE: a stale journal must never describe the zero-filled file
+                if journal is not None:
+                    journal.discard()
+                partial_file.preallocate(content_length)
+            else:
+                self.get_tracker(download_id).counter().add(journal.completed)
+
+            # start thread pool of connections taking segments off the scheduler
+            with ThreadPoolExecutor(max_workers=max_connections) as executor:
+                chunk_futures = [
                     executor.submit(
-                        self.handle_chunk, *(download_id, url, to_path, start, end)
+                        self.handle_segments,
+                        *(download_id, url, partial_file, scheduler),
+                        journal=journal,
                     )
-                )
-            [future.result() for future in chunk_futures]
-            return to_path
+                    for _ in range(max_connections)
+                ]
+                self.gather(download_id, chunk_futures)
+        return to_path
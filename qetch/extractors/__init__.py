@@ -1,7 +1,45 @@
 # Copyright (c) 2018 Stephen Bunn (stephen@bunn.io)
 # MIT License <https://opensource.org/licenses/MIT>
 
-from .imgur import ImgurExtractor
-from .gfycat import GfycatExtractor
-from .generic import GenericExtractor
-from .fourchan import FourChanExtractor
+from .. import plugins
+
+# NOTE: extractor modules are only imported once one of their domains is routed to
+PLUGINS = (
+    plugins.Plugin(
+        name="imgur",
+        target="qetch.extractors.imgur:ImgurExtractor",
+        domains=("imgur.com", "i.imgur.com"),
+        async_target="qetch.extractors.imgur:AsyncImgurExtractor",
+    ),
+    plugins.Plugin(
+        name="gfycat",
+        target="qetch.extractors.gfycat:GfycatExtractor",
+        domains=("gfycat.com",),
+        async_target="qetch.extractors.gfycat:AsyncGfycatExtractor",
+    ),
+    plugins.Plugin(
+        name="4chan",
+        target="qetch.extractors.fourchan:FourChanExtractor",
+        domains=("4chan.org", "i.4chan.org", "i.4cdn.org"),
+        async_target="qetch.extractors.fourchan:AsyncFourChanExtractor",
+    ),
+)
+FALLBACK_PLUGIN = plugins.Plugin(
+    name="generic",
+    target="qetch.extractors.generic:GenericExtractor",
+    domains=(),
+    async_target="qetch.extractors.generic:AsyncGenericExtractor",
+)
+
+__all__ = [plugin.attribute for plugin in PLUGINS + (FALLBACK_PLUGIN,)]
+
+
+def __getattr__(name: str):
+    for plugin in PLUGINS + (FALLBACK_PLUGIN,):
+        if plugin.attribute == name:
+            return plugin.load()
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+
+def __dir__():
+    return sorted(set(globals()) | set(__all__))
@@ -3,11 +3,26 @@
 
 import re
 import abc
-from typing import Any, List, Match, Tuple, Generator
+import codecs
+import weakref
+import threading
+import collections
+from typing import (
+    Any,
+    Dict,
+    List,
+    Match,
+    Tuple,
+    Callable,
+    Iterable,
+    Optional,
+    Iterator,
+    Generator,
+    AsyncIterator,
+    AsyncGenerator,
+)
 
 import attr
-from furl import furl
-from requests_html import HTMLSession
 
 from .. import auth, exceptions
 
@@ -16,8 +31,28 @@ from .. import auth, exceptions
 class BaseExtractor(abc.ABC):
     """The base extractor.
     `All extractors should extend this.`
+
+    Attributes:
+        cache (BaseCache, optional): The cache API responses are revalidated
+            against and stored in, see :mod:`qetch.cache`.
+        incremental (bool): If True, large API responses (such as albums and
+            threads) are parsed as they are streamed, yielding content before
+            the whole response is received.
+        transport (Union[str, BaseTransport]): The transport (or name of the
+            transport) the extractor's :attr:`~BaseExtractor.session` is, see
+            :mod:`qetch.transports`.
     """
 
+    cache = attr.ib(default=None, repr=False)
+    incremental = attr.ib(type=bool, default=False, repr=False)
+    transport = attr.ib(default="requests", repr=False)
+
+    # size of the chunks streamed responses are read in
+    stream_chunk_size = 2 ** 16
+    # handles which can build content from the url alone (when extracted with
+    # ``metadata=False``) through a ``handle_{handle_name}_offline`` method
+    offline_handles = ()
+
     @abc.abstractproperty
     def name(self):
         raise NotImplementedError()
@@ -42,14 +77,128 @@ class BaseExtractor(abc.ABC):
     def session(self):
         """The default session for the extractor.
 
+        Note:
+            Each extractor has its own session (and headers), but all sessions
+            share the connection pools of the
+            :class:`~qetch.sessions.SessionManager`.
+
         Returns:
-            HTMLSession: The default session for the extractor.
+            BaseTransport: The extractor's :attr:`~BaseExtractor.transport`.
         """
 
         if not hasattr(self, "_session"):
-            self._session = HTMLSession()
+            # NOTE: imported here so the transport is only loaded on first network use
+            from ..transports import get_transport
+
+            self._session = get_transport(self.transport)
         return self._session
 
+    @property
+    def max_connections(self) -> int:
+        """The most connections a single extraction makes to a host at once.
+
+        Returns:
+            int: The number of concurrent connections.
+        """
+
+        return 1
+
+    def fetch(
+        self,
+        url: str,
+        method: str = "GET",
+        cancel: threading.Event = None,
+        **kwargs,
+    ) -> Optional[Tuple[int, str]]:
+        """Requests a url through the extractor's session.
+
+        Note:
+            ``GET`` requests go through the extractor's
+            :attr:`~BaseExtractor.cache` if it has one, fresh entries are served
+            without a request and stale entries are revalidated with a
+            conditional request.
+
+        Args:
+            url (str): The url to request.
+            method (str, optional): The method of the request.
+            cancel (threading.Event, optional): If set by the time the response
+                headers are received, the response is closed without reading
+                its body (or updating the cache).
+
+        Returns:
+            tuple[int, str]: A tuple of the response status and text, None if
+                the request was cancelled.
+        """
+
+        entry = None
+        if self.cache is not None and method == "GET":
+            entry = self.cache.get(url)
+            if entry is not None and entry.is_fresh:
+                return entry.response
+            if entry is not None:
+                kwargs["headers"] = dict(kwargs.get("headers", {}))
+                kwargs["headers"].update(entry.conditional_headers)
+
+        if cancel is not None:
+            if cancel.is_set():
+                return None
+            kwargs["stream"] = True
+        response = self.session.request(method, url, **kwargs)
+        if cancel is not None and cancel.is_set():
+            # NOTE: closed before reading the body so the connection is released
+            response.close()
+            return None
+
+        (status, text) = (response.status_code, response.text)
+        if self.cache is None or method != "GET":
+            return (status, text)
+        return self.cache.update(url, entry, status, response.headers, text)
+
+    def fetch_stream(self, url: str, **kwargs) -> Tuple[int, Iterator[str]]:
+        """Requests a url through the extractor's session, streaming the response.
+
+        Note:
+            Fresh (or revalidated) entries of the extractor's
+            :attr:`~BaseExtractor.cache` are served as a single chunk, streamed
+            responses are never stored in the cache.
+
+        Args:
+            url (str): The url to request.
+
+        Returns:
+            tuple[int, iterator[str]]: A tuple of the response status and an
+                iterator of the decoded chunks of the response text.
+        """
+
+        headers = dict(kwargs.pop("headers", {}))
+        entry = self.cache.get(url) if self.cache is not None else None
+        if entry is not None:
+            if entry.is_fresh:
+                return (entry.status, iter([entry.text]))
+            headers.update(entry.conditional_headers)
+
+        response = self.session.request(
+            "GET", url, headers=headers, stream=True, **kwargs
+        )
+        if response.status_code != 200:
+            (status, text) = (response.status_code, response.text)
+            if self.cache is not None:
+                (status, text) = self.cache.update(
+                    url, entry, status, response.headers, text
+                )
+            return (status, iter([text]))
+
+        def iter_text() -> Generator[str, None, None]:
+            decoder = codecs.getincrementaldecoder(response.encoding or "utf-8")()
+            try:
+                for chunk in response.iter_content(self.stream_chunk_size):
+                    yield decoder.decode(chunk)
+                yield decoder.decode(b"", final=True)
+            finally:
+                response.close()
+
+        return (response.status_code, iter_text())
+
     @classmethod
     def get_handle(cls, url: str) -> Tuple[str, Match]:
         """Gets the handle match for a given url.
@@ -101,8 +250,260 @@ class BaseExtractor(abc.ABC):
 
         return (ordered_filepaths[0] if len(ordered_filepaths) > 0 else None)
 
+    def _get_handle_method(
+        self, url: str, handle: Tuple[str, Match] = None
+    ) -> Tuple[Callable, Match]:
+        """Gets the handle method and match for a given url.
+
+        Args:
+            url (str): The url to get the handle method for.
+            handle (tuple[str, Match], optional): The already resolved
+                ``(handle_name, match)`` for the url.
+
+        Raises:
+            NotImplementedError: If a given ``handle_{handle_name}``
+                method does not exist.
+
+        Returns:
+            tuple[callable, Match]: A tuple of the handle method and the match
+                for the url.
+        """
+
+        (handle_name, handle_match) = (
+            handle if handle is not None else self.get_handle(url)
+        )
+        handle_method = f"handle_{handle_name}"
+        if not hasattr(self, handle_method):
+            raise NotImplementedError(
+                (
+                    f"no handled method named {handle_method!r} is implemented for "
+                    f"{self!r}"
+                )
+            )
+        return (getattr(self, handle_method), handle_match)
+
+    def _get_offline_handle(self, url: str) -> Optional[Tuple[str, Match]]:
+        """Gets the offline handle match for a given url.
+
+        Note:
+            Offline handles are matched on their own as they may be shadowed
+            by broader handles (such as imgur's ``basic`` handle matching raw
+            links).
+
+        Args:
+            url (str): The url to get the offline handle match for.
+
+        Returns:
+            tuple[str, Match]: A tuple of the offline handle and the match for
+                the url, or None if no offline handle can handle the url.
+        """
+
+        for handle_name in self.offline_handles:
+            match = re.match(self.handles[handle_name], url)
+            if match:
+                return (handle_name, match)
+
+    def _get_selector(
+        self,
+        prefer: str = "best",
+        min_quality: float = None,
+        extensions: Iterable[str] = None,
+        max_variants: int = None,
+    ):
+        """Gets the variant selector given to handle methods.
+
+        Args:
+            prefer (str, optional): Either ``"best"`` or ``"smallest"``.
+            min_quality (float, optional): The minimum quality of variants.
+            extensions (iterable[str], optional): The allowed extensions.
+            max_variants (int, optional): The maximum number of variants.
+
+        Returns:
+            VariantSelector: The selector of the variants to build.
+        """
+
+        # imported here as the content module depends on the extractors
+        from ..content import DEFAULT_SELECTOR, VariantSelector
+
+        selector = VariantSelector(
+            prefer=prefer,
+            min_quality=min_quality,
+            extensions=extensions,
+            max_variants=max_variants,
+        )
+        return DEFAULT_SELECTOR if selector == DEFAULT_SELECTOR else selector
+
+    def _get_auth_tuple(self, auth_tuple: Tuple[str, str] = None) -> Tuple[str, str]:
+        """Gets the validated authentication tuple for the extractor.
+
+        Args:
+            auth_tuple (tuple[str, str], optional): The auth tuple if available.
+
+        Raises:
+            exceptions.AuthenticationError: If no valid authentication is
+                available.
+
+        Returns:
+            tuple[str, str]: The authentication tuple, or None if the extractor
+                requires no authentication.
+        """
+
+        if self.authentication == auth.AuthTypes.NONE:
+            return None
+
+        if not isinstance(auth_tuple, tuple):
+            registry = auth.AuthRegistry()
+            # try to get authentication entry from registry
+            if self.name not in registry:
+                raise exceptions.AuthenticationError(
+                    (
+                        f"no valid authentication found for {self!r}, received "
+                        f"{auth_tuple!r} and no registry entry for key "
+                        f"{self.name!r}"
+                    )
+                )
+            auth_tuple = registry[self.name]
+            del registry
+
+        # validate authentication format
+        if len(auth_tuple) != len(self.authentication.value):
+            raise exceptions.AuthenticationError(
+                (
+                    f"invalid authentication format for {self!r}, got values "
+                    f"{auth!r} but expects format {self.authentication.value!r}"
+                )
+            )
+        return auth_tuple
+
+    def _get_enrich_id(self, content_list: Any) -> Optional[str]:
+        """Gets the id the metadata of content extracted without it is queried by.
+
+        Args:
+            content_list (ContentGroup): The content to get the id of.
+
+        Returns:
+            str: The id of the content, or None if it cannot be enriched.
+        """
+
+        if content_list.metadata is not None:
+            return None
+        handle = self._get_offline_handle(content_list.source)
+        return handle[1].groupdict().get("id") if handle is not None else None
+
+    def _get_enrich_groups(self, content_lists: Iterable[Any]) -> Dict[str, List[Any]]:
+        """Groups content extracted without metadata by the id of its metadata.
+
+        Args:
+            content_lists (iterable[ContentGroup]): The content to group.
+
+        Returns:
+            dict[str, list[ContentGroup]]: The content sharing each id.
+        """
+
+        groups = collections.defaultdict(list)
+        for content_list in content_lists:
+            id = self._get_enrich_id(content_list)
+            if id is not None:
+                groups[id].append(content_list)
+        return groups
+
+    def _get_enrich_data(self, id: str) -> Dict[str, Any]:
+        """Gets the API data content is enriched with.
+
+        Args:
+            id (str): The id of the content.
+
+        Raises:
+            NotImplementedError: If the extractor has no offline handles.
+
+        Returns:
+            dict[str,....]: API data dictionary response
+        """
+
+        raise NotImplementedError()
+
+    def _get_shared_fields(self, data: Dict[str, Any]) -> Dict[str, Any]:
+        """Gets the fields shared by the variants of some API data.
+
+        Args:
+            data (dict[str,....]): The API data
+
+        Raises:
+            NotImplementedError: If the extractor has no offline handles.
+
+        Returns:
+            dict[str,....]: The ``title``, ``description``, ``uploaded_by``,
+                ``uploaded_date`` and ``metadata`` of the content.
+        """
+
+        raise NotImplementedError()
+
+    def enrich(
+        self,
+        content_lists: Iterable[Any],
+        auth_tuple: Tuple[str, str] = None,
+        error_hook: Callable[[str, Exception], None] = None,
+    ) -> List[Any]:
+        """Fills in the metadata of content extracted with ``metadata=False``.
+
+        Note:
+            The metadata of each id is requested once, no matter how many of
+            the given content share it.
+            Content which already has metadata (or cannot be enriched) is left
+            untouched.
+
+        Args:
+            content_lists (iterable[ContentGroup]): The content to enrich.
+            auth_tuple (tuple[str, str], optional): The auth tuple if available.
+            error_hook (callable, optional): A hook that accepts the arguments
+                ``(id, exception)`` for metadata which could not be retrieved,
+                if not given the exception is raised.
+
+        Returns:
+            list[ContentGroup]: The given content.
+
+        Examples:
+            Basic usage...
+
+            >>> from qetch.extractors import (GfycatExtractor,)
+            >>> extractor = GfycatExtractor()
+            >>> content_lists = list(extractor.extract(GFYCAT_RAW_URL, metadata=False))
+            >>> print(content_lists[0].title)
+            None
+            >>> print(extractor.enrich(content_lists)[0].title)
+            GFYCAT_TITLE
+        """
+
+        content_lists = list(content_lists)
+        groups = self._get_enrich_groups(content_lists)
+        if len(groups) == 0:
+            return content_lists
+
+        auth_tuple = self._get_auth_tuple(auth_tuple)
+        if auth_tuple is not None:
+            self.authenticate(auth_tuple)
+        for (id, grouped) in groups.items():
+            try:
+                fields = self._get_shared_fields(self._get_enrich_data(id))
+            except exceptions.ExtractionError as exc:
+                if not callable(error_hook):
+                    raise
+                error_hook(id, exc)
+                continue
+            for content_list in grouped:
+                content_list.update(**fields)
+        return content_lists
+
     def extract(
-        self, url: str, auth_tuple: Tuple[str, str] = None
+        self,
+        url: str,
+        auth_tuple: Tuple[str, str] = None,
+        handle: Tuple[str, Match] = None,
+        prefer: str = "best",
+        min_quality: float = None,
+        extensions: Iterable[str] = None,
+        max_variants: int = None,
+        metadata: bool = True,
     ) -> Generator[List[Any], None, None]:
         """Extracts lists of content from a url.
 
@@ -116,16 +517,35 @@ class BaseExtractor(abc.ABC):
             If an appropriately named method does not exist, a
             ``NotImplementedError`` is raised.
 
+            Variants not matching ``prefer``, ``min_quality``, ``extensions``
+            and ``max_variants`` are never built (see
+            :class:`~qetch.content.VariantSelector`), content without any
+            matching variants is not yielded.
+
         Args:
             url (str): The url to extract content from.
             auth_tuple (tuple[str, str], optional): The auth tuple if available.
+            handle (tuple[str, Match], optional): The already resolved
+                ``(handle_name, match)`` for the url (as given by
+                :func:`~qetch.route`), avoids matching the url again.
+            prefer (str, optional): Either ``"best"`` or ``"smallest"``, which
+                variants to keep when more than ``max_variants`` are available.
+            min_quality (float, optional): The minimum quality of variants.
+            extensions (iterable[str], optional): The allowed extensions of
+                variants.
+            max_variants (int, optional): The maximum number of variants of
+                each content.
+            metadata (bool, optional): If False, handles listed in
+                :attr:`~BaseExtractor.offline_handles` build content from the
+                url alone (without any request or authentication), leaving its
+                metadata to :func:`~BaseExtractor.enrich`.
 
         Raises:
             NotImplementedError: If a given ``handle_{handle_name}``
                 method does not exist.
 
         Yields:
-            list[Content]: A list of similar content of different qualities
+            ContentGroup: The similar content of different qualities
 
         Examples:
             Basic usage where ``GFYCAT_ID`` is the id determined from
@@ -137,6 +557,7 @@ class BaseExtractor(abc.ABC):
             ...        print(content)
             <Content (1.0) "gfycat-GFYCAT_ID-mp4Url">
             <Content (0.5) "gfycat-GFYCAT_ID-webmUrl">
+            <Content (0.25) "gfycat-GFYCAT_ID-gifUrl">
             <Content (0.0) "gfycat-GFYCAT_ID-webpUrl">
             <Content (0.0) "gfycat-GFYCAT_ID-mobileUrl">
             <Content (0.0) "gfycat-GFYCAT_ID-mobilePosterUrl">
@@ -149,44 +570,303 @@ class BaseExtractor(abc.ABC):
             <Content (0.0) "gfycat-GFYCAT_ID-mjpgUrl">
             <Content (0.0) "gfycat-GFYCAT_ID-miniUrl">
             <Content (0.0) "gfycat-GFYCAT_ID-miniPosterUrl">
-            <Content (0.25) "gfycat-GFYCAT_ID-gifUrl">
         """
 
-        (handle_name, handle_match) = self.get_handle(url)
-        handle_method = f"handle_{handle_name}"
-        if not hasattr(self, handle_method):
-            raise NotImplementedError(
-                (
-                    f"no handled method named {handle_method!r} is implemented for "
-                    f"{self!r}"
-                )
+        selector = self._get_selector(prefer, min_quality, extensions, max_variants)
+        offline = None if metadata else self._get_offline_handle(url)
+        if offline is not None:
+            (handle_name, handle_match) = offline
+            handle_method = getattr(self, f"handle_{handle_name}_offline")
+        else:
+            (handle_method, handle_match) = self._get_handle_method(url, handle)
+            auth_tuple = self._get_auth_tuple(auth_tuple)
+            if auth_tuple is not None:
+                self.authenticate(auth_tuple)
+
+        # handle extracting content using appropriate extraction method
+        for content in handle_method(url, handle_match, selector=selector):
+            if len(content) > 0:
+                yield content
+
+
+class AsyncBaseExtractor(BaseExtractor):
+    """The base asynchronous extractor.
+    `All asynchronous extractors should extend this and the extractor they are \
+        the asynchronous counterpart of.`
+
+    Note:
+        All asynchronous extractors running in the same event loop share a
+        single connection pool of at most
+        :attr:`~AsyncBaseExtractor.connection_limit` connections.
+        Requires the optional ``aiohttp`` dependency.
+    """
+
+    connection_limit = 100
+
+    _sessions = weakref.WeakKeyDictionary()
+
+    @property
+    def headers(self) -> Dict[str, str]:
+        """The headers sent with every request made by the extractor.
+
+        Returns:
+            dict[str, str]: The headers of the extractor.
+        """
+
+        if not hasattr(self, "_headers"):
+            self._headers = {}
+        return self._headers
+
+    @property
+    def session(self):
+        """The session shared by all asynchronous extractors in the running loop.
+
+        Raises:
+            RuntimeError: If accessed outside of a running event loop.
+
+        Returns:
+            aiohttp.ClientSession: The shared session.
+        """
+
+        import asyncio
+        import aiohttp
+
+        loop = asyncio.get_running_loop()
+        session = AsyncBaseExtractor._sessions.get(loop)
+        if session is None or session.closed:
+            session = aiohttp.ClientSession(
+                connector=aiohttp.TCPConnector(limit=self.connection_limit)
             )
+            AsyncBaseExtractor._sessions[loop] = session
+        return session
 
-        if self.authentication != auth.AuthTypes.NONE:
-            if not isinstance(auth_tuple, tuple):
-                registry = auth.AuthRegistry()
-                # try to get authentication entry from registry
-                if self.name not in registry:
-                    raise exceptions.AuthenticationError(
-                        (
-                            f"no valid authentication found for {self!r}, received "
-                            f"{auth_tuple!r} and no registry entry for key "
-                            f"{self.name!r}"
-                        )
-                    )
-                auth_tuple = registry[self.name]
-                del registry
+    @classmethod
+    async def close_session(cls):
+        """Closes the session shared in the running loop.
+        """
 
-            # validate authentication format
-            if len(auth_tuple) != len(self.authentication.value):
-                raise exceptions.AuthenticationError(
-                    (
-                        f"invalid authentication format for {self!r}, got values "
-                        f"{auth!r} but expects format {self.authentication.value!r}"
-                    )
+        import asyncio
+
+        session = AsyncBaseExtractor._sessions.pop(asyncio.get_running_loop(), None)
+        if session is not None:
+            await session.close()
+
+    async def fetch(self, url: str, method: str = "GET", **kwargs) -> Tuple[int, str]:
+        """Requests a url through the shared session.
+
+        Note:
+            ``GET`` requests go through the extractor's
+            :attr:`~BaseExtractor.cache` the same way as
+            :func:`BaseExtractor.fetch`.
+
+        Args:
+            url (str): The url to request.
+            method (str, optional): The method of the request.
+
+        Returns:
+            tuple[int, str]: A tuple of the response status and text.
+        """
+
+        headers = dict(self.headers)
+        headers.update(kwargs.pop("headers", {}))
+
+        entry = None
+        if self.cache is not None and method == "GET":
+            entry = self.cache.get(url)
+            if entry is not None and entry.is_fresh:
+                return entry.response
+            if entry is not None:
+                headers.update(entry.conditional_headers)
+
+        async with self.session.request(
+            method, url, headers=headers, **kwargs
+        ) as response:
+            (status, text) = (response.status, await response.text())
+            if self.cache is None or method != "GET":
+                return (status, text)
+            return self.cache.update(url, entry, status, response.headers, text)
+
+    async def fetch_stream(
+        self, url: str, **kwargs
+    ) -> Tuple[int, AsyncIterator[str]]:
+        """Requests a url through the shared session, streaming the response.
+
+        Note:
+            The extractor's :attr:`~BaseExtractor.cache` is used the same way
+            as :func:`BaseExtractor.fetch_stream`.
+
+        Args:
+            url (str): The url to request.
+
+        Returns:
+            tuple[int, async iterator[str]]: A tuple of the response status and
+                an asynchronous iterator of the decoded chunks of the response
+                text.
+        """
+
+        async def iter_chunks(*chunks: str) -> AsyncGenerator[str, None]:
+            for chunk in chunks:
+                yield chunk
+
+        headers = dict(self.headers)
+        headers.update(kwargs.pop("headers", {}))
+        entry = self.cache.get(url) if self.cache is not None else None
+        if entry is not None:
+            if entry.is_fresh:
+                return (entry.status, iter_chunks(entry.text))
+            headers.update(entry.conditional_headers)
+
+        response = await self.session.request("GET", url, headers=headers, **kwargs)
+        if response.status != 200:
+            async with response:
+                (status, text) = (response.status, await response.text())
+            if self.cache is not None:
+                (status, text) = self.cache.update(
+                    url, entry, status, response.headers, text
                 )
-            self.authenticate(auth_tuple)
+            return (status, iter_chunks(text))
 
-        # handle extracting content using appropriate extraction method
-        for content in getattr(self, handle_method)(url, handle_match):
-            yield content
+        async def iter_text() -> AsyncGenerator[str, None]:
+            decoder = codecs.getincrementaldecoder(response.charset or "utf-8")()
+            async with response:
+                async for chunk in response.content.iter_chunked(
+                    self.stream_chunk_size
+                ):
+                    yield decoder.decode(chunk)
+                yield decoder.decode(b"", final=True)
+
+        return (response.status, iter_text())
+
+    async def authenticate(self, auth_tuple: Tuple[str, str]):
+        """Handles authenticating the extractor if necessary.
+
+        Args:
+            auth_tuple (tuple[str, str]): The authentication tuple is available.
+        """
+
+        pass
+
+    async def enrich(
+        self,
+        content_lists: Iterable[Any],
+        auth_tuple: Tuple[str, str] = None,
+        error_hook: Callable[[str, Exception], None] = None,
+    ) -> List[Any]:
+        """Asynchronously fills in the metadata of content extracted without it.
+
+        Note:
+            The metadata of every id is requested concurrently, see
+            :func:`BaseExtractor.enrich`.
+
+        Args:
+            content_lists (iterable[ContentGroup]): The content to enrich.
+            auth_tuple (tuple[str, str], optional): The auth tuple if available.
+            error_hook (callable, optional): A hook that accepts the arguments
+                ``(id, exception)`` for metadata which could not be retrieved,
+                if not given the exception is raised.
+
+        Returns:
+            list[ContentGroup]: The given content.
+        """
+
+        import asyncio
+
+        content_lists = list(content_lists)
+        groups = self._get_enrich_groups(content_lists)
+        if len(groups) == 0:
+            return content_lists
+
+        auth_tuple = self._get_auth_tuple(auth_tuple)
+        if auth_tuple is not None:
+            await self.authenticate(auth_tuple)
+        results = await asyncio.gather(
+            *[self._get_enrich_data(id) for id in groups.keys()],
+            return_exceptions=True,
+        )
+        for ((id, grouped), data) in zip(groups.items(), results):
+            if isinstance(data, exceptions.ExtractionError) and callable(error_hook):
+                error_hook(id, data)
+                continue
+            elif isinstance(data, BaseException):
+                raise data
+            fields = self._get_shared_fields(data)
+            for content_list in grouped:
+                content_list.update(**fields)
+        return content_lists
+
+    async def extract(
+        self,
+        url: str,
+        auth_tuple: Tuple[str, str] = None,
+        handle: Tuple[str, Match] = None,
+        prefer: str = "best",
+        min_quality: float = None,
+        extensions: Iterable[str] = None,
+        max_variants: int = None,
+        metadata: bool = True,
+    ) -> AsyncGenerator[List[Any], None]:
+        """Asynchronously extracts lists of content from a url.
+
+        Note:
+            Asynchronous extractors implement their ``handle_{handle_name}``
+            methods as asynchronous generators.
+
+        Args:
+            url (str): The url to extract content from.
+            auth_tuple (tuple[str, str], optional): The auth tuple if available.
+            handle (tuple[str, Match], optional): The already resolved
+                ``(handle_name, match)`` for the url.
+            prefer (str, optional): Either ``"best"`` or ``"smallest"``, which
+                variants to keep when more than ``max_variants`` are available.
+            min_quality (float, optional): The minimum quality of variants.
+            extensions (iterable[str], optional): The allowed extensions of
+                variants.
+            max_variants (int, optional): The maximum number of variants of
+                each content.
+            metadata (bool, optional): If False, handles listed in
+                :attr:`~BaseExtractor.offline_handles` build content from the
+                url alone (without any request or authentication), leaving its
+                metadata to :func:`~BaseExtractor.enrich`.
+
+        Raises:
+            NotImplementedError: If a given ``handle_{handle_name}``
+                method does not exist.
+
+        Yields:
+            ContentGroup: The similar content of different qualities
+
+        Examples:
+            Basic usage...
+
+            >>> import asyncio
+            >>> from qetch.extractors.gfycat import (AsyncGfycatExtractor,)
+            >>> async def main():
+            ...     async for content_list in AsyncGfycatExtractor().extract(
+            ...         GFYCAT_URL
+            ...     ):
+            ...         print(content_list[0])
+            ...     await AsyncGfycatExtractor.close_session()
+            >>> asyncio.run(main())
+            <Content (1.0) "gfycat-GFYCAT_ID-mp4Url">
+        """
+
+        selector = self._get_selector(prefer, min_quality, extensions, max_variants)
+        offline = None if metadata else self._get_offline_handle(url)
+        if offline is not None:
+            # offline handles make no requests, so they are shared with the
+            # synchronous extractors
+            (handle_name, handle_match) = offline
+            handle_method = getattr(self, f"handle_{handle_name}_offline")
+            for content in handle_method(url, handle_match, selector=selector):
+                if len(content) > 0:
+                    yield content
+            return
+
+        (handle_method, handle_match) = self._get_handle_method(url, handle)
+        auth_tuple = self._get_auth_tuple(auth_tuple)
+        if auth_tuple is not None:
+            await self.authenticate(auth_tuple)
+
+        async for content in handle_method(url, handle_match, selector=selector):
+            if len(content) > 0:
+                yield content
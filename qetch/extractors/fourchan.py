@@ -1,18 +1,61 @@
 # Copyright (c) 2018 Stephen Bunn (stephen@bunn.io)
 # MIT License <https://opensource.org/licenses/MIT>
 
+import re
+import time
+import heapq
 import datetime
-from typing import Any, Dict, List, Match, Tuple, Generator
+import itertools
+import collections
+from concurrent.futures import ThreadPoolExecutor
+from typing import (
+    Any,
+    Dict,
+    List,
+    Match,
+    Tuple,
+    Callable,
+    Iterable,
+    Generator,
+    AsyncGenerator,
+)
 
 from furl import furl
-from requests_html import HTML
 
+import attr
 import ujson
 
 from .. import exceptions
 from ..auth import AuthTypes
-from ._common import BaseExtractor
-from ..content import Content
+from ..utils import LazyText, JSONArraySplitter, iter_json_array
+from ._common import BaseExtractor, AsyncBaseExtractor
+from ..content import DEFAULT_SELECTOR, Variant, ContentGroup, VariantSelector
+
+
+@attr.s
+class ThreadCursor(object):
+    """The position of a watched 4chan thread.
+
+    Attributes:
+        source (str): The source url of the thread.
+        board (str): The id of the thread's board.
+        id (str): The id of the thread.
+        last_no (int): The number of the last seen post.
+        last_modified (str, optional): The ``Last-Modified`` of the last
+            response, sent as ``If-Modified-Since`` on the next poll.
+        interval (float): The current seconds between polls of the thread.
+        next_poll (float): The clock time the thread is next polled at.
+        is_alive (bool): False once the thread is archived, closed or deleted.
+    """
+
+    source = attr.ib(type=str)
+    board = attr.ib(type=str)
+    id = attr.ib(type=str)
+    last_no = attr.ib(type=int, default=0)
+    last_modified = attr.ib(type=str, default=None, repr=False)
+    interval = attr.ib(type=float, default=10.0, repr=False)
+    next_poll = attr.ib(type=float, default=0.0, repr=False)
+    is_alive = attr.ib(type=bool, default=True)
 
 
 class FourChanExtractor(BaseExtractor):
@@ -22,7 +65,7 @@ class FourChanExtractor(BaseExtractor):
     name = "4chan"
     description = "A no-limits and lightly categorized temporary image host."
     authentication = AuthTypes.NONE
-    domains = ["4chan.org", "i.4chan.org"]
+    domains = ["4chan.org", "i.4chan.org", "i.4cdn.org"]
     handles = {
         "thread": (
             r"^https?://(?:www\.)?(?:boards\.)?4chan\.org/(?P<board>.*)/"
@@ -32,8 +75,17 @@ class FourChanExtractor(BaseExtractor):
             r"^https?://(?:www\.)?i\.4cdn\.org/(?P<board>.*)/"
             r"(?P<id>.*)\.(?:[a-zA-Z0-9]+)$"
         ),
+        "board": (
+            r"^https?://(?:www\.)?(?:boards\.)?4chan\.org/(?P<board>[a-zA-Z0-9]+)"
+            r"(?:/(?:catalog)?)?/?(?:#.*)?$"
+        ),
     }
 
+    # seconds between the requests of a board crawl (4chan's API rules)
+    request_interval = 1.0
+    # number of thread requests in flight while a board's content is built
+    board_prefetch = 2
+
     _api_base = "https://a.4cdn.org/"
     _img_base = "https://i.4cdn.org/"
     _content_configs = [
@@ -41,6 +93,118 @@ class FourChanExtractor(BaseExtractor):
         ("thumb", "{board}/{post[tim]}s.jpg", 0.0, "jpg"),
     ]
 
+    def _get_query_url(self, board: str, id: str) -> str:
+        """Gets the API url for a specific 4chan board and thread id.
+
+        Args:
+            board (str): The id of the passed board
+            id (str): The id of the passed thread
+
+        Returns:
+            str: The API url of the thread.
+        """
+
+        return furl(self._api_base).add(path=f"{board}/thread/{id}.json").url
+
+    def _get_board_query_url(self, board: str) -> str:
+        """Gets the API url listing the threads of a specific 4chan board.
+
+        Args:
+            board (str): The id of the board
+
+        Returns:
+            str: The API url of the board's threads.
+        """
+
+        return furl(self._api_base).add(path=f"{board}/threads.json").url
+
+    def _get_thread_url(self, board: str, id: str) -> str:
+        """Gets the url of a specific 4chan thread.
+
+        Args:
+            board (str): The id of the thread's board
+            id (str): The id of the thread
+
+        Returns:
+            str: The url of the thread.
+        """
+
+        return f"https://boards.4chan.org/{board}/thread/{id}"
+
+    @property
+    def crawled(self) -> Dict[str, int]:
+        """The ``last_modified`` of each thread as of the last board crawl.
+
+        Note:
+            Keys are ``{board}/{thread_id}``.
+            Threads whose ``last_modified`` is unchanged are skipped by later
+            crawls, the mapping can be saved and restored to persist this
+            between runs.
+
+        Returns:
+            dict[str, int]: The crawled threads.
+        """
+
+        if not hasattr(self, "_crawled"):
+            self._crawled = {}
+        return self._crawled
+
+    def _reserve_request(self) -> float:
+        """Reserves the next request slot of a board crawl.
+
+        Returns:
+            float: The seconds to wait before making the request.
+        """
+
+        now = time.monotonic()
+        slot = max(now, getattr(self, "_next_request", now))
+        self._next_request = slot + self.request_interval
+        return slot - now
+
+    def _get_changed_threads(self, board: str, text: str) -> List[Dict[str, Any]]:
+        """Gets the threads of a board changed since they were last crawled.
+
+        Args:
+            board (str): The id of the board
+            text (str): The text of the board's ``threads.json``
+
+        Returns:
+            list[dict[str,....]]: The API data of the changed threads.
+        """
+
+        changed = []
+        for page in ujson.loads(text):
+            for thread in page.get("threads", []):
+                crawled = self.crawled.get(f'{board}/{thread["no"]}')
+                if crawled is None or crawled != thread.get("last_modified"):
+                    changed.append(thread)
+        return changed
+
+    def _get_board_threads(self, board: str) -> List[Dict[str, Any]]:
+        """Gets the threads of a board changed since they were last crawled.
+
+        Args:
+            board (str): The id of the board
+
+        Raises:
+            exceptions.ExtractionError: When API call results in non 200 status
+
+        Returns:
+            list[dict[str,....]]: The API data of the changed threads.
+        """
+
+        query_url = self._get_board_query_url(board)
+        time.sleep(self._reserve_request())
+        (status, text) = self.fetch(query_url)
+        if status not in (200,):
+            raise exceptions.ExtractionError(
+                (
+                    f"error retrieving source for {query_url!r} recieved status "
+                    f"{status}"
+                )
+            )
+        return self._get_changed_threads(board, text)
+
     def _get_data(self, board: str, id: str) -> Dict[str, Any]:
         """Gets API data for a specific 4chan board and thread id.
 
@@ -55,108 +219,686 @@ class FourChanExtractor(BaseExtractor):
             dict[str,....]: API data dictionary response
         """
 
-        query_url = furl(self._api_base).add(path=f"{board}/thread/{id}.json")
-        response = self.session.get(query_url.url)
-        if response.status_code not in (200,):
+        query_url = self._get_query_url(board, id)
+        (status, text) = self.fetch(query_url)
+        if status not in (200,):
             raise exceptions.ExtractionError(
                 (
-                    f"error retrieving source for {query_url.url!r} recieved status "
+                    f"error retrieving source for {query_url!r} recieved status "
+                    f"{status}"
+                )
+            )
+        return ujson.loads(text)
+
+    def _iter_posts(self, board: str, id: str) -> Generator[Dict[str, Any], None, None]:
+        """Incrementally gets the API data of the posts of a thread.
+
+        Note:
+            Posts are parsed as the thread is streamed, so only a single post
+            is kept in memory at a time.
+
+        Args:
+            board (str): The id of the passed board
+            id (str): The id of the passed thread
+
+        Raises:
+            exceptions.ExtractionError: When API call results in non 200 status
+
+        Yields:
+            dict[str,....]: The API data of each post
+        """
+
+        query_url = self._get_query_url(board, id)
+        (status, chunks) = self.fetch_stream(query_url)
+        if status not in (200,):
+            raise exceptions.ExtractionError(
+                (
+                    f"error retrieving source for {query_url!r} recieved status "
+                    f"{status}"
+                )
+            )
+        yield from iter_json_array(chunks, ["posts"])
+
+    def _build_post_content(
+        self,
+        source: str,
+        board: str,
+        id: str,
+        post: Dict[str, Any],
+        selector: VariantSelector = DEFAULT_SELECTOR,
+    ) -> ContentGroup:
+        """Builds the content group for a single post of a thread.
+
+        Args:
+            source (str): The source url
+            board (str): The id of the post's board
+            id (str): The id of the post's thread
+            post (dict[str,....]): The post's API data
+            selector (VariantSelector, optional): The variants to build
+
+        Returns:
+            ContentGroup: The various levels of quality content for \
+                the same post
+        """
+
+        # only rendered when the description of a variant is first accessed
+        content_description = None
+        if len(post.get("com", "")) > 0:
+            content_description = LazyText(post["com"])
+
+        configs = selector.select(
+            self._content_configs,
+            quality=lambda config: config[2],
+            extension=lambda config: config[3] or post["ext"].split(".")[-1],
+        )
+        variants = []
+        for (post_type, url_path, quality, extension_type) in configs:
+            # build post_type depending on existing post_type
+            post_type = (f"-{post_type}" if post_type else "")
+            variants.append(
+                Variant(
+                    uid=f'{self.name}-{board}-{id}-{post["tim"]}{post_type}',
+                    fragments=[
+                        furl(self._img_base).add(
+                            path=url_path.format(board=board, post=post)
+                        ).url
+                    ],
+                    extension=(
+                        extension_type if extension_type else post["ext"].split(".")[-1]
+                    ),
+                    quality=quality,
+                )
+            )
+
+        return ContentGroup(
+            source=source,
+            extractor=self,
+            variants=variants,
+            title=post.get("filename"),
+            description=content_description,
+            uploaded_by=post.get("name"),
+            uploaded_date=datetime.datetime.fromtimestamp(int(post.get("time"))),
+            metadata=post,
+        )
+
+    def _build_thread_content(
+        self,
+        source: str,
+        board: str,
+        id: str,
+        posts: Iterable[Dict[str, Any]],
+        selector: VariantSelector = DEFAULT_SELECTOR,
+    ) -> Generator[ContentGroup, None, None]:
+        """Builds the content groups for the posts of a thread.
+
+        Args:
+            source (str): The source url
+            board (str): The id of the thread's board
+            id (str): The id of the thread
+            posts (iterable[dict[str,....]]): The API data of the thread's posts
+            selector (VariantSelector, optional): The variants to build
+
+        Yields:
+            ContentGroup: The various levels of quality content for \
+                the same post
+        """
+
+        for post in posts:
+            if "md5" in post:
+                yield self._build_post_content(
+                    source, board, id, post, selector=selector
+                )
+
+    def _build_raw_content_list(
+        self, source: str, match: Match, selector: VariantSelector = DEFAULT_SELECTOR
+    ) -> ContentGroup:
+        """Builds the content group for a raw link.
+
+        Args:
+            source (str): The source url
+            match (Match): The source match regex
+            selector (VariantSelector, optional): The variants to build
+
+        Returns:
+            ContentGroup: The various levels of quality content for \
+                the same source url
+        """
+
+        matchdict = match.groupdict()
+        configs = selector.select(
+            self._content_configs,
+            quality=lambda config: config[2],
+            extension=lambda config: config[3] or source.split(".")[-1],
+        )
+        variants = []
+        for (post_type, _, quality, extension_type) in configs:
+            post_type = (f"-{post_type}" if post_type else "")
+            variants.append(
+                Variant(
+                    uid=(
+                        f'{self.name}-{matchdict["board"]}-raw-{matchdict["id"]}'
+                        f"{post_type}"
+                    ),
+                    fragments=[source],
+                    extension=(
+                        extension_type if extension_type else source.split(".")[-1]
+                    ),
+                    quality=quality,
+                )
+            )
+        return ContentGroup(
+            source=source, extractor=self, variants=variants, metadata=None
+        )
+
+    def poll_thread(
+        self, cursor: ThreadCursor, selector: VariantSelector = DEFAULT_SELECTOR
+    ) -> List[ContentGroup]:
+        """Polls a watched thread for the posts made since the cursor.
+
+        Note:
+            The thread is requested with ``If-Modified-Since`` so an unchanged
+            thread costs a ``304`` and no parsing.
+            The cursor is advanced past the returned posts, and marked as no
+            longer alive once the thread is archived, closed or deleted.
+
+        Args:
+            cursor (ThreadCursor): The cursor of the thread.
+            selector (VariantSelector, optional): The variants to build
+
+        Raises:
+            exceptions.ExtractionError: When API call results in an unexpected
+                status
+
+        Returns:
+            list[ContentGroup]: The content groups of the new posts.
+        """
+
+        query_url = self._get_query_url(cursor.board, cursor.id)
+        headers = {}
+        if cursor.last_modified is not None:
+            headers["If-Modified-Since"] = cursor.last_modified
+
+        response = self.session.get(query_url, headers=headers)
+        if response.status_code == 304:
+            return []
+        elif response.status_code == 404:
+            cursor.is_alive = False
+            return []
+        elif response.status_code not in (200,):
+            raise exceptions.ExtractionError(
+                (
+                    f"error retrieving source for {query_url!r} recieved status "
                     f"{response.status_code}"
                 )
             )
-        return ujson.loads(response.text)
+
+        cursor.last_modified = response.headers.get(
+            "Last-Modified", cursor.last_modified
+        )
+        posts = ujson.loads(response.text).get("posts", [])
+        if len(posts) > 0 and (posts[0].get("archived") or posts[0].get("closed")):
+            cursor.is_alive = False
+
+        content_lists = []
+        for post in posts:
+            if post["no"] <= cursor.last_no:
+                continue
+            cursor.last_no = post["no"]
+            if "md5" in post:
+                content_lists.append(
+                    self._build_post_content(
+                        cursor.source, cursor.board, cursor.id, post, selector=selector
+                    )
+                )
+        return content_lists
+
+    def watch(
+        self, *urls: str, **kwargs
+    ) -> Generator[Tuple[ThreadCursor, ContentGroup], None, None]:
+        """Watches threads, yielding the content of new posts as they are made.
+
+        Note:
+            Keyword arguments are given to the :class:`FourChanPoller` used to
+            schedule the polls of the threads.
+            Posts made before a thread is first polled are also yielded.
+
+        Args:
+            urls (str): The urls of the threads to watch.
+
+        Yields:
+            tuple[ThreadCursor, ContentGroup]: A tuple of the cursor of the
+                thread and the content list of a new post.
+
+        Examples:
+            Basic usage...
+
+            >>> from qetch.extractors import (FourChanExtractor,)
+            >>> for (cursor, content_list) in FourChanExtractor().watch(THREAD_URL):
+            ...     print(cursor.id, content_list[0])
+            12345678 <Content (1.0) "4chan-g-12345678-1520000000000">
+        """
+
+        poller = FourChanPoller(extractor=self, **kwargs)
+        for url in urls:
+            poller.watch(url)
+        yield from poller.poll()
 
     def handle_thread(
-        self, source: str, match: Match
-    ) -> Generator[List[Content], None, None]:
+        self, source: str, match: Match, selector: VariantSelector = DEFAULT_SELECTOR
+    ) -> Generator[ContentGroup, None, None]:
         """Handles ``thread`` links to 4chan media.
 
         Args:
             source (str): The source url
             match (Match): The source match regex
+            selector (VariantSelector, optional): The variants to build
 
         Yields:
-            list[Content]: A list of various levels of quality content for \
+            ContentGroup: The various levels of quality content for \
                 the same source url
         """
 
         matchdict = match.groupdict()
-        data = self._get_data(matchdict["board"], matchdict["id"])
-        for post in data.get("posts", []):
-            if "md5" in post:
-                content_list = []
-                for (
-                    post_type, url_path, quality, extension_type
-                ) in self._content_configs:
-                    # build post_type depending on existing post_type
-                    post_type = (f"-{post_type}" if post_type else "")
-                    content_uid = (
-                        f'{self.name}-{matchdict["board"]}-'
-                        f'{matchdict["id"]}-{post["tim"]}{post_type}'
-                    )
-                    content_fragments = [
-                        furl(self._img_base).add(
-                            path=url_path.format(board=matchdict["board"], post=post)
-                        ).url
-                    ]
-                    content_extension = (
-                        extension_type if extension_type else post["ext"].split(".")[-1]
-                    )
-                    content_description = None
-                    if "com" in post and len(post["com"]) > 0:
-                        content_description = HTML(html=post.get("com")).text
-
-                    content_list.append(
-                        Content(
-                            uid=content_uid,
-                            source=source,
-                            fragments=content_fragments,
-                            extractor=self,
-                            extension=content_extension,
-                            title=post.get("filename"),
-                            description=content_description,
-                            quality=quality,
-                            uploaded_by=post.get("name"),
-                            uploaded_date=datetime.datetime.fromtimestamp(
-                                int(post.get("time"))
-                            ),
-                            metadata=post,
+        if self.incremental:
+            posts = self._iter_posts(matchdict["board"], matchdict["id"])
+        else:
+            posts = self._get_data(matchdict["board"], matchdict["id"]).get("posts", [])
+        for content_list in self._build_thread_content(
+            source, matchdict["board"], matchdict["id"], posts, selector=selector
+        ):
+            yield content_list
+
+    def handle_board(
+        self, source: str, match: Match, selector: VariantSelector = DEFAULT_SELECTOR
+    ) -> Generator[ContentGroup, None, None]:
+        """Handles ``board`` links (and catalogs) to 4chan media.
+
+        Note:
+            Up to :attr:`~FourChanExtractor.board_prefetch` threads are
+            requested in the background while the content of the current
+            thread is built, threads unchanged since they were last
+            :attr:`~FourChanExtractor.crawled` are skipped.
+
+        Args:
+            source (str): The source url
+            match (Match): The source match regex
+            selector (VariantSelector, optional): The variants to build
+
+        Yields:
+            ContentGroup: The various levels of quality content for \
+                the same post
+        """
+
+        board = match.groupdict()["board"]
+        threads = iter(self._get_board_threads(board))
+
+        def get_data(id: str) -> Dict[str, Any]:
+            time.sleep(self._reserve_request())
+            return self._get_data(board, id)
+
+        with ThreadPoolExecutor(max_workers=1) as executor:
+            pending = collections.deque()
+            for thread in itertools.islice(threads, max(1, self.board_prefetch)):
+                pending.append((thread, executor.submit(get_data, str(thread["no"]))))
+
+            try:
+                while len(pending) > 0:
+                    (thread, future) = pending.popleft()
+                    # request the next thread before building the current one
+                    for next_thread in itertools.islice(threads, 1):
+                        pending.append(
+                            (
+                                next_thread,
+                                executor.submit(get_data, str(next_thread["no"])),
+                            )
                         )
-                    )
-                yield content_list
+                    try:
+                        data = future.result()
+                    except exceptions.ExtractionError:
+                        # thread was pruned since the board was listed
+                        continue
+
+                    id = str(thread["no"])
+                    for content_list in self._build_thread_content(
+                        self._get_thread_url(board, id),
+                        board,
+                        id,
+                        data.get("posts", []),
+                        selector=selector,
+                    ):
+                        yield content_list
+                    self.crawled[f"{board}/{id}"] = thread.get("last_modified")
+            finally:
+                for (_, future) in pending:
+                    future.cancel()
 
     def handle_raw(
-        self, source: str, match: Match
-    ) -> Generator[List[Content], None, None]:
+        self, source: str, match: Match, selector: VariantSelector = DEFAULT_SELECTOR
+    ) -> Generator[ContentGroup, None, None]:
         """Handles ``raw`` links to 4chan media.
 
         Args:
             source (str): The source url
             match (Match): The source match regex
+            selector (VariantSelector, optional): The variants to build
 
         Yields:
-            list[Content]: A list of various levels of quality content for \
+            ContentGroup: The various levels of quality content for \
                 the same source url
         """
 
+        yield self._build_raw_content_list(source, match, selector=selector)
+
+
+@attr.s
+class FourChanPoller(object):
+    """Schedules the polls of many watched 4chan threads.
+
+    Note:
+        4chan's API rules allow at most one request per second, so polls of
+        every watched thread are spaced at least ``request_interval`` seconds
+        apart.
+        Threads without new posts are polled less often (multiplying their
+        interval by ``backoff`` up to ``max_interval``), and a thread is polled
+        every ``min_interval`` seconds again as soon as it has new posts.
+
+    Attributes:
+        extractor (FourChanExtractor): The extractor threads are polled with.
+        request_interval (float): The minimum seconds between any two requests.
+        min_interval (float): The seconds between polls of an active thread.
+        max_interval (float): The maximum seconds between polls of a quiet
+            thread.
+        backoff (float): The factor a quiet thread's interval is multiplied by.
+        error_hook (callable, optional): A hook that accepts the arguments
+            ``(cursor, exception)`` for each failed poll (including requests
+            failing without a response, such as timeouts), the thread is then
+            backed off as if it was quiet, if not given the exception is raised.
+        clock (callable): The monotonic clock polls are scheduled with.
+        sleep (callable): The function used to wait until the next poll.
+    """
+
+    extractor = attr.ib(type=FourChanExtractor, default=attr.Factory(FourChanExtractor))
+    request_interval = attr.ib(type=float, default=1.0)
+    min_interval = attr.ib(type=float, default=10.0)
+    max_interval = attr.ib(type=float, default=600.0)
+    backoff = attr.ib(type=float, default=2.0)
+    error_hook = attr.ib(
+        type=Callable[[ThreadCursor, Exception], None], default=None, repr=False
+    )
+    clock = attr.ib(type=Callable[[], float], default=time.monotonic, repr=False)
+    sleep = attr.ib(type=Callable[[float], None], default=time.sleep, repr=False)
+
+    _queue = attr.ib(type=list, default=attr.Factory(list), init=False, repr=False)
+    _counter = attr.ib(default=attr.Factory(itertools.count), init=False, repr=False)
+    _last_request = attr.ib(type=float, default=None, init=False, repr=False)
+
+    def __len__(self) -> int:
+        return len(self._queue)
+
+    def _schedule(self, cursor: ThreadCursor):
+        heapq.heappush(self._queue, (cursor.next_poll, next(self._counter), cursor))
+
+    def watch(self, url: str) -> ThreadCursor:
+        """Starts watching a thread.
+
+        Args:
+            url (str): The url of the thread.
+
+        Raises:
+            exceptions.ExtractionError: If the url is not a 4chan thread.
+
+        Returns:
+            ThreadCursor: The cursor of the thread.
+        """
+
+        match = re.match(self.extractor.handles["thread"], url)
+        if match is None:
+            raise exceptions.ExtractionError(f"{url!r} is not a 4chan thread")
+
         matchdict = match.groupdict()
-        content_list = []
-        for (post_type, url_path, quality) in self._content_configs:
-            content_list.append(
-                Content(
-                    uid=(
-                        f'{self.name}-{matchdict["board"]}-raw-{matchdict["id"]}'
-                        f"{post_type}"
-                    ),
-                    source=source,
-                    fragments=[source],
-                    extractor=self,
-                    title=None,
-                    description=None,
-                    quality=quality,
-                    uploaded_by=None,
-                    uploaded_date=None,
-                    metadata=None,
+        cursor = ThreadCursor(
+            source=url,
+            board=matchdict["board"],
+            id=matchdict["id"],
+            interval=self.min_interval,
+            next_poll=self.clock(),
+        )
+        self._schedule(cursor)
+        return cursor
+
+    def poll(self) -> Generator[Tuple[ThreadCursor, ContentGroup], None, None]:
+        """Polls the watched threads until none of them are alive.
+
+        Yields:
+            tuple[ThreadCursor, ContentGroup]: A tuple of the cursor of the
+                thread and the content list of a new post.
+        """
+
+        # NOTE: a dropped connection only fails the poll of a single thread
+        errors = (exceptions.ExtractionError,) + self.extractor.session.errors
+        while len(self._queue) > 0:
+            (next_poll, _, cursor) = heapq.heappop(self._queue)
+            if self._last_request is not None:
+                next_poll = max(next_poll, self._last_request + self.request_interval)
+            delay = next_poll - self.clock()
+            if delay > 0:
+                self.sleep(delay)
+
+            self._last_request = self.clock()
+            try:
+                content_lists = self.extractor.poll_thread(cursor)
+            except errors as exc:
+                if not callable(self.error_hook):
+                    raise
+                self.error_hook(cursor, exc)
+                content_lists = []
+
+            if cursor.is_alive:
+                cursor.interval = (
+                    self.min_interval
+                    if len(content_lists) > 0
+                    else min(cursor.interval * self.backoff, self.max_interval)
+                )
+                cursor.next_poll = self._last_request + cursor.interval
+                self._schedule(cursor)
+
+            for content_list in content_lists:
+                yield (cursor, content_list)
+
+
+class AsyncFourChanExtractor(AsyncBaseExtractor, FourChanExtractor):
+    """The asynchronous extractor for links to media from ``4chan.org``.
+    """
+
+    async def _get_data(self, board: str, id: str) -> Dict[str, Any]:
+        """Asynchronously gets API data for a specific 4chan board and thread id.
+
+        Args:
+            board (str): The id of the passed board
+            id (str): The id of the passed thread
+
+        Raises:
+            exceptions.ExtractionError: When API call results in non 200 status
+
+        Returns:
+            dict[str,....]: API data dictionary response
+        """
+
+        query_url = self._get_query_url(board, id)
+        (status, text) = await self.fetch(query_url)
+        if status not in (200,):
+            raise exceptions.ExtractionError(
+                (
+                    f"error retrieving source for {query_url!r} recieved status "
+                    f"{status}"
                 )
             )
-        yield content_list
+        return ujson.loads(text)
+
+    async def _iter_posts(
+        self, board: str, id: str
+    ) -> AsyncGenerator[Dict[str, Any], None]:
+        """Asynchronously and incrementally gets the API data of a thread's posts.
+
+        Args:
+            board (str): The id of the passed board
+            id (str): The id of the passed thread
+
+        Raises:
+            exceptions.ExtractionError: When API call results in non 200 status
+
+        Yields:
+            dict[str,....]: The API data of each post
+        """
+
+        query_url = self._get_query_url(board, id)
+        (status, chunks) = await self.fetch_stream(query_url)
+        if status not in (200,):
+            raise exceptions.ExtractionError(
+                (
+                    f"error retrieving source for {query_url!r} recieved status "
+                    f"{status}"
+                )
+            )
+        splitter = JSONArraySplitter(["posts"])
+        async for chunk in chunks:
+            for post in splitter.feed(chunk):
+                yield post
+        splitter.close()
+
+    async def handle_thread(
+        self, source: str, match: Match, selector: VariantSelector = DEFAULT_SELECTOR
+    ) -> AsyncGenerator[ContentGroup, None]:
+        """Handles ``thread`` links to 4chan media.
+
+        Args:
+            source (str): The source url
+            match (Match): The source match regex
+            selector (VariantSelector, optional): The variants to build
+
+        Yields:
+            ContentGroup: The various levels of quality content for \
+                the same source url
+        """
+
+        matchdict = match.groupdict()
+        if self.incremental:
+            async for post in self._iter_posts(matchdict["board"], matchdict["id"]):
+                if "md5" in post:
+                    yield self._build_post_content(
+                        source, matchdict["board"], matchdict["id"], post, selector
+                    )
+            return
+
+        data = await self._get_data(matchdict["board"], matchdict["id"])
+        for content_list in self._build_thread_content(
+            source,
+            matchdict["board"],
+            matchdict["id"],
+            data.get("posts", []),
+            selector=selector,
+        ):
+            yield content_list
+
+    async def _get_board_threads(self, board: str) -> List[Dict[str, Any]]:
+        """Asynchronously gets the threads of a board changed since last crawled.
+
+        Args:
+            board (str): The id of the board
+
+        Raises:
+            exceptions.ExtractionError: When API call results in non 200 status
+
+        Returns:
+            list[dict[str,....]]: The API data of the changed threads.
+        """
+
+        import asyncio
+
+        query_url = self._get_board_query_url(board)
+        await asyncio.sleep(self._reserve_request())
+        (status, text) = await self.fetch(query_url)
+        if status not in (200,):
+            raise exceptions.ExtractionError(
+                (
+                    f"error retrieving source for {query_url!r} recieved status "
+                    f"{status}"
+                )
+            )
+        return self._get_changed_threads(board, text)
+
+    async def handle_board(
+        self, source: str, match: Match, selector: VariantSelector = DEFAULT_SELECTOR
+    ) -> AsyncGenerator[ContentGroup, None]:
+        """Handles ``board`` links (and catalogs) to 4chan media.
+
+        Args:
+            source (str): The source url
+            match (Match): The source match regex
+            selector (VariantSelector, optional): The variants to build
+
+        Yields:
+            ContentGroup: The various levels of quality content for \
+                the same post
+        """
+
+        import asyncio
+
+        board = match.groupdict()["board"]
+        threads = iter(await self._get_board_threads(board))
+
+        async def get_data(id: str) -> Dict[str, Any]:
+            await asyncio.sleep(self._reserve_request())
+            return await self._get_data(board, id)
+
+        pending = collections.deque()
+        for thread in itertools.islice(threads, max(1, self.board_prefetch)):
+            pending.append(
+                (thread, asyncio.ensure_future(get_data(str(thread["no"]))))
+            )
+
+        try:
+            while len(pending) > 0:
+                (thread, task) = pending.popleft()
+                for next_thread in itertools.islice(threads, 1):
+                    pending.append(
+                        (
+                            next_thread,
+                            asyncio.ensure_future(get_data(str(next_thread["no"]))),
+                        )
+                    )
+                try:
+                    data = await task
+                except exceptions.ExtractionError:
+                    continue
+
+                id = str(thread["no"])
+                for content_list in self._build_thread_content(
+                    self._get_thread_url(board, id),
+                    board,
+                    id,
+                    data.get("posts", []),
+                    selector=selector,
+                ):
+                    yield content_list
+                self.crawled[f"{board}/{id}"] = thread.get("last_modified")
+        finally:
+            for (_, task) in pending:
+                task.cancel()
+
+    async def handle_raw(
+        self, source: str, match: Match, selector: VariantSelector = DEFAULT_SELECTOR
+    ) -> AsyncGenerator[ContentGroup, None]:
+        """Handles ``raw`` links to 4chan media.
+
+        Args:
+            source (str): The source url
+            match (Match): The source match regex
+            selector (VariantSelector, optional): The variants to build
+
+        Yields:
+            ContentGroup: The various levels of quality content for \
+                the same source url
+        """
+
+        yield self._build_raw_content_list(source, match, selector=selector)
@@ -1,11 +1,11 @@
 # Copyright (c) 2018 Stephen Bunn (stephen@bunn.io)
 # MIT License <https://opensource.org/licenses/MIT>
 
-from typing import List, Match, Generator
+from typing import List, Match, Generator, AsyncGenerator
 
 from ..auth import AuthTypes
-from ._common import BaseExtractor
-from ..content import Content
+from ._common import BaseExtractor, AsyncBaseExtractor
+from ..content import DEFAULT_SELECTOR, Variant, ContentGroup, VariantSelector
 
 
 class GenericExtractor(BaseExtractor):
@@ -21,32 +21,74 @@ class GenericExtractor(BaseExtractor):
     domains = []
     handles = {"all": (r"^https?://(?:www\.)?.*$")}
 
+    def _build_content_list(
+        self, source: str, selector: VariantSelector = DEFAULT_SELECTOR
+    ) -> ContentGroup:
+        """Builds the content group for any link.
+
+        Args:
+            source (str): The source url
+            selector (VariantSelector, optional): The variants to build
+
+        Returns:
+            ContentGroup: The various levels of quality content for \
+                the same source url
+        """
+
+        return ContentGroup(
+            source=source,
+            extractor=self,
+            variants=[
+                Variant(
+                    uid=f"{self.name}-{source}",
+                    fragments=[source],
+                    extension=extension,
+                    quality=0.0,
+                )
+                for extension in selector.select(
+                    [source.split(".")[-1]],
+                    quality=lambda extension: 0.0,
+                    extension=str,
+                )
+            ],
+            metadata=None,
+        )
+
     def handle_all(
-        self, source: str, match: Match
-    ) -> Generator[List[Content], None, None]:
+        self, source: str, match: Match, selector: VariantSelector = DEFAULT_SELECTOR
+    ) -> Generator[ContentGroup, None, None]:
+        """Handles ``all`` links to any media.
+
+        Args:
+            source (str): The source url
+            match (Match): The source match regex
+            selector (VariantSelector, optional): The variants to build
+
+        Yields:
+            ContentGroup: The various levels of quality content for \
+                the same source url
+        """
+
+        yield self._build_content_list(source, selector=selector)
+
+
+class AsyncGenericExtractor(AsyncBaseExtractor, GenericExtractor):
+    """The asynchronous generic extractor that simply extracts to the same url.
+    """
+
+    async def handle_all(
+        self, source: str, match: Match, selector: VariantSelector = DEFAULT_SELECTOR
+    ) -> AsyncGenerator[ContentGroup, None]:
         """Handles ``all`` links to any media.
 
         Args:
             source (str): The source url
             match (Match): The source match regex
+            selector (VariantSelector, optional): The variants to build
 
         Yields:
-            list[Content]: A list of various levels of quality content for \
+            ContentGroup: The various levels of quality content for \
                 the same source url
         """
 
-        yield [
-            Content(
-                uid=f"{self.name}-{source}",
-                source=source,
-                fragments=[source],
-                extractor=self,
-                extension=source.split(".")[-1],
-                title=None,
-                description=None,
-                quality=0.0,
-                uploaded_by=None,
-                uploaded_date=None,
-                metadata=None,
-            )
-        ]
+        yield self._build_content_list(source, selector=selector)
@@ -2,16 +2,26 @@
 # MIT License <https://opensource.org/licenses/MIT>
 
 import datetime
-from typing import Any, Dict, List, Match, Tuple, Generator
+from typing import (
+    Any,
+    Dict,
+    List,
+    Match,
+    Tuple,
+    Optional,
+    Generator,
+    AsyncGenerator,
+    MutableMapping,
+)
 
 from furl import furl
 
 import ujson
 
 from .. import exceptions
-from ..auth import AuthTypes
-from ._common import BaseExtractor
-from ..content import Content
+from ..auth import AuthTypes, TokenCache
+from ._common import BaseExtractor, AsyncBaseExtractor
+from ..content import DEFAULT_SELECTOR, Variant, ContentGroup, VariantSelector
 
 
 class GfycatExtractor(BaseExtractor):
@@ -31,6 +41,8 @@ class GfycatExtractor(BaseExtractor):
         ),
     }
 
+    offline_handles = ("raw",)
+
     _api_base = "https://api.gfycat.com/v1/gfycats/"
     _auth_base = "https://api.gfycat.com/v1/oauth/token/"
     _content_urls = (
@@ -67,94 +79,278 @@ class GfycatExtractor(BaseExtractor):
 
         query_url = furl(self._api_base).add(path=id)
 
-        response = self.session.get(query_url.url)
-        if response.status_code not in (200,):
+        (status, text) = self.fetch(query_url.url)
+        if self._check_token(status, self.session.headers):
+            self.authenticate(self._auth_tuple)
+            (status, text) = self.fetch(query_url.url)
+            self._check_token(status, self.session.headers)
+        if status not in (200,):
             raise exceptions.ExtractionError(
                 (
                     f"error retrieving source for {query_url.url!r}, recieved status "
-                    f"{response.status_code}"
+                    f"{status}"
                 )
             )
-        return ujson.loads(response.text).get("gfyItem")
+        return ujson.loads(text).get("gfyItem")
 
-    def handle_raw(
-        self, source: str, match: Match
-    ) -> Generator[List[Content], None, None]:
-        """Handles ``raw`` links to gfycat media.
+    def _get_token_key(self, auth_tuple: Tuple[str, str]) -> str:
+        return f"{self.name}:{auth_tuple[0]}"
+
+    def _check_token(self, status: int, headers: MutableMapping[str, str]) -> bool:
+        """Drops the extractor's token if a request was rejected with it.
+
+        Args:
+            status (int): The status of the request.
+            headers (MutableMapping[str, str]): The headers the token is sent in.
+
+        Returns:
+            bool: True if the token was rejected and the request can be retried
+                after authenticating again, otherwise False.
+        """
+
+        # a rejected token was revoked early, so a new one must be requested
+        if status != 401 or getattr(self, "_token_key", None) is None:
+            return False
+        TokenCache().invalidate(self._token_key)
+        headers.pop("Authorization", None)
+        return True
+
+    def _get_credentials(self, auth_tuple: Tuple[str, str]) -> str:
+        return ujson.dumps(
+            {
+                "grant_type": "client_credentials",
+                "client_id": auth_tuple[0],
+                "client_secret": auth_tuple[1],
+            }
+        )
+
+    def _get_token(
+        self, auth_tuple: Tuple[str, str], status: int, text: str
+    ) -> Tuple[str, Optional[float]]:
+        """Gets the access token from a credential request's response.
+
+        Args:
+            auth_tuple (tuple[str, str]): The authentication tuple used.
+            status (int): The status of the credential request.
+            text (str): The text of the credential request.
+
+        Raises:
+            exceptions.AuthenticationError: When the credential request failed
+                or returned no access token.
+
+        Returns:
+            tuple[str, float]: A tuple of the access token and the seconds it
+                expires in (None if unknown).
+        """
+
+        if status != 200:
+            raise exceptions.AuthenticationError(
+                f"credential request for client {auth_tuple[0]!r} resulted in non 200 "
+                f"status"
+            )
+        data = ujson.loads(text)
+        token = data.get("access_token", None)
+        if not token:
+            raise exceptions.AuthenticationError(
+                f"credential request for client {auth_tuple[0]!r} resulted in no "
+                f"access token being returned"
+            )
+        return (token, data.get("expires_in"))
+
+    def _build_group(
+        self, source: str, data: Dict[str, Any], variants: List[Variant]
+    ) -> ContentGroup:
+        """Builds the content group of some variants of the given API data.
 
         Args:
             source (str): The source url
-            match (Match): The source match regex
+            data (dict[str,....]): The gfycat API data
+            variants (list[Variant]): The variants of the content
 
-        Yields:
-            list[Content]: A list of various levels of quality content for \
+        Returns:
+            ContentGroup: The various levels of quality content for \
                 the same source url
         """
 
-        data = self._get_data(match.groupdict()["id"])
-        yield [
-            Content(
-                uid=f'{self.name}-{data["gfyId"]}-{source.split(".")[-1]}',
-                source=source,
+        return ContentGroup(
+            source=source,
+            extractor=self,
+            variants=variants,
+            **self._get_shared_fields(data),
+        )
+
+    def _get_shared_fields(self, data: Dict[str, Any]) -> Dict[str, Any]:
+        """Gets the fields shared by the variants of some API data.
+
+        Args:
+            data (dict[str,....]): The gfycat API data
+
+        Returns:
+            dict[str,....]: The shared fields of the gfycat's content group.
+        """
+
+        return dict(
+            title=data.get("title"),
+            description=data.get("description"),
+            uploaded_by=(
+                data.get("userName") if data.get("userName") != "anonymous" else None
+            ),
+            uploaded_date=datetime.datetime.fromtimestamp(int(data.get("createDate"))),
+            metadata=data,
+        )
+
+    def _get_enrich_data(self, id: str) -> Dict[str, Any]:
+        return self._get_data(id)
+
+    def _build_raw_content_list(
+        self,
+        source: str,
+        data: Dict[str, Any],
+        selector: VariantSelector = DEFAULT_SELECTOR,
+    ) -> ContentGroup:
+        """Builds the content group for a raw link from some API data.
+
+        Args:
+            source (str): The source url
+            data (dict[str,....]): The gfycat API data
+            selector (VariantSelector, optional): The variants to build
+
+        Returns:
+            ContentGroup: The various levels of quality content for \
+                the same source url
+        """
+
+        return self._build_group(
+            source, data, self._build_raw_variants(source, data["gfyId"], selector)
+        )
+
+    def _build_raw_variants(
+        self, source: str, id: str, selector: VariantSelector = DEFAULT_SELECTOR
+    ) -> List[Variant]:
+        """Builds the variant of a raw link.
+
+        Args:
+            source (str): The source url
+            id (str): The lowercased gfycat id
+            selector (VariantSelector, optional): The variants to build
+
+        Returns:
+            list[Variant]: The raw link's variant if it is selected.
+        """
+
+        extension = source.split(".")[-1]
+        if not selector.accepts(1.0, extension):
+            return []
+        return [
+            Variant(
+                uid=f"{self.name}-{id}-{extension}",
                 fragments=[source],
-                extractor=self,
-                extension=source.split(".")[-1],
-                title=data.get("title"),
-                description=data.get("description"),
+                extension=extension,
                 quality=1.0,
-                uploaded_by=(
-                    data.get("userName")
-                    if data.get("userName") != "anonymous"
-                    else None
-                ),
-                uploaded_date=datetime.datetime.fromtimestamp(
-                    int(data.get("createDate"))
-                ),
-                metadata=data,
             )
         ]
 
+    def _build_content_list(
+        self,
+        source: str,
+        data: Dict[str, Any],
+        selector: VariantSelector = DEFAULT_SELECTOR,
+    ) -> ContentGroup:
+        """Builds the content group for some API data.
+
+        Args:
+            source (str): The source url
+            data (dict[str,....]): The gfycat API data
+            selector (VariantSelector, optional): The variants to build
+
+        Returns:
+            ContentGroup: The various levels of quality content for \
+                the same source url
+        """
+
+        return self._build_group(
+            source,
+            data,
+            [
+                Variant(
+                    uid=f'{self.name}-{data["gfyId"]}-{url_type}',
+                    fragments=[data.get(url_type)],
+                    extension=data.get(url_type).split(".")[-1],
+                    quality=self._quality_map.get(url_type, 0.0),
+                )
+                for url_type in selector.select(
+                    [
+                        url_type
+                        for url_type in self._content_urls
+                        if isinstance(data.get(url_type), str)
+                    ],
+                    quality=lambda url_type: self._quality_map.get(url_type, 0.0),
+                    extension=lambda url_type: data[url_type].split(".")[-1],
+                )
+            ],
+        )
+
+    def handle_raw(
+        self, source: str, match: Match, selector: VariantSelector = DEFAULT_SELECTOR
+    ) -> Generator[ContentGroup, None, None]:
+        """Handles ``raw`` links to gfycat media.
+
+        Args:
+            source (str): The source url
+            match (Match): The source match regex
+            selector (VariantSelector, optional): The variants to build
+
+        Yields:
+            ContentGroup: The various levels of quality content for \
+                the same source url
+        """
+
+        yield self._build_raw_content_list(
+            source, self._get_data(match.groupdict()["id"]), selector=selector
+        )
+
     def handle_basic(
-        self, source: str, match: Match
-    ) -> Generator[List[Content], None, None]:
+        self, source: str, match: Match, selector: VariantSelector = DEFAULT_SELECTOR
+    ) -> Generator[ContentGroup, None, None]:
         """Handles ``basic`` links to gfycat media.
 
         Args:
             source (str): The source url
             match (Match): The source match regex
+            selector (VariantSelector, optional): The variants to build
 
         Yields:
-            list[Content]: A list of various levels of quality content for \
+            ContentGroup: The various levels of quality content for \
                 the same source url
         """
 
-        data = self._get_data(match.groupdict()["id"])
-        # build and yield content list
-        content_list = []
-        for url_type in self._content_urls:
-            if url_type in data and isinstance(data.get(url_type), str):
-                content_list.append(
-                    Content(
-                        uid=f'{self.name}-{data["gfyId"]}-{url_type}',
-                        source=source,
-                        fragments=[data.get(url_type)],
-                        extractor=self,
-                        extension=data.get(url_type).split(".")[-1],
-                        title=data.get("title"),
-                        description=data.get("description"),
-                        quality=self._quality_map.get(url_type, 0.0),
-                        uploaded_by=(
-                            data.get("userName")
-                            if data.get("userName") != "anonymous"
-                            else None
-                        ),
-                        uploaded_date=datetime.datetime.fromtimestamp(
-                            int(data.get("createDate"))
-                        ),
-                        metadata=data,
-                    )
-                )
-        yield content_list
+        yield self._build_content_list(
+            source, self._get_data(match.groupdict()["id"]), selector=selector
+        )
+
+    def handle_raw_offline(
+        self, source: str, match: Match, selector: VariantSelector = DEFAULT_SELECTOR
+    ) -> Generator[ContentGroup, None, None]:
+        """Handles ``raw`` links to gfycat media without requesting any metadata.
+
+        Args:
+            source (str): The source url
+            match (Match): The source match regex
+            selector (VariantSelector, optional): The variants to build
+
+        Yields:
+            ContentGroup: The content of the raw link itself
+        """
+
+        # gfycat ids are case insensitive, the API lowercases them
+        yield ContentGroup(
+            source=source,
+            extractor=self,
+            variants=self._build_raw_variants(
+                source, match.groupdict()["id"].lower(), selector
+            ),
+            metadata=None,
+        )
 
     def authenticate(self, auth_tuple: Tuple[str, str]):
         """Handles authenticating the extractor if necessary.
@@ -163,21 +359,107 @@ class GfycatExtractor(BaseExtractor):
             auth_tuple (tuple[str, str]): The authentication tuple is available.
         """
 
-        # FIXME: currently very greedy with client_credential requests
-        response = self.session.post(self._auth_base, data=ujson.dumps({
-            "grant_type": "client_credentials",
-            "client_id": auth_tuple[0],
-            "client_secret": auth_tuple[1]
-        }))
-        if response.status_code != 200:
-            raise exceptions.AuthenticationError(
-                f"credential request for client {auth_tuple[0]!r} resulted in non 200 "
-                f"status"
-            )
-        token = ujson.loads(response.text).get("access_token", None)
-        if not token:
-            raise exceptions.AuthenticationError(
-                f"credential request for client {auth_tuple[0]!r} resulted in no "
-                f"access token being returned"
+        def request_token() -> Tuple[str, Optional[float]]:
+            (status, text) = self.fetch(
+                self._auth_base, method="POST", data=self._get_credentials(auth_tuple)
             )
+            return self._get_token(auth_tuple, status, text)
+
+        # tokens are shared by every extractor using the same client
+        self._auth_tuple = auth_tuple
+        self._token_key = self._get_token_key(auth_tuple)
+        token = TokenCache().get(self._token_key, request_token)
         self.session.headers.update({"Authorization": f"Bearer {token}"})
+
+
+class AsyncGfycatExtractor(AsyncBaseExtractor, GfycatExtractor):
+    """The asynchronous extractor for links to media from ``gfycat.com``.
+    """
+
+    async def _get_data(self, id: str) -> Dict[str, Any]:
+        """Asynchronously gets API data for a specific gfycat id.
+
+        Args:
+            id (str): The id of the gfycat content to retrieve.
+
+        Raises:
+            exceptions.ExtractionError: When API call results in non 200 status
+
+        Returns:
+            dict[str,...]: API data dictionary response.
+        """
+
+        query_url = furl(self._api_base).add(path=id)
+
+        (status, text) = await self.fetch(query_url.url)
+        if self._check_token(status, self.headers):
+            await self.authenticate(self._auth_tuple)
+            (status, text) = await self.fetch(query_url.url)
+            self._check_token(status, self.headers)
+        if status not in (200,):
+            raise exceptions.ExtractionError(
+                (
+                    f"error retrieving source for {query_url.url!r}, recieved status "
+                    f"{status}"
+                )
+            )
+        return ujson.loads(text).get("gfyItem")
+
+    async def handle_raw(
+        self, source: str, match: Match, selector: VariantSelector = DEFAULT_SELECTOR
+    ) -> AsyncGenerator[ContentGroup, None]:
+        """Handles ``raw`` links to gfycat media.
+
+        Args:
+            source (str): The source url
+            match (Match): The source match regex
+            selector (VariantSelector, optional): The variants to build
+
+        Yields:
+            ContentGroup: The various levels of quality content for \
+                the same source url
+        """
+
+        yield self._build_raw_content_list(
+            source, await self._get_data(match.groupdict()["id"]), selector=selector
+        )
+
+    async def _get_enrich_data(self, id: str) -> Dict[str, Any]:
+        return await self._get_data(id)
+
+    async def handle_basic(
+        self, source: str, match: Match, selector: VariantSelector = DEFAULT_SELECTOR
+    ) -> AsyncGenerator[ContentGroup, None]:
+        """Handles ``basic`` links to gfycat media.
+
+        Args:
+            source (str): The source url
+            match (Match): The source match regex
+            selector (VariantSelector, optional): The variants to build
+
+        Yields:
+            ContentGroup: The various levels of quality content for \
+                the same source url
+        """
+
+        yield self._build_content_list(
+            source, await self._get_data(match.groupdict()["id"]), selector=selector
+        )
+
+    async def authenticate(self, auth_tuple: Tuple[str, str]):
+        """Handles authenticating the extractor if necessary.
+
+        Args:
+            auth_tuple (tuple[str, str]): The authentication tuple is available.
+        """
+
+        async def request_token() -> Tuple[str, Optional[float]]:
+            (status, text) = await self.fetch(
+                self._auth_base, method="POST", data=self._get_credentials(auth_tuple)
+            )
+            return self._get_token(auth_tuple, status, text)
+
+        self._auth_tuple = auth_tuple
+        self._token_key = self._get_token_key(auth_tuple)
+        token = await TokenCache().aget(self._token_key, request_token)
+        self.headers.update({"Authorization": f"Bearer {token}"})
@@ -2,16 +2,128 @@
 # MIT License <https://opensource.org/licenses/MIT>
 
 import datetime
-from typing import Any, Dict, List, Match, Tuple, Generator
+import threading
+import collections
+from concurrent.futures import FIRST_COMPLETED, ThreadPoolExecutor, wait
+from typing import (
+    Any,
+    Dict,
+    List,
+    Match,
+    Tuple,
+    Optional,
+    Iterator,
+    Generator,
+    AsyncIterator,
+    AsyncGenerator,
+)
 
 from furl import furl
 
+import attr
 import ujson
 
 from .. import exceptions
 from ..auth import AuthTypes
-from ._common import BaseExtractor
-from ..content import Content
+from ..utils import JSONArraySplitter
+from ._common import BaseExtractor, AsyncBaseExtractor
+from ..content import DEFAULT_SELECTOR, Variant, ContentGroup, VariantSelector
+
+
+@attr.s
+class EndpointMemory(object):
+    """Remembers which imgur API endpoint answered for each kind of link.
+
+    Note:
+        Album and raw links are first queried through a specific endpoint
+        (``album/{id}`` or ``gallery/image/{id}``) falling back to the plain
+        ``image/{id}`` endpoint.
+        The endpoint which answered is remembered per id (so a known id costs
+        a single request) and counted per kind of link (so unknown ids try the
+        endpoint which usually answers first).
+
+    Attributes:
+        max_ids (int): The number of most recently seen ids to remember.
+    """
+
+    max_ids = attr.ib(type=int, default=4096)
+
+    _ids = attr.ib(
+        type=collections.OrderedDict,
+        default=attr.Factory(collections.OrderedDict),
+        init=False,
+        repr=False,
+    )
+    _wins = attr.ib(
+        type=collections.defaultdict,
+        default=attr.Factory(lambda: collections.defaultdict(collections.Counter)),
+        init=False,
+        repr=False,
+    )
+    _lock = attr.ib(default=attr.Factory(threading.Lock), init=False, repr=False)
+
+    def get(self, kind: str, id: str) -> Optional[str]:
+        """Gets the endpoint which last answered for an id.
+
+        Args:
+            kind (str): The kind of link the id was given by.
+            id (str): The imgur id.
+
+        Returns:
+            str: The name of the endpoint, or None if the id is unknown.
+        """
+
+        with self._lock:
+            endpoint = self._ids.get((kind, id))
+            if endpoint is not None:
+                self._ids.move_to_end((kind, id))
+            return endpoint
+
+    def order(
+        self, kind: str, id: str, endpoints: List[Tuple[str, str]]
+    ) -> List[Tuple[str, str]]:
+        """Orders the endpoints of an id by how likely they are to answer.
+
+        Args:
+            kind (str): The kind of link the id was given by.
+            id (str): The imgur id.
+            endpoints (list[tuple[str, str]]): The ``(name, url)`` endpoints.
+
+        Returns:
+            list[tuple[str, str]]: The endpoints, most likely first.
+        """
+
+        known = self.get(kind, id)
+        with self._lock:
+            wins = self._wins[kind]
+            return sorted(
+                endpoints,
+                key=lambda endpoint: (endpoint[0] != known, -wins[endpoint[0]]),
+            )
+
+    def record(self, kind: str, id: str, endpoint: str):
+        """Records the endpoint which answered for an id.
+
+        Args:
+            kind (str): The kind of link the id was given by.
+            id (str): The imgur id.
+            endpoint (str): The name of the endpoint.
+        """
+
+        with self._lock:
+            self._wins[kind][endpoint] += 1
+            self._ids[(kind, id)] = endpoint
+            self._ids.move_to_end((kind, id))
+            while len(self._ids) > self.max_ids:
+                self._ids.popitem(last=False)
+
+    def clear(self):
+        """Forgets every remembered endpoint.
+        """
+
+        with self._lock:
+            self._ids.clear()
+            self._wins.clear()
 
 
 class ImgurExtractor(BaseExtractor):
@@ -35,15 +147,94 @@ class ImgurExtractor(BaseExtractor):
         ),
     }
 
+    offline_handles = ("raw",)
+    # the endpoints which answered, shared by every imgur extractor
+    endpoint_memory = EndpointMemory()
+    # if True, the endpoints of unknown ids are requested at the same time
+    race_endpoints = False
+
     _api_base = "https://api.imgur.com/3"
     _content_urls = ("mp4", "gifv", "link")
     _quality_map = {"mp4": 1.0, "gifv": 0.5, "link": 0.0}
 
+    def _get_query_urls(
+        self, id: str, is_album: bool = False, is_raw: bool = False
+    ) -> Tuple[str, str]:
+        """Gets the API urls for a specific imgur id.
+
+        Args:
+            id (str): The id of the imgur content to retrieve.
+            is_album (bool, optional): If True, indicates that id is that of
+                an album.
+            is_raw (bool, optional): If True, indicates that id is that of
+                some raw imgur link.
+
+        Returns:
+            tuple[str, str]: A tuple of the query url and the default url to
+                fall back to.
+        """
+
+        default_url = furl(self._api_base).add(path=f"image/{id}")
+        query_url = furl(self._api_base).add(
+            path=(
+                f'{"/gallery/" if is_raw else ""}'
+                f'{"album" if is_album else "image"}/{id}'
+            )
+        )
+        return (query_url.url, default_url.url)
+
+    @property
+    def max_connections(self) -> int:
+        """The most connections a single extraction makes to a host at once.
+
+        Returns:
+            int: The number of concurrent connections, two (the query and
+                default endpoints) if :attr:`~ImgurExtractor.race_endpoints` is
+                True.
+        """
+
+        return 2 if self.race_endpoints else 1
+
+    def _get_kind(self, is_album: bool = False, is_raw: bool = False) -> str:
+        return "album" if is_album else ("raw" if is_raw else "basic")
+
+    def _get_endpoints(
+        self, id: str, is_album: bool = False, is_raw: bool = False
+    ) -> List[Tuple[str, str]]:
+        """Gets the API endpoints for a specific imgur id, most likely first.
+
+        Args:
+            id (str): The id of the imgur content to retrieve.
+            is_album (bool, optional): If True, indicates that id is that of
+                an album.
+            is_raw (bool, optional): If True, indicates that id is that of
+                some raw imgur link.
+
+        Returns:
+            list[tuple[str, str]]: The ``(name, url)`` endpoints to request.
+        """
+
+        (query_url, default_url) = self._get_query_urls(
+            id, is_album=is_album, is_raw=is_raw
+        )
+        if query_url == default_url:
+            return [("query", query_url)]
+        return self.endpoint_memory.order(
+            self._get_kind(is_album=is_album, is_raw=is_raw),
+            id,
+            [("query", query_url), ("default", default_url)],
+        )
+
     def _get_data(
         self, id: str, is_album: bool = False, is_raw: bool = False
     ) -> Dict[str, Any]:
         """Gets API data for a specific imgur id.
 
+        Note:
+            The endpoints of an id are requested one after the other (or at
+            the same time if :attr:`~ImgurExtractor.race_endpoints` is True)
+            in the order given by the :attr:`~ImgurExtractor.endpoint_memory`.
+
         Args:
             id (str): The id of the imgur content to retrieve.
             is_album (bool, optional): If True, indicates that id is that of
@@ -58,140 +249,349 @@ class ImgurExtractor(BaseExtractor):
             dict[str,....]: API data dictionary response
         """
 
-        default_url = furl(self._api_base).add(path=f"image/{id}")
-        query_url = furl(self._api_base).add(
-            path=(
-                f'{"/gallery/" if is_raw else ""}'
-                f'{"album" if is_album else "image"}/{id}'
+        kind = self._get_kind(is_album=is_album, is_raw=is_raw)
+        endpoints = self._get_endpoints(id, is_album=is_album, is_raw=is_raw)
+        if (
+            self.race_endpoints
+            and len(endpoints) > 1
+            and self.endpoint_memory.get(kind, id) is None
+        ):
+            (endpoint, status, text) = self._race_endpoints(endpoints)
+        else:
+            for (endpoint, url) in endpoints:
+                (status, text) = self.fetch(url)
+                if status in (200,):
+                    break
+
+        if status not in (200,):
+            raise exceptions.ExtractionError(
+                (
+                    f"error retrieving source for {endpoints[0][1]!r} recieved "
+                    f"status {status}"
+                )
+            )
+        self.endpoint_memory.record(kind, id, endpoint)
+        return ujson.loads(text).get("data")
+
+    def _race_endpoints(self, endpoints: List[Tuple[str, str]]) -> Tuple[str, int, str]:
+        """Requests several endpoints at once, keeping the first to answer.
+
+        Note:
+            Endpoints which have not been requested yet once one answers are
+            cancelled, the responses of the others are closed without reading
+            their bodies (or updating the cache).
+            Endpoints failing without a response (such as timeouts) only lose
+            the race, like endpoints answering with an error status.
+
+        Args:
+            endpoints (list[tuple[str, str]]): The ``(name, url)`` endpoints.
+
+        Raises:
+            Exception: The error of the last endpoint to fail, if every
+                endpoint failed without a response.
+
+        Returns:
+            tuple[str, int, str]: A tuple of the name of the endpoint which
+                answered (or the last to fail with a status), the status and
+                the text.
+        """
+
+        if not hasattr(self, "_race_executor"):
+            # NOTE: shared by every race of the extractor, so lookups never
+            # start (or leave behind) threads of their own
+            self._race_executor = ThreadPoolExecutor(
+                max_workers=self.max_connections,
+                thread_name_prefix=f"{self.name}-race",
+            )
+        finished = threading.Event()
+        pending = {
+            self._race_executor.submit(self.fetch, url, cancel=finished): endpoint
+            for (endpoint, url) in endpoints
+        }
+        (failure, error) = (None, None)
+        try:
+            while len(pending) > 0:
+                (done, _) = wait(pending.keys(), return_when=FIRST_COMPLETED)
+                for future in done:
+                    endpoint = pending.pop(future)
+                    try:
+                        (status, text) = future.result()
+                    except self.session.errors as exc:
+                        error = exc
+                        continue
+                    if status in (200,):
+                        return (endpoint, status, text)
+                    failure = (endpoint, status, text)
+        finally:
+            finished.set()
+            for future in pending.keys():
+                future.cancel()
+
+        if failure is None:
+            raise error
+        return failure
+
+    def _build_variants(
+        self, data: Dict[str, Any], selector: VariantSelector = DEFAULT_SELECTOR
+    ) -> List[Variant]:
+        """Builds the selected quality variants of some image API data.
+
+        Args:
+            data (dict[str,....]): The image API data
+            selector (VariantSelector, optional): The variants to build
+
+        Returns:
+            list[Variant]: The variants of the image.
+        """
+
+        url_types = selector.select(
+            [url_type for url_type in self._content_urls if url_type in data],
+            quality=lambda url_type: self._quality_map.get(url_type, 0.0),
+            extension=lambda url_type: data[url_type].split(".")[-1],
+        )
+        return [
+            Variant(
+                uid=f'{self.name}-{data["id"]}-{url_type}',
+                fragments=[data[url_type]],
+                extension=data[url_type].split(".")[-1],
+                quality=self._quality_map.get(url_type, 0.0),
             )
+            for url_type in url_types
+        ]
+
+    def _build_content_list(
+        self,
+        source: str,
+        data: Dict[str, Any],
+        selector: VariantSelector = DEFAULT_SELECTOR,
+    ) -> ContentGroup:
+        """Builds the content group for some image API data.
+
+        Args:
+            source (str): The source url
+            data (dict[str,....]): The image API data
+            selector (VariantSelector, optional): The variants to build
+
+        Returns:
+            ContentGroup: The various levels of quality content for \
+                the same source url
+        """
+
+        return ContentGroup(
+            source=source,
+            extractor=self,
+            variants=self._build_variants(data, selector=selector),
+            **self._get_shared_fields(data),
         )
-        response = self.session.get(query_url.url)
-        if response.status_code not in (200,):
-            response = self.session.get(default_url.url)
-            if response.status_code not in (200,):
-                raise exceptions.ExtractionError(
-                    (
-                        f"error retrieving source for {query_url.url!r} recieved "
-                        f"status {response.status_code}"
-                    )
-                )
-        return ujson.loads(response.text).get("data")
+
+    def _get_shared_fields(self, data: Dict[str, Any]) -> Dict[str, Any]:
+        """Gets the fields shared by the variants of some image API data.
+
+        Args:
+            data (dict[str,....]): The image API data
+
+        Returns:
+            dict[str,....]: The shared fields of the image's content group.
+        """
+
+        return dict(
+            title=data.get("title"),
+            description=data.get("description"),
+            uploaded_by=data.get("account_id"),
+            uploaded_date=datetime.datetime.fromtimestamp(int(data.get("datetime"))),
+            metadata=data,
+        )
+
+    def _get_enrich_data(self, id: str) -> Dict[str, Any]:
+        return self._get_data(id, is_raw=True)
+
+    def _build_album_image(
+        self,
+        source: str,
+        data: Dict[str, Any],
+        image: Dict[str, Any],
+        selector: VariantSelector = DEFAULT_SELECTOR,
+    ) -> ContentGroup:
+        """Builds the content group for a single image of an album.
+
+        Args:
+            source (str): The source url
+            data (dict[str,....]): The album API data
+            image (dict[str,....]): The image API data
+            selector (VariantSelector, optional): The variants to build
+
+        Returns:
+            ContentGroup: The various levels of quality content for \
+                the same image
+        """
+
+        return ContentGroup(
+            source=source,
+            extractor=self,
+            variants=self._build_variants(image, selector=selector),
+            title=data.get("title"),
+            description=data.get("description"),
+            uploaded_by=data.get("account_id"),
+            uploaded_date=(
+                datetime.datetime.fromtimestamp(int(data["datetime"]))
+                if data.get("datetime") is not None
+                else None
+            ),
+            metadata=image,
+        )
+
+    def _build_album_content(
+        self,
+        source: str,
+        data: Dict[str, Any],
+        selector: VariantSelector = DEFAULT_SELECTOR,
+    ) -> Generator[ContentGroup, None, None]:
+        """Builds the content groups for some album API data.
+
+        Args:
+            source (str): The source url
+            data (dict[str,....]): The album API data
+            selector (VariantSelector, optional): The variants to build
+
+        Yields:
+            ContentGroup: The various levels of quality content for \
+                the same source url
+        """
+
+        for image in data.get("images", []):
+            yield self._build_album_image(source, data, image, selector=selector)
+
+    def _get_album_stream(self, id: str) -> Iterator[str]:
+        """Gets the streamed API response of a specific imgur album id.
+
+        Args:
+            id (str): The id of the imgur album to retrieve.
+
+        Raises:
+            exceptions.ExtractionError: When API call results in non 200 status
+
+        Returns:
+            iterator[str]: The chunks of the API response
+        """
+
+        (query_url, _) = self._get_query_urls(id, is_album=True)
+        (status, chunks) = self.fetch_stream(query_url)
+        if status not in (200,):
+            raise exceptions.ExtractionError(
+                f"error retrieving source for {query_url!r} recieved status {status}"
+            )
+        return chunks
 
     def handle_basic(
-        self, source: str, match: Match
-    ) -> Generator[List[Content], None, None]:
+        self, source: str, match: Match, selector: VariantSelector = DEFAULT_SELECTOR
+    ) -> Generator[ContentGroup, None, None]:
         """Handles ``basic`` links to imgur media.
 
         Args:
             source (str): The source url
             match (Match): The source match regex
+            selector (VariantSelector, optional): The variants to build
 
         Yields:
-            list[Content]: A list of various levels of quality content for \
+            ContentGroup: The various levels of quality content for \
                 the same source url
         """
 
-        data = self._get_data(match.groupdict()["id"])
-        content_list = []
-        for url_type in self._content_urls:
-            if url_type in data:
-                content_list.append(
-                    Content(
-                        uid=f'{self.name}-{data["id"]}-{url_type}',
-                        source=source,
-                        fragments=[data[url_type]],
-                        extractor=self,
-                        extension=data[url_type].split(".")[-1],
-                        title=data.get("title"),
-                        description=data.get("description"),
-                        quality=self._quality_map.get(url_type, 0.0),
-                        uploaded_by=data.get("account_id"),
-                        uploaded_date=datetime.datetime.fromtimestamp(
-                            int(data.get("datetime"))
-                        ),
-                        metadata=data,
-                    )
-                )
-        yield content_list
+        yield self._build_content_list(
+            source, self._get_data(match.groupdict()["id"]), selector=selector
+        )
 
     def handle_album(
-        self, source: str, match: Match
-    ) -> Generator[List[Content], None, None]:
+        self, source: str, match: Match, selector: VariantSelector = DEFAULT_SELECTOR
+    ) -> Generator[ContentGroup, None, None]:
         """Handles ``album`` links to imgur media.
 
         Args:
             source (str): The source url
             match (Match): The source match regex
+            selector (VariantSelector, optional): The variants to build
 
         Yields:
-            list[Content]: A list of various levels of quality content for \
+            ContentGroup: The various levels of quality content for \
                 the same source url
         """
 
         try:
-            data = self._get_data(match.groupdict()["id"], is_album=True)
-            for image in data.get("images", []):
-                content_list = []
-                for url_type in self._content_urls:
-                    if url_type in image:
-                        content_list.append(
-                            Content(
-                                uid=f'{self.name}-{image["id"]}-{url_type}',
-                                source=source,
-                                fragments=[image[url_type]],
-                                extractor=self,
-                                extension=image[url_type].split(".")[-1],
-                                title=data.get("title"),
-                                description=data.get("description"),
-                                quality=self._quality_map.get(url_type, 0.0),
-                                uploaded_by=data.get("account_id"),
-                                uploaded_date=datetime.datetime.fromtimestamp(
-                                    int(data.get("datetime"))
-                                ),
-                                metadata=image,
-                            )
-                        )
-                yield content_list
-        except exceptions.ExtractionError as exc:
-            for content_list in self.handle_basic(source, match):
+            if self.incremental:
+                chunks = self._get_album_stream(match.groupdict()["id"])
+            else:
+                data = self._get_data(match.groupdict()["id"], is_album=True)
+        except exceptions.ExtractionError:
+            for content_list in self.handle_basic(source, match, selector=selector):
                 yield content_list
+            return
+
+        if not self.incremental:
+            yield from self._build_album_content(source, data, selector=selector)
+            return
+
+        # images are built as soon as they are parsed, the album fields (which
+        # the API lists before the images) are gathered by the splitter
+        splitter = JSONArraySplitter(["data", "images"])
+        for chunk in chunks:
+            for image in splitter.feed(chunk):
+                yield self._build_album_image(
+                    source, splitter.siblings, image, selector=selector
+                )
+        splitter.close()
 
     def handle_raw(
-        self, source: str, match: Match
-    ) -> Generator[List[Content], None, None]:
+        self, source: str, match: Match, selector: VariantSelector = DEFAULT_SELECTOR
+    ) -> Generator[ContentGroup, None, None]:
         """Handles ``raw`` links to imgur media.
 
         Args:
             source (str): The source url
             match (Match): The source match regex
+            selector (VariantSelector, optional): The variants to build
 
         Yields:
-            list[Content]: A list of various levels of quality content for \
+            ContentGroup: The various levels of quality content for \
                 the same source url
         """
 
-        data = self._get_data(match.groupdict()["id"], is_raw=True)
-        content_list = []
-        for url_type in self._content_urls:
-            if url_type in data:
-                content_list.append(
-                    Content(
-                        uid=f'{self.name}-{data["id"]}-{url_type}',
-                        source=source,
-                        fragments=[data[url_type]],
-                        extractor=self,
-                        extension=data[url_type].split(".")[-1],
-                        title=data.get("title"),
-                        description=data.get("description"),
-                        quality=self._quality_map.get(url_type, 0.0),
-                        uploaded_by=data.get("account_id"),
-                        uploaded_date=datetime.datetime.fromtimestamp(
-                            int(data.get("timestamp"))
-                        ),
-                        meatdata=data,
-                    )
+        yield self._build_content_list(
+            source,
+            self._get_data(match.groupdict()["id"], is_raw=True),
+            selector=selector,
+        )
+
+    def handle_raw_offline(
+        self, source: str, match: Match, selector: VariantSelector = DEFAULT_SELECTOR
+    ) -> Generator[ContentGroup, None, None]:
+        """Handles ``raw`` links to imgur media without requesting any metadata.
+
+        Args:
+            source (str): The source url
+            match (Match): The source match regex
+            selector (VariantSelector, optional): The variants to build
+
+        Yields:
+            ContentGroup: The content of the raw link itself
+        """
+
+        (id, extension) = (match.groupdict()["id"], source.split(".")[-1])
+        quality = self._quality_map.get(extension, 0.0)
+        yield ContentGroup(
+            source=source,
+            extractor=self,
+            variants=[
+                Variant(
+                    uid=f"{self.name}-{id}-{extension}",
+                    fragments=[source],
+                    extension=extension,
+                    quality=quality,
                 )
-        yield content_list
+            ]
+            if selector.accepts(quality, extension)
+            else [],
+            metadata=None,
+        )
 
     def authenticate(self, auth_tuple: Tuple[str, str]):
         """Handles authenticating the extractor if necessary.
@@ -201,3 +601,220 @@ class ImgurExtractor(BaseExtractor):
         """
 
         self.session.headers.update({"Authorization": f"Client-ID {auth_tuple[0]}"})
+
+
+class AsyncImgurExtractor(AsyncBaseExtractor, ImgurExtractor):
+    """The asynchronous extractor for links to media from ``imgur.com``.
+    """
+
+    async def _get_data(
+        self, id: str, is_album: bool = False, is_raw: bool = False
+    ) -> Dict[str, Any]:
+        """Asynchronously gets API data for a specific imgur id.
+
+        Args:
+            id (str): The id of the imgur content to retrieve.
+            is_album (bool, optional): If True, indicates that id is that of
+                an album.
+            is_raw (bool, optional): If True, indicates that id is that of
+                some raw imgur link.
+
+        Raises:
+            exceptions.ExtractionError: When API call results in non 200 status
+
+        Returns:
+            dict[str,....]: API data dictionary response
+        """
+
+        kind = self._get_kind(is_album=is_album, is_raw=is_raw)
+        endpoints = self._get_endpoints(id, is_album=is_album, is_raw=is_raw)
+        if (
+            self.race_endpoints
+            and len(endpoints) > 1
+            and self.endpoint_memory.get(kind, id) is None
+        ):
+            (endpoint, status, text) = await self._race_endpoints(endpoints)
+        else:
+            for (endpoint, url) in endpoints:
+                (status, text) = await self.fetch(url)
+                if status in (200,):
+                    break
+
+        if status not in (200,):
+            raise exceptions.ExtractionError(
+                (
+                    f"error retrieving source for {endpoints[0][1]!r} recieved "
+                    f"status {status}"
+                )
+            )
+        self.endpoint_memory.record(kind, id, endpoint)
+        return ujson.loads(text).get("data")
+
+    async def _race_endpoints(
+        self, endpoints: List[Tuple[str, str]]
+    ) -> Tuple[str, int, str]:
+        """Asynchronously requests several endpoints at once, keeping the first.
+
+        Note:
+            The requests of the other endpoints are cancelled once one answers.
+            Endpoints failing without a response (such as timeouts) only lose
+            the race, like endpoints answering with an error status.
+
+        Args:
+            endpoints (list[tuple[str, str]]): The ``(name, url)`` endpoints.
+
+        Raises:
+            Exception: The error of the last endpoint to fail, if every
+                endpoint failed without a response.
+
+        Returns:
+            tuple[str, int, str]: A tuple of the name of the endpoint which
+                answered (or the last to fail with a status), the status and
+                the text.
+        """
+
+        import asyncio
+        import aiohttp
+
+        pending = {
+            asyncio.ensure_future(self.fetch(url)): endpoint
+            for (endpoint, url) in endpoints
+        }
+        (failure, error) = (None, None)
+        try:
+            while len(pending) > 0:
+                (done, _) = await asyncio.wait(
+                    pending.keys(), return_when=asyncio.FIRST_COMPLETED
+                )
+                for task in done:
+                    endpoint = pending.pop(task)
+                    try:
+                        (status, text) = task.result()
+                    except (aiohttp.ClientError, asyncio.TimeoutError) as exc:
+                        error = exc
+                        continue
+                    if status in (200,):
+                        return (endpoint, status, text)
+                    failure = (endpoint, status, text)
+        finally:
+            for task in pending.keys():
+                task.cancel()
+
+        if failure is None:
+            raise error
+        return failure
+
+    async def _get_enrich_data(self, id: str) -> Dict[str, Any]:
+        return await self._get_data(id, is_raw=True)
+
+    async def _get_album_stream(self, id: str) -> AsyncIterator[str]:
+        """Asynchronously gets the streamed API response of an imgur album id.
+
+        Args:
+            id (str): The id of the imgur album to retrieve.
+
+        Raises:
+            exceptions.ExtractionError: When API call results in non 200 status
+
+        Returns:
+            async iterator[str]: The chunks of the API response
+        """
+
+        (query_url, _) = self._get_query_urls(id, is_album=True)
+        (status, chunks) = await self.fetch_stream(query_url)
+        if status not in (200,):
+            raise exceptions.ExtractionError(
+                f"error retrieving source for {query_url!r} recieved status {status}"
+            )
+        return chunks
+
+    async def handle_basic(
+        self, source: str, match: Match, selector: VariantSelector = DEFAULT_SELECTOR
+    ) -> AsyncGenerator[ContentGroup, None]:
+        """Handles ``basic`` links to imgur media.
+
+        Args:
+            source (str): The source url
+            match (Match): The source match regex
+            selector (VariantSelector, optional): The variants to build
+
+        Yields:
+            ContentGroup: The various levels of quality content for \
+                the same source url
+        """
+
+        yield self._build_content_list(
+            source, await self._get_data(match.groupdict()["id"]), selector=selector
+        )
+
+    async def handle_album(
+        self, source: str, match: Match, selector: VariantSelector = DEFAULT_SELECTOR
+    ) -> AsyncGenerator[ContentGroup, None]:
+        """Handles ``album`` links to imgur media.
+
+        Args:
+            source (str): The source url
+            match (Match): The source match regex
+            selector (VariantSelector, optional): The variants to build
+
+        Yields:
+            ContentGroup: The various levels of quality content for \
+                the same source url
+        """
+
+        try:
+            if self.incremental:
+                chunks = await self._get_album_stream(match.groupdict()["id"])
+            else:
+                data = await self._get_data(match.groupdict()["id"], is_album=True)
+        except exceptions.ExtractionError:
+            async for content_list in self.handle_basic(
+                source, match, selector=selector
+            ):
+                yield content_list
+            return
+
+        if not self.incremental:
+            for content_list in self._build_album_content(
+                source, data, selector=selector
+            ):
+                yield content_list
+            return
+
+        splitter = JSONArraySplitter(["data", "images"])
+        async for chunk in chunks:
+            for image in splitter.feed(chunk):
+                yield self._build_album_image(
+                    source, splitter.siblings, image, selector=selector
+                )
+        splitter.close()
+
+    async def handle_raw(
+        self, source: str, match: Match, selector: VariantSelector = DEFAULT_SELECTOR
+    ) -> AsyncGenerator[ContentGroup, None]:
+        """Handles ``raw`` links to imgur media.
+
+        Args:
+            source (str): The source url
+            match (Match): The source match regex
+            selector (VariantSelector, optional): The variants to build
+
+        Yields:
+            ContentGroup: The various levels of quality content for \
+                the same source url
+        """
+
+        yield self._build_content_list(
+            source,
+            await self._get_data(match.groupdict()["id"], is_raw=True),
+            selector=selector,
+        )
+
+    async def authenticate(self, auth_tuple: Tuple[str, str]):
+        """Handles authenticating the extractor if necessary.
+
+        Args:
+            auth_tuple (tuple[str, str]): The authentication tuple is available.
+        """
+
+        self.headers.update({"Authorization": f"Client-ID {auth_tuple[0]}"})
@@ -0,0 +1,167 @@
+# Copyright (c) 2018 Stephen Bunn (stephen@bunn.io)
+# MIT License <https://opensource.org/licenses/MIT>
+
+import importlib
+from typing import Any, List, Tuple
+
+import attr
+
+EXTRACTORS_GROUP = "qetch.extractors"
+DOWNLOADERS_GROUP = "qetch.downloaders"
+
+
+@attr.s
+class Plugin(object):
+    """A lazily imported extractor or downloader.
+
+    Note:
+        The ``domains`` and ``schemes`` of a plugin are declared up front so the
+        plugin can be indexed without importing its module.
+        If they are None, they are only known once the plugin is loaded.
+
+    Attributes:
+        name (str): The name of the plugin.
+        target (str): The ``module:attribute`` path of the plugin's class.
+        domains (tuple[str], optional): The domains the extractor handles.
+        schemes (tuple[str], optional): The fragment schemes the downloader
+            handles.
+        async_target (str, optional): The ``module:attribute`` path of the
+            plugin's asynchronous counterpart class.
+    """
+
+    name = attr.ib(type=str)
+    target = attr.ib(type=str)
+    domains = attr.ib(type=Tuple[str], default=None, repr=False)
+    schemes = attr.ib(type=Tuple[str], default=None, repr=False)
+    async_target = attr.ib(type=str, default=None, repr=False)
+
+    _loaded = attr.ib(type=type, default=None, init=False, repr=False)
+
+    @classmethod
+    def from_class(cls, plugin_class: type) -> "Plugin":
+        """Creates an already loaded plugin from an extractor or downloader class.
+
+        Args:
+            plugin_class (type): The class of the plugin.
+
+        Returns:
+            Plugin: The loaded plugin.
+        """
+
+        plugin = cls(
+            name=getattr(plugin_class, "name", plugin_class.__name__),
+            target=f"{plugin_class.__module__}:{plugin_class.__qualname__}",
+            domains=tuple(getattr(plugin_class, "domains", ())),
+            schemes=tuple(getattr(plugin_class, "schemes", ())),
+        )
+        plugin._loaded = plugin_class
+        return plugin
+
+    @property
+    def attribute(self) -> str:
+        """The name of the plugin's class in its module.
+
+        Returns:
+            str: The name of the plugin's class.
+        """
+
+        return self.target.split(":")[-1]
+
+    @property
+    def is_loaded(self) -> bool:
+        """Indicates if the plugin's module has been imported.
+
+        Returns:
+            bool: True if the plugin is loaded, otherwise False.
+        """
+
+        return self._loaded is not None
+
+    @staticmethod
+    def _import(target: str) -> type:
+        (module_name, attribute) = target.split(":")
+        plugin_class = importlib.import_module(module_name)
+        for name in attribute.split("."):
+            plugin_class = getattr(plugin_class, name)
+        return plugin_class
+
+    def load_async(self) -> type:
+        """Imports and returns the plugin's asynchronous counterpart class.
+
+        Raises:
+            NotImplementedError: If the plugin has no asynchronous counterpart.
+
+        Returns:
+            type: The plugin's asynchronous counterpart class.
+        """
+
+        if self.async_target is None:
+            raise NotImplementedError(
+                f"no asynchronous counterpart is available for {self!r}"
+            )
+        return self._import(self.async_target)
+
+    def load(self) -> type:
+        """Imports and returns the plugin's class.
+
+        Returns:
+            type: The plugin's class.
+        """
+
+        if self._loaded is None:
+            plugin_class = self._import(self.target)
+            if self.domains is None:
+                self.domains = tuple(getattr(plugin_class, "domains", ()))
+            if self.schemes is None:
+                self.schemes = tuple(getattr(plugin_class, "schemes", ()))
+            self._loaded = plugin_class
+        return self._loaded
+
+
+def get_entry_points(group: str) -> List[Any]:
+    """Gets the installed entry points for a given group.
+
+    Args:
+        group (str): The group of the entry points.
+
+    Returns:
+        list[EntryPoint]: The installed entry points.
+    """
+
+    from importlib import metadata
+
+    entry_points = metadata.entry_points()
+    if hasattr(entry_points, "select"):
+        return list(entry_points.select(group=group))
+    return list(entry_points.get(group, []))
+
+
+def discover(group: str) -> List[Plugin]:
+    """Discovers the plugins installed through entry points for a given group.
+
+    Note:
+        Plugins provided through entry points do not declare their domains or
+        schemes, so they are imported the first time they are indexed.
+
+    Args:
+        group (str): The group of the entry points, either
+            :data:`EXTRACTORS_GROUP` or :data:`DOWNLOADERS_GROUP`.
+
+    Returns:
+        list[Plugin]: The discovered plugins.
+
+    Examples:
+        A package can provide an extractor by declaring an entry point in its
+        ``setup.py``...
+
+        >>> setuptools.setup(
+        ...     entry_points={
+        ...         "qetch.extractors": ["example = example.extractor:ExampleExtractor"]
+        ...     }
+        ... )
+    """
+
+    return [
+        Plugin(name=entry_point.name, target=entry_point.value)
+        for entry_point in get_entry_points(group)
+    ]
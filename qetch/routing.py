@@ -0,0 +1,567 @@
+# Copyright (c) 2018 Stephen Bunn (stephen@bunn.io)
+# MIT License <https://opensource.org/licenses/MIT>
+
+from __future__ import annotations
+
+import re
+import queue
+import functools
+import threading
+import collections
+from typing import (
+    TYPE_CHECKING,
+    Any,
+    List,
+    Type,
+    Match,
+    Tuple,
+    Union,
+    Pattern,
+    Callable,
+    Hashable,
+    Iterable,
+    Iterator,
+    Optional,
+)
+from urllib.parse import urlsplit
+from concurrent.futures import Future, Executor
+
+import attr
+
+from .plugins import Plugin
+from .extractors._common import BaseExtractor
+
+if TYPE_CHECKING:
+    from .content import Content
+    from .downloaders._common import BaseDownloader
+
+Route = Tuple[Type[BaseExtractor], str, Match]
+
+
+def get_host(url: str) -> Optional[str]:
+    """Gets the normalized host of a given url.
+
+    Args:
+        url (str): The url to get the host of.
+
+    Returns:
+        str: The lowercased host without a leading ``www.``, or None if the url
+            has no host.
+    """
+
+    try:
+        host = urlsplit(url).hostname
+    except ValueError:
+        return None
+    if not host:
+        return None
+    return host[4:] if host.startswith("www.") else host
+
+
+def iter_domains(host: str) -> Iterable[str]:
+    """Iterates over the domains a host belongs to, most specific first.
+
+    Args:
+        host (str): The host to iterate the domains of.
+
+    Yields:
+        str: The host followed by each of its parent domains.
+
+    Examples:
+        >>> list(iter_domains("i.imgur.com"))
+        ['i.imgur.com', 'imgur.com', 'com']
+    """
+
+    yield host
+    index = host.find(".")
+    while index >= 0:
+        yield host[index + 1:]
+        index = host.find(".", index + 1)
+
+
+def get_group(plugin: Plugin, url: str) -> Union[Tuple[str], str]:
+    """Gets the domain group a url handled by a given extractor plugin belongs to.
+
+    Args:
+        plugin (Plugin): The extractor plugin handling the url.
+        url (str): The url to get the domain group of.
+
+    Returns:
+        tuple[str] or str: The domains of the plugin, or the host of the url if
+            the plugin declares no domains (such as the fallback extractor).
+    """
+
+    return plugin.domains or get_host(url)
+
+
+def as_plugin(plugin: Union[Plugin, type]) -> Plugin:
+    """Ensures a given plugin or class is a plugin.
+
+    Args:
+        plugin (Plugin or type): The plugin or extractor/downloader class.
+
+    Returns:
+        Plugin: The given plugin, or an already loaded plugin for the class.
+    """
+
+    return plugin if isinstance(plugin, Plugin) else Plugin.from_class(plugin)
+
+
+@attr.s
+class Router(object):
+    """An index of extractor handles keyed by the domains they serve.
+
+    Routing a url only tests the handles of extractors which declare the url's
+    host (or one of its parent domains) in their
+    :attr:`~qetch.extractors._common.BaseExtractor.domains`.
+    An extractor's module is only imported (and its handle patterns compiled)
+    the first time one of its domains is routed to.
+
+    Attributes:
+        fallback (Plugin, optional): The extractor tried when no indexed
+            extractor can handle a url.
+        discover (callable, optional): A callable returning additional plugins
+            which is called the first time a url is routed.
+    """
+
+    fallback = attr.ib(
+        type=Plugin, default=None, converter=attr.converters.optional(as_plugin)
+    )
+    discover = attr.ib(type=Callable[[], List[Plugin]], default=None, repr=False)
+
+    _index = attr.ib(type=dict, default=attr.Factory(dict), init=False, repr=False)
+    _patterns = attr.ib(type=dict, default=attr.Factory(dict), init=False, repr=False)
+
+    @classmethod
+    def build(
+        cls,
+        extractors: Iterable[Union[Plugin, Type[BaseExtractor]]],
+        fallback: Union[Plugin, Type[BaseExtractor]] = None,
+        discover: Callable[[], List[Plugin]] = None,
+    ) -> Router:
+        """Builds a new router for some extractor plugins or classes.
+
+        Args:
+            extractors (list[Plugin or type[BaseExtractor]]): The extractor
+                plugins or classes to index.
+            fallback (Plugin or type[BaseExtractor], optional): The extractor to
+                try when no indexed extractor can handle a url.
+            discover (callable, optional): A callable returning additional
+                plugins to index the first time a url is routed.
+
+        Returns:
+            Router: The built router.
+        """
+
+        router = cls(fallback=fallback, discover=discover)
+        for extractor in extractors:
+            router.register(extractor)
+        return router
+
+    @staticmethod
+    def compile(extractor_class: Type[BaseExtractor]) -> List[Tuple[str, Pattern]]:
+        """Compiles the handle patterns of an extractor class.
+
+        Args:
+            extractor_class (type[BaseExtractor]): The extractor class to
+                compile the handles of.
+
+        Returns:
+            list[tuple[str, Pattern]]: A list of ordered ``(handle_name, pattern)``
+                tuples.
+        """
+
+        return [
+            (handle_name, re.compile(handle_pattern))
+            for (handle_name, handle_pattern) in extractor_class.handles.items()
+        ]
+
+    def register(self, extractor: Union[Plugin, Type[BaseExtractor]]):
+        """Adds an extractor plugin or class to the router's index.
+
+        Note:
+            Plugins which do not declare their domains are loaded immediately.
+
+        Args:
+            extractor (Plugin or type[BaseExtractor]): The extractor plugin or
+                class to add.
+        """
+
+        plugin = as_plugin(extractor)
+        if plugin.domains is None:
+            plugin.load()
+        for domain in plugin.domains:
+            domain = domain.lower()
+            if domain.startswith("www."):
+                domain = domain[4:]
+            self._index.setdefault(domain, []).append(plugin)
+
+    def get_patterns(self, plugin: Plugin) -> List[Tuple[str, Pattern]]:
+        """Gets the compiled handle patterns of a plugin, loading it if necessary.
+
+        Args:
+            plugin (Plugin): The plugin to get the patterns of.
+
+        Returns:
+            list[tuple[str, Pattern]]: A list of ordered ``(handle_name, pattern)``
+                tuples.
+        """
+
+        patterns = self._patterns.get(plugin.target)
+        if patterns is None:
+            patterns = self.compile(plugin.load())
+            self._patterns[plugin.target] = patterns
+        return patterns
+
+    def get_candidates(self, url: str) -> List[Plugin]:
+        """Gets the indexed extractor plugins which may handle a given url.
+
+        Args:
+            url (str): The url to get candidates for.
+
+        Returns:
+            list[Plugin]: A list of plugins, most specific domain first.
+        """
+
+        if self.discover is not None:
+            (discover, self.discover) = (self.discover, None)
+            for plugin in discover():
+                self.register(plugin)
+
+        host = get_host(url)
+        if host is None:
+            return []
+
+        candidates = []
+        for domain in iter_domains(host):
+            for plugin in self._index.get(domain, ()):
+                if plugin not in candidates:
+                    candidates.append(plugin)
+        return candidates
+
+    def resolve(self, url: str) -> Optional[Tuple[Plugin, str, Match]]:
+        """Resolves the extractor plugin and handle for a given url.
+
+        Args:
+            url (str): The url to resolve.
+
+        Returns:
+            tuple[Plugin, str, Match]: The resolved ``(plugin, handle_name, match)``
+                triple, or None if no extractor (including the fallback) can
+                handle the url.
+        """
+
+        for plugin in self.get_candidates(url):
+            for (handle_name, pattern) in self.get_patterns(plugin):
+                match = pattern.match(url)
+                if match:
+                    return (plugin, handle_name, match)
+
+        if self.fallback is not None:
+            for (handle_name, pattern) in self.get_patterns(self.fallback):
+                match = pattern.match(url)
+                if match:
+                    return (self.fallback, handle_name, match)
+
+    def route(self, url: str) -> Optional[Route]:
+        """Resolves the extractor and handle for a given url.
+
+        Args:
+            url (str): The url to route.
+
+        Returns:
+            tuple[type[BaseExtractor], str, Match]: The resolved
+                ``(extractor_class, handle_name, match)`` triple, or None if no
+                extractor (including the fallback) can handle the url.
+
+        Examples:
+            >>> (extractor_class, handle_name, match) = router.route(GFYCAT_URL)
+            >>> print(extractor_class, handle_name)
+            <class 'qetch.extractors.gfycat.GfycatExtractor'> basic
+        """
+
+        resolved = self.resolve(url)
+        if resolved is not None:
+            (plugin, handle_name, match) = resolved
+            return (plugin.load(), handle_name, match)
+
+
+@attr.s
+class Dispatcher(object):
+    """An index of downloaders keyed by the fragment schemes they declare.
+
+    Choosing a downloader only compares a content's fragment schemes and the
+    required capabilities against what each downloader declares in
+    :attr:`~qetch.downloaders._common.BaseDownloader.schemes` and
+    :attr:`~qetch.downloaders._common.BaseDownloader.capabilities`, no
+    requests are made unless probing is explicitly requested.
+    A downloader's module is only imported the first time one of its schemes is
+    dispatched to.
+
+    Attributes:
+        discover (callable, optional): A callable returning additional plugins
+            which is called the first time a content is dispatched.
+    """
+
+    discover = attr.ib(type=Callable[[], List[Plugin]], default=None, repr=False)
+
+    _index = attr.ib(type=dict, default=attr.Factory(dict), init=False, repr=False)
+
+    @classmethod
+    def build(
+        cls,
+        downloaders: Iterable[Union[Plugin, Type[BaseDownloader]]],
+        discover: Callable[[], List[Plugin]] = None,
+    ) -> Dispatcher:
+        """Builds a new dispatcher for some downloader plugins or classes.
+
+        Args:
+            downloaders (list[Plugin or type[BaseDownloader]]): The downloader
+                plugins or classes to index.
+            discover (callable, optional): A callable returning additional
+                plugins to index the first time a content is dispatched.
+
+        Returns:
+            Dispatcher: The built dispatcher.
+        """
+
+        dispatcher = cls(discover=discover)
+        for downloader in downloaders:
+            dispatcher.register(downloader)
+        return dispatcher
+
+    def register(self, downloader: Union[Plugin, Type[BaseDownloader]]):
+        """Adds a downloader plugin or class to the dispatcher's index.
+
+        Note:
+            Plugins which do not declare their schemes are loaded immediately.
+
+        Args:
+            downloader (Plugin or type[BaseDownloader]): The downloader plugin
+                or class to add.
+        """
+
+        plugin = as_plugin(downloader)
+        if plugin.schemes is None:
+            plugin.load()
+        for scheme in plugin.schemes:
+            self._index.setdefault(scheme.lower(), []).append(plugin)
+
+    def dispatch(
+        self, content: Content, requires: Iterable = None, probe: bool = False
+    ) -> Optional[Type[BaseDownloader]]:
+        """Resolves the downloader for a given content.
+
+        Args:
+            content (Content): The content to dispatch.
+            requires (list[DownloadCapabilities], optional): The capabilities
+                the downloader must declare.
+            probe (bool, optional): If True, also checks the fragments are alive
+                through :func:`~qetch.downloaders._common.BaseDownloader.can_handle`.
+
+        Returns:
+            type[BaseDownloader]: The first downloader that can handle the
+                content, or None if no downloader can.
+        """
+
+        if self.discover is not None:
+            (discover, self.discover) = (self.discover, None)
+            for plugin in discover():
+                self.register(plugin)
+
+        if len(content.fragments) <= 0:
+            return None
+
+        scheme = urlsplit(content.fragments[0]).scheme.lower()
+        for plugin in self._index.get(scheme, ()):
+            downloader_class = plugin.load()
+            if downloader_class.can_dispatch(content, requires=requires):
+                if not probe or downloader_class.can_handle(content):
+                    return downloader_class
+
+
+@attr.s
+class DomainQueue(object):
+    """A queue of work which limits the active items of each domain group.
+
+    Items of a domain group are popped in the order they were put, but a busy
+    domain group never blocks the items of other domain groups.
+
+    Attributes:
+        per_domain (int): The maximum number of active items per domain group.
+    """
+
+    per_domain = attr.ib(type=int, default=4)
+
+    _pending = attr.ib(
+        type=collections.OrderedDict,
+        default=attr.Factory(collections.OrderedDict),
+        init=False,
+        repr=False,
+    )
+    _active = attr.ib(
+        type=collections.Counter,
+        default=attr.Factory(collections.Counter),
+        init=False,
+        repr=False,
+    )
+
+    @per_domain.validator
+    def _check_per_domain(self, attribute: attr.Attribute, value: int):
+        if value <= 0:
+            raise ValueError(
+                f"{attribute.name!r} must be at least 1, received {value!r}"
+            )
+
+    def __len__(self) -> int:
+        return sum(len(pending) for pending in self._pending.values())
+
+    def put(self, group: Hashable, item: Any):
+        """Adds an item to the end of a domain group's queue.
+
+        Args:
+            group (hashable): The domain group of the item.
+            item (Any): The item to add.
+        """
+
+        self._pending.setdefault(group, collections.deque()).append(item)
+
+    def pop_ready(self, limit: int) -> Iterable[Tuple[Hashable, Any]]:
+        """Pops the items whose domain groups are below their active limit.
+
+        Note:
+            Popped items are counted as active until their domain group is
+            released through :func:`~DomainQueue.release`.
+
+        Args:
+            limit (int): The maximum number of items to pop.
+
+        Returns:
+            list[tuple[hashable, Any]]: A list of ``(group, item)`` tuples.
+        """
+
+        ready = []
+        for (group, pending) in list(self._pending.items()):
+            while pending and len(ready) < limit and (
+                self._active[group] < self.per_domain
+            ):
+                ready.append((group, pending.popleft()))
+                self._active[group] += 1
+            if not pending:
+                del self._pending[group]
+        return ready
+
+    def release(self, group: Hashable):
+        """Marks an active item of a domain group as finished.
+
+        Args:
+            group (hashable): The domain group of the finished item.
+        """
+
+        self._active[group] -= 1
+        if self._active[group] <= 0:
+            del self._active[group]
+
+
+@attr.s
+class DomainDispatcher(object):
+    """Submits the items of a :class:`DomainQueue` to an executor as workers idle.
+
+    Note:
+        A finishing item submits the next ready item from the worker it
+        finished in, so workers are kept busy even while finished items are not
+        collected through :func:`~DomainDispatcher.get`.
+        Items are only read (through :func:`~DomainDispatcher.fill`) while
+        workers are idle, until ``backlog`` items wait for their domain group.
+
+    Attributes:
+        executor (Executor): The executor items are submitted to.
+        function (callable): The function called with each item.
+        max_workers (int): The maximum number of items running at once.
+        per_domain (int): The maximum number of running items per domain group.
+        backlog (int): The maximum number of items waiting for their domain
+            group.
+    """
+
+    executor = attr.ib(type=Executor)
+    function = attr.ib(type=Callable[[Any], Any])
+    max_workers = attr.ib(type=int, default=16)
+    per_domain = attr.ib(type=int, default=4)
+    backlog = attr.ib(type=int, default=1024)
+
+    _queue = attr.ib(type=DomainQueue, default=None, init=False, repr=False)
+    _completed = attr.ib(type=queue.Queue, factory=queue.Queue, init=False, repr=False)
+    # NOTE: reentrant as futures finished before their callback is added call it
+    _lock = attr.ib(factory=threading.RLock, init=False, repr=False)
+    _running = attr.ib(type=int, default=0, init=False, repr=False)
+    _outstanding = attr.ib(type=int, default=0, init=False, repr=False)
+    _stopped = attr.ib(type=bool, default=False, init=False, repr=False)
+
+    def __attrs_post_init__(self):
+        self._queue = DomainQueue(per_domain=self.per_domain)
+
+    def __len__(self) -> int:
+        return self._outstanding
+
+    def _dispatch(self):
+        # called with the lock held, by the caller and by each finishing worker
+        if self._stopped:
+            return
+        for (group, item) in self._queue.pop_ready(self.max_workers - self._running):
+            self._running += 1
+            self._outstanding += 1
+            future = self.executor.submit(self.function, item)
+            future.add_done_callback(functools.partial(self._finish, group, item))
+
+    def _finish(self, group: Hashable, item: Any, future: Future):
+        with self._lock:
+            self._running -= 1
+            self._queue.release(group)
+            self._dispatch()
+        self._completed.put((item, future))
+
+    def fill(self, items: Iterator[Tuple[Hashable, Any]]):
+        """Reads items while workers are idle, submitting the ready items.
+
+        Args:
+            items (iterator[tuple[hashable, Any]]): An iterator of
+                ``(group, item)`` tuples, read no further than needed.
+        """
+
+        while True:
+            with self._lock:
+                self._dispatch()
+                if (
+                    self._stopped
+                    or self._running >= self.max_workers
+                    or len(self._queue) >= self.backlog
+                ):
+                    return
+            # NOTE: items are read without the lock so workers never wait on them
+            next_item = next(items, None)
+            if next_item is None:
+                return
+            with self._lock:
+                self._queue.put(*next_item)
+
+    def get(self) -> Tuple[Any, Future]:
+        """Waits for the next item to finish.
+
+        Note:
+            Items are counted (by ``len``) until they are collected.
+
+        Returns:
+            tuple[Any, Future]: A tuple of the item and its finished future.
+        """
+
+        (item, future) = self._completed.get()
+        with self._lock:
+            self._outstanding -= 1
+        return (item, future)
+
+    def stop(self):
+        """Stops submitting items, items which are already running still finish.
+        """
+
+        with self._lock:
+            self._stopped = True
@@ -0,0 +1,308 @@
+# Copyright (c) 2018 Stephen Bunn (stephen@bunn.io)
+# MIT License <https://opensource.org/licenses/MIT>
+
+import time
+import functools
+import threading
+from typing import Dict, Callable, Optional
+
+import attr
+from requests.adapters import HTTPAdapter
+from urllib3 import PoolManager
+from urllib3.connectionpool import HTTPConnectionPool, HTTPSConnectionPool
+
+
+@attr.s
+class PoolStats(object):
+    """The usage statistics of connection pools.
+
+    Attributes:
+        hits (int): The connections checked out of a pool which were already
+            connected (reused through keep-alive).
+        new_connections (int): The connections checked out of a pool which had
+            to connect (and handshake) first.
+        waits (int): The checkouts which had to wait for a connection to be
+            returned to a full pool.
+        wait_time (float): The total seconds spent waiting for connections.
+    """
+
+    hits = attr.ib(type=int, default=0)
+    new_connections = attr.ib(type=int, default=0)
+    waits = attr.ib(type=int, default=0)
+    wait_time = attr.ib(type=float, default=0.0)
+
+    def __add__(self, other: "PoolStats") -> "PoolStats":
+        return PoolStats(
+            hits=self.hits + other.hits,
+            new_connections=self.new_connections + other.new_connections,
+            waits=self.waits + other.waits,
+            wait_time=self.wait_time + other.wait_time,
+        )
+
+
+class _TrackedPoolMixin(object):
+    """Reports every connection checkout of a pool to a recorder.
+    """
+
+    def __init__(self, *args, recorder: Callable = None, **kwargs):
+        super().__init__(*args, **kwargs)
+        self._recorder = recorder
+
+    def _get_conn(self, timeout: float = None):
+        # NOTE: only blocking pools wait, non-blocking pools open (and later
+        # discard) an extra connection instead
+        waited = self.block and self.pool is not None and self.pool.empty()
+        started = time.monotonic()
+        connection = super()._get_conn(timeout=timeout)
+        if self._recorder is not None:
+            self._recorder(
+                f"{self.scheme}://{self.host}:{self.port}",
+                connection.sock is not None,
+                (time.monotonic() - started) if waited else None,
+            )
+        return connection
+
+
+class TrackedHTTPConnectionPool(_TrackedPoolMixin, HTTPConnectionPool):
+    """The HTTP connection pool reporting its connection checkouts.
+    """
+
+    pass
+
+
+class TrackedHTTPSConnectionPool(_TrackedPoolMixin, HTTPSConnectionPool):
+    """The HTTPS connection pool reporting its connection checkouts.
+    """
+
+    pass
+
+
+def track_pools(pool_manager: PoolManager, recorder: Callable) -> PoolManager:
+    """Makes the pools of a pool manager report their checkouts to a recorder.
+
+    Args:
+        pool_manager (PoolManager): The ``urllib3`` pool manager.
+        recorder (callable): Called with the ``(host, is_hit, wait_time)`` of
+            every connection checkout, where ``wait_time`` is None if the
+            checkout did not wait.
+
+    Returns:
+        PoolManager: The given pool manager.
+    """
+
+    pool_manager.pool_classes_by_scheme = {
+        "http": functools.partial(TrackedHTTPConnectionPool, recorder=recorder),
+        "https": functools.partial(TrackedHTTPSConnectionPool, recorder=recorder),
+    }
+    return pool_manager
+
+
+class PoolAdapter(HTTPAdapter):
+    """The transport adapter whose connection pools report their checkouts.
+
+    Args:
+        recorder (callable): Called with the ``(host, is_hit, wait_time)`` of
+            every connection checkout, where ``wait_time`` is None if the
+            checkout did not wait.
+    """
+
+    def __init__(self, recorder: Callable, **kwargs):
+        # NOTE: set before initializing as the adapter builds its pool manager
+        self._recorder = recorder
+        super().__init__(**kwargs)
+
+    def init_poolmanager(self, connections: int, maxsize: int, block=False, **kwargs):
+        super().init_poolmanager(connections, maxsize, block=block, **kwargs)
+        track_pools(self.poolmanager, self._recorder)
+
+
+class SessionManager(object):
+    """The process-wide manager of HTTP sessions and their connection pools.
+
+    Implements the borg pattern for shared state between instances.
+
+    Note:
+        Every session is mounted with the same :class:`PoolAdapter`, so
+        keep-alive connections are reused across extractor and downloader
+        instances.
+        The pool of each host holds up to ``pool_maxsize`` connections, which
+        :meth:`~SessionManager.reserve` grows to the configured concurrency
+        (such as ``max_fragments * max_connections`` of a download).
+
+    Attributes:
+        pool_connections (int): The number of host pools to keep.
+        pool_maxsize (int): The number of connections kept per host.
+        pool_block (bool): If True, checkouts of a full pool wait for a
+            connection to be returned instead of opening one which is
+            discarded afterwards.
+
+    Examples:
+        >>> from qetch.sessions import (SessionManager,)
+        >>> manager = SessionManager()
+        >>> manager.reserve(16)
+        16
+        >>> manager.session.get("https://example.com/")
+        <Response [200]>
+        >>> manager.get_stats()
+        PoolStats(hits=0, new_connections=1, waits=0, wait_time=0.0)
+    """
+
+    __shared_state = {}
+
+    def __init__(self):
+        self.__dict__ = self.__shared_state
+        if "_local" not in self.__dict__:
+            self.pool_connections = 10
+            self.pool_maxsize = 10
+            self.pool_block = True
+            self._adapter = None
+            self._lock = threading.Lock()
+            self._local = threading.local()
+            self._stats = {}
+
+    @property
+    def adapter(self) -> PoolAdapter:
+        """The transport adapter shared by all sessions.
+
+        Returns:
+            PoolAdapter: The shared adapter.
+        """
+
+        with self._lock:
+            if self._adapter is None:
+                self._adapter = PoolAdapter(
+                    self._record,
+                    pool_connections=self.pool_connections,
+                    pool_maxsize=self.pool_maxsize,
+                    pool_block=self.pool_block,
+                )
+            return self._adapter
+
+    @property
+    def session(self):
+        """The session of the current thread.
+
+        Note:
+            Sessions are not safe to share between threads, so each thread gets
+            its own session (sharing the connection pools of every other).
+
+        Returns:
+            HTMLSession: The session of the current thread.
+        """
+
+        session = getattr(self._local, "session", None)
+        if session is None:
+            session = self._local.session = self.create_session()
+        return session
+
+    def _record(self, host: str, is_hit: bool, wait_time: Optional[float]):
+        with self._lock:
+            stats = self._stats.setdefault(host, PoolStats())
+            if is_hit:
+                stats.hits += 1
+            else:
+                stats.new_connections += 1
+            if wait_time is not None:
+                stats.waits += 1
+                stats.wait_time += wait_time
+
+    def create_session(self):
+        """Creates a session using the shared connection pools.
+
+        Note:
+            Use this for sessions with their own state (such as authorization
+            headers), otherwise use the thread's :attr:`~SessionManager.session`.
+
+        Returns:
+            HTMLSession: The created session.
+        """
+
+        # NOTE: imported here so the browser dependencies only load on first use
+        from requests_html import HTMLSession
+
+        session = HTMLSession()
+        for prefix in ("http://", "https://"):
+            session.mount(prefix, self.adapter)
+        return session
+
+    def track(self, pool_manager: PoolManager) -> PoolManager:
+        """Makes the pools of another pool manager count towards the statistics.
+
+        Args:
+            pool_manager (PoolManager): The ``urllib3`` pool manager.
+
+        Returns:
+            PoolManager: The given pool manager.
+        """
+
+        return track_pools(pool_manager, self._record)
+
+    def reserve(self, connections: int) -> int:
+        """Grows the pool of each host to hold at least some connections.
+
+        Note:
+            Pools never shrink, pools created before they grow are replaced
+            once their in-flight connections are returned.
+
+        Args:
+            connections (int): The number of concurrent connections to a host.
+
+        Returns:
+            int: The number of connections kept per host.
+        """
+
+        adapter = self.adapter
+        with self._lock:
+            if connections > self.pool_maxsize:
+                self.pool_maxsize = connections
+                adapter._pool_maxsize = connections
+                adapter.init_poolmanager(
+                    self.pool_connections, connections, block=self.pool_block
+                )
+            return self.pool_maxsize
+
+    def get_stats(self, host: str = None) -> PoolStats:
+        """Gets the statistics of the connection pools.
+
+        Args:
+            host (str, optional): The ``{scheme}://{host}:{port}`` of a single
+                pool to get the statistics of.
+
+        Returns:
+            PoolStats: The statistics of the pool, or of all pools if no host is
+                given.
+        """
+
+        with self._lock:
+            if host is not None:
+                return attr.evolve(self._stats.get(host, PoolStats()))
+            return sum(self._stats.values(), PoolStats())
+
+    def get_host_stats(self) -> Dict[str, PoolStats]:
+        """Gets the statistics of each host's connection pool.
+
+        Returns:
+            dict[str, PoolStats]: A dictionary of ``{scheme}://{host}:{port}`` to
+                the statistics of its pool.
+        """
+
+        with self._lock:
+            return {host: attr.evolve(stats) for (host, stats) in self._stats.items()}
+
+    def reset_stats(self):
+        """Resets the statistics of the connection pools.
+        """
+
+        with self._lock:
+            self._stats.clear()
+
+    def close(self):
+        """Closes the shared connection pools and resets the configured sizes.
+        """
+
+        with self._lock:
+            if self._adapter is not None:
+                self._adapter.close()
+            self._adapter = None
+            self.pool_maxsize = 10
+            self._local = threading.local()
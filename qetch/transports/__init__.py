@@ -0,0 +1,57 @@
+# Copyright (c) 2018 Stephen Bunn (stephen@bunn.io)
+# MIT License <https://opensource.org/licenses/MIT>
+
+from typing import Union
+
+from .. import plugins
+from ._common import Headers, Response, BaseTransport
+
+# NOTE: transport modules are only imported once a transport is requested by name
+PLUGINS = (
+    plugins.Plugin(
+        name="requests", target="qetch.transports.requests:RequestsTransport"
+    ),
+    plugins.Plugin(name="urllib3", target="qetch.transports.urllib3:Urllib3Transport"),
+    plugins.Plugin(name="memory", target="qetch.transports.memory:MemoryTransport"),
+    # NOTE: requires the optional ``httpx[http2]`` dependency
+    plugins.Plugin(name="httpx", target="qetch.transports.httpx:HTTPXTransport"),
+)
+
+__all__ = ["Headers", "Response", "BaseTransport", "get_transport"] + [
+    plugin.attribute for plugin in PLUGINS
+]
+
+
+def get_transport(transport: Union[str, BaseTransport]) -> BaseTransport:
+    """Gets a transport from its name.
+
+    Args:
+        transport (Union[str, BaseTransport]): The name of the transport
+            (``requests``, ``urllib3``, ``httpx`` or ``memory``), or a
+            transport instance.
+
+    Raises:
+        ValueError: If no transport has the given name.
+
+    Returns:
+        BaseTransport: A new instance of the named transport, or the given
+            transport instance.
+    """
+
+    if isinstance(transport, BaseTransport):
+        return transport
+    for plugin in PLUGINS:
+        if plugin.name == transport:
+            return plugin.load()()
+    raise ValueError(f"no transport named {transport!r} exists")
+
+
+def __getattr__(name: str):
+    for plugin in PLUGINS:
+        if plugin.attribute == name:
+            return plugin.load()
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+
+def __dir__():
+    return sorted(set(globals()) | set(__all__))
@@ -0,0 +1,305 @@
+# Copyright (c) 2018 Stephen Bunn (stephen@bunn.io)
+# MIT License <https://opensource.org/licenses/MIT>
+
+import abc
+from typing import Any, Dict, Tuple, Mapping, Callable, Iterator, Optional
+from collections.abc import MutableMapping
+from urllib.parse import urlencode
+
+import attr
+
+
+class Headers(MutableMapping):
+    """A case-insensitive dictionary of HTTP headers.
+
+    Examples:
+        >>> headers = Headers({"Content-Length": "2"})
+        >>> headers["content-length"]
+        '2'
+    """
+
+    def __init__(self, headers: Mapping[str, str] = None, **kwargs):
+        self._headers = {}
+        self.update(headers or {}, **kwargs)
+
+    def __getitem__(self, name: str) -> str:
+        return self._headers[name.lower()][1]
+
+    def __setitem__(self, name: str, value: str):
+        self._headers[name.lower()] = (name, value)
+
+    def __delitem__(self, name: str):
+        del self._headers[name.lower()]
+
+    def __iter__(self):
+        return (name for (name, _) in self._headers.values())
+
+    def __len__(self) -> int:
+        return len(self._headers)
+
+    def __repr__(self) -> str:
+        return f"{self.__class__.__name__}({dict(self.items())!r})"
+
+
+def get_encoding(headers: Mapping[str, str]) -> Optional[str]:
+    """Gets the charset of a response from its ``Content-Type`` header.
+
+    Args:
+        headers (Mapping[str, str]): The headers of the response.
+
+    Returns:
+        str: The charset of the response, or None if it has none.
+
+    Examples:
+        >>> get_encoding({"Content-Type": "text/html; charset=UTF-8"})
+        'UTF-8'
+    """
+
+    for parameter in headers.get("Content-Type", "").split(";")[1:]:
+        (name, _, value) = parameter.strip().partition("=")
+        if name.lower() == "charset" and value:
+            return value.strip("\"'")
+    return None
+
+
+def encode_body(
+    data: Any, headers: Dict[str, str]
+) -> Tuple[Optional[bytes], Dict[str, str]]:
+    """Encodes the data of a request into its body.
+
+    Note:
+        Dictionaries are form encoded (like ``requests`` does), strings are
+        encoded as UTF-8.
+
+    Args:
+        data (Any): The data of the request (a dictionary, string or bytes).
+        headers (dict[str, str]): The headers of the request.
+
+    Returns:
+        tuple[bytes, dict[str, str]]: A tuple of the body and headers of the
+            request.
+    """
+
+    if data is None or isinstance(data, bytes):
+        return (data, headers)
+    if isinstance(data, Mapping):
+        headers = Headers(headers)
+        headers.setdefault("Content-Type", "application/x-www-form-urlencoded")
+        return (urlencode(data).encode("utf-8"), headers)
+    return (str(data).encode("utf-8"), headers)
+
+
+@attr.s
+class Response(object):
+    """The response of a transport.
+
+    Note:
+        Mirrors the parts of a :class:`requests.Response` qetch relies on, so
+        transports are interchangeable with ``requests`` sessions.
+
+    Attributes:
+        status_code (int): The status of the response.
+        headers (Mapping[str, str]): The case-insensitive headers of the
+            response.
+        url (str): The url of the response.
+        encoding (str): The charset the text of the response is decoded with.
+        http_version (str): The HTTP version of the response (such as
+            ``HTTP/2``), if known.
+    """
+
+    status_code = attr.ib(type=int)
+    headers = attr.ib(type=Mapping[str, str], converter=Headers, repr=False)
+    url = attr.ib(type=str, default=None)
+    encoding = attr.ib(type=str, default=None, repr=False)
+    http_version = attr.ib(type=str, default=None, repr=False)
+    _content = attr.ib(type=bytes, default=None, repr=False)
+    _stream = attr.ib(
+        type=Callable[[int], Iterator[bytes]], default=None, repr=False
+    )
+    _release = attr.ib(type=Callable[[], None], default=None, repr=False)
+
+    def __attrs_post_init__(self):
+        if self.encoding is None:
+            self.encoding = get_encoding(self.headers)
+
+    def __enter__(self) -> "Response":
+        return self
+
+    def __exit__(self, *args):
+        self.close()
+
+    @property
+    def content(self) -> bytes:
+        """The body of the response.
+
+        Returns:
+            bytes: The body of the response.
+        """
+
+        if self._content is None:
+            self._content = (
+                b"".join(self._stream(2 ** 16)) if self._stream is not None else b""
+            )
+            self.close()
+        return self._content
+
+    @property
+    def text(self) -> str:
+        """The body of the response decoded with its encoding.
+
+        Returns:
+            str: The text of the response.
+        """
+
+        return self.content.decode(self.encoding or "utf-8", errors="replace")
+
+    def iter_content(self, chunk_size: int = 1) -> Iterator[bytes]:
+        """Iterates over the body of the response.
+
+        Args:
+            chunk_size (int, optional): The size of the chunks to read.
+
+        Yields:
+            bytes: A chunk of the body.
+        """
+
+        if self._content is not None or self._stream is None:
+            content = self.content
+            for start in range(0, len(content), chunk_size):
+                stop = start + chunk_size
+                yield content[start:stop]
+            return
+        yield from self._stream(chunk_size)
+
+    def close(self):
+        """Releases the connection of the response.
+        """
+
+        (release, self._release) = (self._release, None)
+        if release is not None:
+            release()
+
+
+@attr.s
+class BaseTransport(abc.ABC):
+    """The base transport.
+    `All transports should extend this.`
+
+    Note:
+        Transports are used wherever qetch makes a synchronous request, such as
+        :attr:`~qetch.extractors._common.BaseExtractor.session`,
+        :meth:`~qetch.content.Content.get_size` and the downloaders.
+
+    Attributes:
+        headers (Mapping[str, str]): The headers sent with every request.
+        errors (tuple[type, ...]): The exceptions raised by requests failing
+            without a response (such as refused connections and timeouts).
+    """
+
+    # NOTE: transports raising library specific exceptions extend this
+    errors = (OSError,)
+
+    headers = attr.ib(type=Headers, factory=Headers, converter=Headers, repr=False)
+
+    @abc.abstractmethod
+    def request(
+        self,
+        method: str,
+        url: str,
+        headers: Mapping[str, str] = None,
+        data: Any = None,
+        stream: bool = False,
+        allow_redirects: bool = True,
+        timeout: float = None,
+    ) -> Response:
+        """Requests a url.
+
+        Args:
+            method (str): The method of the request.
+            url (str): The url to request.
+            headers (Mapping[str, str], optional): The headers of the request,
+                sent in addition to :attr:`~BaseTransport.headers`.
+            data (Any, optional): The body of the request.
+            stream (bool, optional): If True, the body of the response is only
+                read once it is accessed.
+            allow_redirects (bool, optional): If True, redirects are followed.
+            timeout (float, optional): The seconds to wait for the server.
+
+        Returns:
+            Response: The response (or a compatible response).
+        """
+
+        raise NotImplementedError()
+
+    def get_headers(self, headers: Mapping[str, str] = None) -> Headers:
+        """Gets the headers of a request merged with the transport's headers.
+
+        Args:
+            headers (Mapping[str, str], optional): The headers of the request.
+
+        Returns:
+            Headers: The merged headers.
+        """
+
+        merged = Headers(self.headers)
+        merged.update(headers or {})
+        return merged
+
+    def get(self, url: str, **kwargs) -> Response:
+        """Requests a url with the ``GET`` method.
+
+        Args:
+            url (str): The url to request.
+
+        Returns:
+            Response: The response.
+        """
+
+        return self.request("GET", url, **kwargs)
+
+    def head(self, url: str, **kwargs) -> Response:
+        """Requests the headers of a url.
+
+        Note:
+            Like ``requests``, redirects are not followed by default.
+
+        Args:
+            url (str): The url to request.
+
+        Returns:
+            Response: The response.
+        """
+
+        kwargs.setdefault("allow_redirects", False)
+        return self.request("HEAD", url, **kwargs)
+
+    def post(self, url: str, data: Any = None, **kwargs) -> Response:
+        """Requests a url with the ``POST`` method.
+
+        Args:
+            url (str): The url to request.
+            data (Any, optional): The body of the request.
+
+        Returns:
+            Response: The response.
+        """
+
+        return self.request("POST", url, data=data, **kwargs)
+
+    def reserve(self, connections: int) -> int:
+        """Grows the transport to hold some concurrent connections per host.
+
+        Args:
+            connections (int): The number of concurrent connections to a host.
+
+        Returns:
+            int: The number of connections kept per host.
+        """
+
+        return connections
+
+    def close(self):
+        """Closes the connections of the transport.
+        """
+
+        pass
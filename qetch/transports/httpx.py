@@ -0,0 +1,149 @@
+# Copyright (c) 2018 Stephen Bunn (stephen@bunn.io)
+# MIT License <https://opensource.org/licenses/MIT>
+
+import threading
+from typing import Any, Mapping
+
+import attr
+import httpx
+
+from ._common import Response, BaseTransport, encode_body
+
+
+@attr.s
+class HTTPXTransport(BaseTransport):
+    """The transport multiplexing requests over HTTP/2 connections through ``httpx``.
+
+    Note:
+        Requires the optional ``httpx[http2]`` dependency.
+        Concurrent requests to a host share a few connections as HTTP/2
+        streams instead of each taking a connection of their own (which many
+        hosts limit to about 10).
+        Hosts without HTTP/2 support are requested over HTTP/1.1, unless the
+        transport is restricted to HTTP/2 through ``prior_knowledge`` (which is
+        required to speak HTTP/2 to ``http://`` urls).
+
+    Attributes:
+        max_connections (int): The maximum number of connections, multiplexed
+            streams are not limited by this.
+        prior_knowledge (bool): If True, only HTTP/2 is spoken, without
+            negotiating it first.
+        timeout (float): The default seconds to wait for the server.
+    """
+
+    errors = (OSError, httpx.HTTPError)
+
+    max_connections = attr.ib(type=int, default=4)
+    prior_knowledge = attr.ib(type=bool, default=False)
+    timeout = attr.ib(type=float, default=None, repr=False)
+
+    _client = attr.ib(default=None, init=False, repr=False)
+    _lock = attr.ib(factory=threading.Lock, init=False, repr=False)
+
+    @property
+    def client(self) -> httpx.Client:
+        """The client of the transport.
+
+        Returns:
+            httpx.Client: The client.
+        """
+
+        with self._lock:
+            if self._client is None:
+                self._client = httpx.Client(
+                    http1=not self.prior_knowledge,
+                    http2=True,
+                    limits=httpx.Limits(
+                        max_connections=self.max_connections,
+                        max_keepalive_connections=self.max_connections,
+                    ),
+                    timeout=self.timeout,
+                )
+            return self._client
+
+    def request(
+        self,
+        method: str,
+        url: str,
+        headers: Mapping[str, str] = None,
+        data: Any = None,
+        stream: bool = False,
+        allow_redirects: bool = True,
+        timeout: float = None,
+    ) -> Response:
+        """Requests a url.
+
+        Args:
+            method (str): The method of the request.
+            url (str): The url to request.
+            headers (Mapping[str, str], optional): The headers of the request,
+                sent in addition to the transport's headers.
+            data (Any, optional): The body of the request.
+            stream (bool, optional): If True, the body of the response is only
+                read once it is accessed.
+            allow_redirects (bool, optional): If True, redirects are followed.
+            timeout (float, optional): The seconds to wait for the server.
+
+        Returns:
+            Response: The response.
+        """
+
+        (body, headers) = encode_body(data, self.get_headers(headers))
+        client = self.client
+        request = client.build_request(
+            method,
+            url,
+            headers=dict(headers),
+            content=body,
+            timeout=timeout if timeout is not None else client.timeout,
+        )
+        raw = client.send(request, stream=stream, follow_redirects=allow_redirects)
+        (status, raw_headers) = (raw.status_code, raw.headers.multi_items())
+        if not stream:
+            return Response(
+                status,
+                raw_headers,
+                url=str(raw.url),
+                http_version=raw.http_version,
+                content=raw.content,
+            )
+
+        def iter_stream(chunk_size: int):
+            try:
+                yield from raw.iter_bytes(chunk_size)
+            finally:
+                raw.close()
+
+        return Response(
+            status,
+            raw_headers,
+            url=str(raw.url),
+            http_version=raw.http_version,
+            stream=iter_stream,
+            release=raw.close,
+        )
+
+    def reserve(self, connections: int) -> int:
+        """Determines the concurrent requests to a host the transport can hold.
+
+        Note:
+            Concurrent requests are multiplexed over the existing connections,
+            so the transport never grows.
+
+        Args:
+            connections (int): The number of concurrent requests to a host.
+
+        Returns:
+            int: The given number of concurrent requests.
+        """
+
+        return connections
+
+    def close(self):
+        """Closes the connections of the transport.
+        """
+
+        with self._lock:
+            if self._client is not None:
+                self._client.close()
+            self._client = None
@@ -0,0 +1,188 @@
+# Copyright (c) 2018 Stephen Bunn (stephen@bunn.io)
+# MIT License <https://opensource.org/licenses/MIT>
+
+import re
+import time
+import threading
+from typing import Any, Dict, List, Tuple, Union, Mapping
+
+import attr
+
+from ._common import Headers, Response, BaseTransport
+
+RANGE_PATTERN = re.compile(r"^bytes=(?P<start>\d*)-(?P<end>\d*)$")
+
+
+@attr.s
+class Resource(object):
+    """A resource served by the memory transport.
+
+    Attributes:
+        body (bytes): The body of the resource.
+        status (int): The status of the resource's responses.
+        headers (dict[str, str]): The headers of the resource's responses.
+        accept_ranges (bool): If True, ``Range`` requests are answered with
+            partial content.
+    """
+
+    body = attr.ib(type=bytes, default=b"", repr=False)
+    status = attr.ib(type=int, default=200)
+    headers = attr.ib(type=Dict[str, str], factory=dict, repr=False)
+    accept_ranges = attr.ib(type=bool, default=True)
+
+
+@attr.s
+class MemoryTransport(BaseTransport):
+    """The transport serving resources from memory.
+
+    Note:
+        This is meant for testing and benchmarking extractors and downloaders
+        without a network, unknown urls are answered with a ``404`` status.
+
+    Attributes:
+        resources (dict[str, Resource]): The resources served per url.
+        latency (float): The seconds each request takes to be answered.
+        bandwidth (float): The bytes per second bodies are streamed at, bodies
+            are streamed instantly if None.
+        requests (list[tuple[str, str, Headers]]): The ``(method, url,
+            headers)`` of every request made.
+        queued (dict[str, list[Resource]]): The resources served once per url,
+            answered before the url's resource in :attr:`~MemoryTransport.resources`.
+
+    Examples:
+        >>> transport = MemoryTransport()
+        >>> transport.add("https://example.com/", b"hello")
+        >>> transport.get("https://example.com/").text
+        'hello'
+    """
+
+    resources = attr.ib(type=Dict[str, Resource], factory=dict, repr=False)
+    latency = attr.ib(type=float, default=0.0)
+    bandwidth = attr.ib(type=float, default=None)
+
+    requests = attr.ib(
+        type=List[Tuple[str, str, Headers]], factory=list, init=False, repr=False
+    )
+    queued = attr.ib(
+        type=Dict[str, List[Resource]], factory=dict, init=False, repr=False
+    )
+    _lock = attr.ib(factory=threading.Lock, init=False, repr=False)
+
+    def add(
+        self,
+        url: str,
+        body: Union[str, bytes] = b"",
+        status: int = 200,
+        headers: Mapping[str, str] = None,
+        accept_ranges: bool = True,
+        once: bool = False,
+    ):
+        """Adds a resource to serve.
+
+        Args:
+            url (str): The url of the resource.
+            body (Union[str, bytes], optional): The body of the resource,
+                strings are encoded as UTF-8.
+            status (int, optional): The status of the resource's responses.
+            headers (Mapping[str, str], optional): The headers of the
+                resource's responses.
+            accept_ranges (bool, optional): If True, ``Range`` requests are
+                answered with partial content (unless their ``If-Range`` does
+                not match the ``ETag`` or ``Last-Modified`` header).
+            once (bool, optional): If True, the resource only answers a single
+                request, resources added once are answered in the order they
+                were added.
+        """
+
+        if isinstance(body, str):
+            body = body.encode("utf-8")
+        resource = Resource(
+            body=body,
+            status=status,
+            headers=dict(headers or {}),
+            accept_ranges=accept_ranges,
+        )
+        if once:
+            with self._lock:
+                self.queued.setdefault(url, []).append(resource)
+        else:
+            self.resources[url] = resource
+
+    def _get_range(self, size: int, value: str) -> Tuple[int, int]:
+        match = RANGE_PATTERN.match(value.strip())
+        if match is None or not any(match.groups()):
+            return (0, size - 1)
+        (start, end) = (match.group("start"), match.group("end"))
+        if not start:
+            return (max(0, size - int(end)), size - 1)
+        return (int(start), min(int(end), size - 1) if end else size - 1)
+
+    def request(
+        self,
+        method: str,
+        url: str,
+        headers: Mapping[str, str] = None,
+        data: Any = None,
+        stream: bool = False,
+        allow_redirects: bool = True,
+        timeout: float = None,
+    ) -> Response:
+        """Requests a url.
+
+        Args:
+            method (str): The method of the request.
+            url (str): The url to request.
+            headers (Mapping[str, str], optional): The headers of the request,
+                sent in addition to the transport's headers.
+            data (Any, optional): The body of the request (ignored).
+            stream (bool, optional): If True, the body of the response is only
+                read once it is accessed.
+            allow_redirects (bool, optional): Ignored, as resources never
+                redirect.
+            timeout (float, optional): Ignored.
+
+        Returns:
+            Response: The response.
+        """
+
+        headers = self.get_headers(headers)
+        with self._lock:
+            self.requests.append((method.upper(), url, headers))
+            queued = self.queued.get(url)
+            resource = queued.pop(0) if queued else self.resources.get(url)
+        if self.latency > 0:
+            time.sleep(self.latency)
+
+        if resource is None:
+            return Response(404, {}, url=url, content=b"")
+
+        (status, body, size) = (resource.status, resource.body, len(resource.body))
+        response_headers = Headers(resource.headers)
+        if resource.accept_ranges:
+            response_headers["Accept-Ranges"] = "bytes"
+        # NOTE: ranges of a changed resource are answered with the full body
+        if_range = headers.get("If-Range")
+        fresh = if_range is None or if_range in (
+            response_headers.get("ETag"),
+            response_headers.get("Last-Modified"),
+        )
+        if "Range" in headers and resource.accept_ranges and status == 200 and fresh:
+            (start, end) = self._get_range(size, headers["Range"])
+            stop = end + 1
+            (status, body) = (206, body[start:stop])
+            response_headers["Content-Range"] = f"bytes {start}-{end}/{size}"
+        response_headers["Content-Length"] = str(len(body))
+
+        if method.upper() == "HEAD":
+            body = b""
+        if not stream or self.bandwidth is None:
+            return Response(status, response_headers, url=url, content=body)
+
+        def iter_stream(chunk_size: int):
+            for start in range(0, len(body), chunk_size):
+                stop = start + chunk_size
+                chunk = body[start:stop]
+                time.sleep(len(chunk) / self.bandwidth)
+                yield chunk
+
+        return Response(status, response_headers, url=url, stream=iter_stream)
@@ -0,0 +1,84 @@
+# Copyright (c) 2018 Stephen Bunn (stephen@bunn.io)
+# MIT License <https://opensource.org/licenses/MIT>
+
+from typing import Any, Mapping
+
+import attr
+
+from ._common import BaseTransport
+from ..sessions import SessionManager
+
+
+@attr.s
+class RequestsTransport(BaseTransport):
+    """The transport requesting urls through a ``requests-html`` session.
+
+    Note:
+        This is the default transport of extractors, as its
+        :attr:`~RequestsTransport.session` can also render HTML.
+        The session shares the connection pools of the
+        :class:`~qetch.sessions.SessionManager`.
+    """
+
+    _session = attr.ib(default=None, init=False, repr=False)
+
+    @property
+    def session(self):
+        """The session of the transport.
+
+        Returns:
+            HTMLSession: The session of the transport.
+        """
+
+        if self._session is None:
+            self._session = SessionManager().create_session()
+        return self._session
+
+    def request(
+        self,
+        method: str,
+        url: str,
+        headers: Mapping[str, str] = None,
+        data: Any = None,
+        stream: bool = False,
+        allow_redirects: bool = True,
+        timeout: float = None,
+    ):
+        """Requests a url.
+
+        Args:
+            method (str): The method of the request.
+            url (str): The url to request.
+            headers (Mapping[str, str], optional): The headers of the request,
+                sent in addition to the transport's headers.
+            data (Any, optional): The body of the request.
+            stream (bool, optional): If True, the body of the response is only
+                read once it is accessed.
+            allow_redirects (bool, optional): If True, redirects are followed.
+            timeout (float, optional): The seconds to wait for the server.
+
+        Returns:
+            requests.Response: The response.
+        """
+
+        return self.session.request(
+            method,
+            url,
+            headers=dict(self.get_headers(headers)),
+            data=data,
+            stream=stream,
+            allow_redirects=allow_redirects,
+            timeout=timeout,
+        )
+
+    def reserve(self, connections: int) -> int:
+        """Grows the shared pool of each host to hold at least some connections.
+
+        Args:
+            connections (int): The number of concurrent connections to a host.
+
+        Returns:
+            int: The number of connections kept per host.
+        """
+
+        return SessionManager().reserve(connections)
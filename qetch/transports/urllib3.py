@@ -0,0 +1,183 @@
+# Copyright (c) 2018 Stephen Bunn (stephen@bunn.io)
+# MIT License <https://opensource.org/licenses/MIT>
+
+import socket
+import threading
+from typing import Any, List, Tuple, Mapping
+
+import attr
+import urllib3
+
+from ._common import Response, BaseTransport, encode_body
+from ..sessions import SessionManager
+
+
+@attr.s
+class Urllib3Transport(BaseTransport):
+    """The transport requesting urls directly through ``urllib3`` pools.
+
+    Note:
+        This is the lean transport used for bulk byte transfers, responses are
+        streamed straight from the connection without any session machinery.
+        Its pools count towards the statistics of the
+        :class:`~qetch.sessions.SessionManager`.
+
+    Attributes:
+        receive_buffer (int): The ``SO_RCVBUF`` size of connections in bytes,
+            the system default is used if None.
+        no_delay (bool): If True, ``TCP_NODELAY`` is set on connections.
+        keep_alive (bool): If True, ``SO_KEEPALIVE`` is set on connections.
+        extra_socket_options (list[tuple[int, int, int]]): Additional
+            ``(level, option, value)`` socket options of connections.
+        timeout (float): The default seconds to wait for the server.
+        retries (int): The number of retries of failed connections.
+    """
+
+    receive_buffer = attr.ib(type=int, default=2 ** 20)
+    no_delay = attr.ib(type=bool, default=True)
+    keep_alive = attr.ib(type=bool, default=True)
+    extra_socket_options = attr.ib(
+        type=List[Tuple[int, int, int]], factory=list, repr=False
+    )
+    errors = (OSError, urllib3.exceptions.HTTPError)
+
+    timeout = attr.ib(type=float, default=None, repr=False)
+    retries = attr.ib(type=int, default=2, repr=False)
+
+    _pool_manager = attr.ib(default=None, init=False, repr=False)
+    _pool_maxsize = attr.ib(type=int, default=0, init=False, repr=False)
+    _lock = attr.ib(factory=threading.Lock, init=False, repr=False)
+
+    @property
+    def socket_options(self) -> List[Tuple[int, int, int]]:
+        """The socket options set on new connections.
+
+        Returns:
+            list[tuple[int, int, int]]: A list of ``(level, option, value)``
+                socket options.
+        """
+
+        options = [(socket.IPPROTO_TCP, socket.TCP_NODELAY, int(self.no_delay))]
+        if self.keep_alive:
+            options.append((socket.SOL_SOCKET, socket.SO_KEEPALIVE, 1))
+        if self.receive_buffer is not None:
+            options.append((socket.SOL_SOCKET, socket.SO_RCVBUF, self.receive_buffer))
+        return options + list(self.extra_socket_options)
+
+    @property
+    def pool_manager(self) -> urllib3.PoolManager:
+        """The pool manager of the transport.
+
+        Returns:
+            urllib3.PoolManager: The pool manager.
+        """
+
+        if self._pool_manager is None:
+            self.reserve(0)
+        return self._pool_manager
+
+    def reserve(self, connections: int) -> int:
+        """Grows the pool of each host to hold at least some connections.
+
+        Note:
+            Pools never shrink, pools created before they grow are replaced
+            once their in-flight connections are returned.
+
+        Args:
+            connections (int): The number of concurrent connections to a host.
+
+        Returns:
+            int: The number of connections kept per host.
+        """
+
+        manager = SessionManager()
+        maxsize = manager.reserve(connections)
+        with self._lock:
+            if self._pool_manager is None or maxsize > self._pool_maxsize:
+                self._pool_maxsize = maxsize
+                self._pool_manager = manager.track(
+                    urllib3.PoolManager(
+                        num_pools=manager.pool_connections,
+                        maxsize=maxsize,
+                        block=manager.pool_block,
+                        socket_options=self.socket_options,
+                    )
+                )
+            return self._pool_maxsize
+
+    def request(
+        self,
+        method: str,
+        url: str,
+        headers: Mapping[str, str] = None,
+        data: Any = None,
+        stream: bool = False,
+        allow_redirects: bool = True,
+        timeout: float = None,
+    ) -> Response:
+        """Requests a url.
+
+        Args:
+            method (str): The method of the request.
+            url (str): The url to request.
+            headers (Mapping[str, str], optional): The headers of the request,
+                sent in addition to the transport's headers.
+            data (Any, optional): The body of the request.
+            stream (bool, optional): If True, the body of the response is only
+                read once it is accessed.
+            allow_redirects (bool, optional): If True, redirects are followed.
+            timeout (float, optional): The seconds to wait for the server.
+
+        Returns:
+            Response: The response.
+        """
+
+        (body, headers) = encode_body(data, self.get_headers(headers))
+        raw = self.pool_manager.request(
+            method,
+            url,
+            body=body,
+            headers=dict(headers),
+            redirect=allow_redirects,
+            retries=urllib3.Retry(self.retries, redirect=10 if allow_redirects else 0),
+            timeout=timeout if timeout is not None else self.timeout,
+            preload_content=not stream,
+        )
+        http_version = f"HTTP/{raw.version // 10}.{raw.version % 10}"
+        if not stream:
+            return Response(
+                raw.status,
+                raw.headers,
+                url=raw.geturl() or url,
+                http_version=http_version,
+                content=raw.data,
+            )
+
+        def release():
+            # NOTE: connections of partially read bodies are dropped, not reused
+            if not raw.closed:
+                raw.close()
+            raw.release_conn()
+
+        def iter_stream(chunk_size: int):
+            try:
+                yield from raw.stream(chunk_size, decode_content=True)
+            finally:
+                release()
+
+        return Response(
+            raw.status,
+            raw.headers,
+            url=raw.geturl() or url,
+            http_version=http_version,
+            stream=iter_stream,
+            release=release,
+        )
+
+    def close(self):
+        """Closes the connections of the transport.
+        """
+
+        with self._lock:
+            if self._pool_manager is not None:
+                self._pool_manager.clear()
@@ -2,8 +2,21 @@
 # MIT License <https://opensource.org/licenses/MIT>
 
 import os
+import re
+import html
 import pathlib
 import importlib.util
+from typing import Any, List, Tuple, Callable, Iterable
+
+import attr
+import ujson
+
+# 4chan comments only use a handful of tags, so no DOM is built for them
+HTML_BREAK_PATTERN = re.compile(r"<br\s*/?>|</p>", re.IGNORECASE)
+HTML_TAG_PATTERN = re.compile(r"<[^>]*>")
+# only structural characters need to be visited to split JSON documents
+JSON_TOKEN_PATTERN = re.compile(r'[{}\[\]",:]')
+JSON_STRING_PATTERN = re.compile(r'"(?:[^"\\]|\\.)*"', re.DOTALL)
 
 
 def normalize_path(filepath: str, expand_vars: bool = False) -> str:
@@ -35,3 +48,223 @@ def is_importable(name: str) -> bool:
     """
 
     return bool(importlib.util.find_spec(name))
+
+
+def html_to_text(markup: str) -> str:
+    """Renders simple html markup (such as 4chan comments) as plain text.
+
+    Note:
+        Line breaks (``<br>``) become newlines, all other tags (quotes, links,
+        spoilers, ``<wbr>``) are dropped while keeping their text, and entities
+        are unescaped.
+        This does not build a DOM, so it is only suitable for flat markup.
+
+    Args:
+        markup (str): The html markup to render.
+
+    Returns:
+        str: The plain text of the markup.
+
+    Examples:
+        >>> html_to_text('<a class="quotelink">&gt;&gt;123</a><br>hello&#039;s')
+        ">>123\nhello's"
+    """
+
+    text = HTML_BREAK_PATTERN.sub("\n", markup)
+    return html.unescape(HTML_TAG_PATTERN.sub("", text)).strip()
+
+
+@attr.s
+class LazyText(object):
+    """Text which is only rendered from its raw value on first access.
+
+    Note:
+        A single lazy text can be shared between several content instances
+        (such as the variants of a post) so it is rendered at most once.
+
+    Attributes:
+        raw (str): The raw value of the text.
+        render (callable): The callable rendering the raw value as text.
+    """
+
+    raw = attr.ib(type=str, repr=False)
+    render = attr.ib(type=Callable[[str], str], default=html_to_text, repr=False)
+
+    _text = attr.ib(type=str, default=None, init=False, repr=False, eq=False)
+
+    def __str__(self) -> str:
+        if self._text is None:
+            self._text = self.render(self.raw)
+        return self._text
+
+
+@attr.s
+class JSONArraySplitter(object):
+    """Incrementally splits the items of a JSON array out of a streamed document.
+
+    Note:
+        Only the text of the current item (or sibling value) is buffered, so
+        memory stays flat regardless of the number of items in the array.
+        Values of the keys next to the array (such as the title of an album)
+        are kept in :attr:`~JSONArraySplitter.siblings` as they are parsed, so
+        only those preceding the array are known when its items are yielded.
+
+    Attributes:
+        path (tuple[str, ...]): The keys of the objects leading to the array,
+            an empty path splits a document which is an array itself.
+        siblings (dict[str,....]): The values of the keys next to the array.
+
+    Examples:
+        >>> splitter = JSONArraySplitter(["data", "images"])
+        >>> splitter.feed('{"data": {"title": "album", "images": [{"id": 1}, {"i')
+        [{'id': 1}]
+        >>> splitter.feed('d": 2}]}}')
+        [{'id': 2}]
+        >>> splitter.siblings
+        {'title': 'album'}
+    """
+
+    path = attr.ib(type=Tuple[str, ...], converter=tuple)
+    siblings = attr.ib(type=dict, default=attr.Factory(dict), init=False, repr=False)
+
+    _buffer = attr.ib(type=str, default="", init=False, repr=False)
+    _position = attr.ib(type=int, default=0, init=False, repr=False)
+    # frames of [token, current key, is expecting a key] for each open container
+    _stack = attr.ib(type=list, default=attr.Factory(list), init=False, repr=False)
+    # the start of the value being captured, nothing before it is buffered
+    _mark = attr.ib(type=int, default=None, init=False, repr=False)
+    _sibling = attr.ib(type=str, default=None, init=False, repr=False)
+    _target_depth = attr.ib(type=int, default=None, init=False, repr=False)
+
+    def _is_on_path(self, depth: int) -> bool:
+        return len(self._stack) >= depth and all(
+            frame[0] == "{" and frame[1] == key
+            for (frame, key) in zip(self._stack[:depth], self.path[:depth])
+        )
+
+    def _capture(self, end: int) -> str:
+        value = self._buffer[self._mark:end].strip()
+        self._mark = None
+        return value
+
+    def _on_string(self, start: int) -> bool:
+        match = JSON_STRING_PATTERN.match(self._buffer, start)
+        if match is None:
+            # the rest of the string has not been received yet
+            return False
+        self._position = match.end()
+        if len(self._stack) > 0 and self._stack[-1][0] == "{" and self._stack[-1][2]:
+            self._stack[-1][1] = ujson.loads(match.group())
+            self._stack[-1][2] = False
+        return True
+
+    def _on_open(self, token: str):
+        depth = len(self.path)
+        if token == "[" and len(self._stack) == depth and self._is_on_path(depth):
+            self._target_depth = depth + 1
+            self._mark = self._position
+        self._stack.append([token, None, True])
+
+    def _on_separator(self, token: str, start: int, items: List[Any]):
+        depth = len(self._stack)
+        if depth == self._target_depth:
+            item = self._capture(start)
+            # the closing bracket of an empty array has no item before it
+            if len(item) > 0 or token == ",":
+                items.append(ujson.loads(item))
+            if token == ",":
+                self._mark = self._position
+            else:
+                self._target_depth = None
+        elif depth == len(self.path) and self._sibling is not None:
+            self.siblings[self._sibling] = ujson.loads(self._capture(start))
+            self._sibling = None
+
+        if token in "}]":
+            self._stack.pop()
+        elif self._stack[-1][0] == "{":
+            self._stack[-1][2] = True
+
+    def _on_colon(self):
+        depth = len(self.path)
+        if (
+            depth > 0
+            and len(self._stack) == depth
+            and self._stack[-1][1] != self.path[-1]
+            and self._is_on_path(depth - 1)
+        ):
+            self._sibling = self._stack[-1][1]
+            self._mark = self._position
+
+    def feed(self, text: str) -> List[Any]:
+        """Feeds the next chunk of the document to the splitter.
+
+        Args:
+            text (str): The next chunk of the document.
+
+        Raises:
+            ValueError: If an item of the array is not valid JSON.
+
+        Returns:
+            list[....]: The items of the array completed by the chunk.
+        """
+
+        items = []
+        self._buffer += text
+        while True:
+            match = JSON_TOKEN_PATTERN.search(self._buffer, self._position)
+            if match is None:
+                self._position = len(self._buffer)
+                break
+            (token, start) = (match.group(), match.start())
+            if token == '"':
+                if not self._on_string(start):
+                    self._position = start
+                    break
+                continue
+
+            self._position = start + 1
+            if token in "{[":
+                self._on_open(token)
+            elif token == ":":
+                self._on_colon()
+            else:
+                self._on_separator(token, start, items)
+
+        # drop the text which has already been split
+        keep = self._position if self._mark is None else self._mark
+        self._buffer = self._buffer[keep:]
+        self._position -= keep
+        if self._mark is not None:
+            self._mark -= keep
+        return items
+
+    def close(self):
+        """Indicates the whole document has been fed.
+
+        Raises:
+            ValueError: If the document was truncated.
+        """
+
+        if len(self._stack) > 0 or len(self._buffer.strip()) > 0:
+            raise ValueError(f"truncated JSON document, expected array at {self.path}")
+
+
+def iter_json_array(chunks: Iterable[str], path: Iterable[str]) -> Iterable[Any]:
+    """Iterates over the items of a JSON array as the document is streamed.
+
+    Args:
+        chunks (iterable[str]): The chunks of the document.
+        path (iterable[str]): The keys of the objects leading to the array.
+
+    Raises:
+        ValueError: If the document is invalid or truncated.
+
+    Yields:
+        ....: The items of the array.
+    """
+
+    splitter = JSONArraySplitter(path)
+    for chunk in chunks:
+        yield from splitter.feed(chunk)
+    splitter.close()
@@ -79,16 +79,22 @@ setuptools.setup(
     url='https://github.com/stephen-bunn/qetch',
     include_package_data=True,
     install_requires=REQUIRES,
+    extras_require={
+        'async': ['aiohttp'],
+        'http2': ['httpx[http2]'],
+    },
     packages=setuptools.find_packages(),
     keywords=['qetch'],
     entry_points={
         'console_scripts': ['qetch=qetch.cli:cli']
     },
-    python_requires='>=3.5',
+    python_requires='>=3.8',
     classifiers=[
         'Development Status :: 2 - Pre-Alpha',
-        'Programming Language :: Python :: 3.5',
-        'Programming Language :: Python :: 3.6',
+        'Programming Language :: Python :: 3.8',
+        'Programming Language :: Python :: 3.9',
+        'Programming Language :: Python :: 3.10',
+        'Programming Language :: Python :: 3.11',
         'Intended Audience :: Developers',
         'Operating System :: POSIX',
         'Operating System :: MacOS :: MacOS X',
@@ -1,8 +1,14 @@
 # Copyright (c) 2018 Stephen Bunn <stephen@bunn.io>
 # MIT License <https://opensource.org/licenses/MIT>
 
+import time
+import threading
+from http.server import HTTPServer, BaseHTTPRequestHandler
+from socketserver import ThreadingMixIn
+
 from qetch.downloaders import HTTPDownloader
 from qetch.extractors import GenericExtractor
+from qetch.transports import MemoryTransport
 
 import pytest
 
@@ -28,3 +34,50 @@ def sample_http_content(request):
 @pytest.fixture(scope="session", params=CONNECTION_COUNTS)
 def connection_count(request):
     return request.param
+
+
+@pytest.fixture
+def memory_transport():
+    return MemoryTransport()
+
+
+class HTTPHandler(BaseHTTPRequestHandler):
+    """ Answers requests with keep-alive responses after a delay.
+    """
+
+    protocol_version = "HTTP/1.1"
+    delay = 0.0
+
+    def respond(self, body, content_type="text/plain"):
+        time.sleep(self.delay)
+        self.send_response(200)
+        self.send_header("Content-Type", content_type)
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def do_GET(self):
+        self.respond(b"ok")
+
+    def do_POST(self):
+        body = self.rfile.read(int(self.headers.get("Content-Length", 0)))
+        self.respond(body, self.headers.get("Content-Type", "text/plain"))
+
+    def log_message(self, *args):
+        pass
+
+
+class ThreadingHTTPServer(ThreadingMixIn, HTTPServer):
+    daemon_threads = True
+
+
+@pytest.fixture
+def http_server():
+    handler = type("HTTPHandler", (HTTPHandler,), {})
+    server = ThreadingHTTPServer(("127.0.0.1", 0), handler)
+    (server.handler, server.url) = (handler, f"http://127.0.0.1:{server.server_port}")
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    yield server
+    server.shutdown()
+    server.server_close()
@@ -1,10 +1,39 @@
 # Copyright (c) 2018 Stephen Bunn <stephen@bunn.io>
 # MIT License <https://opensource.org/licenses/MIT>
 
+import time
 import hashlib
 import tempfile
 from pathlib import Path
 
+from qetch.downloaders import HTTPDownloader
+from qetch.extractors import GenericExtractor
+from qetch.transports import MemoryTransport
+from qetch.transports._common import Response
+from qetch.downloaders._common import RangeScheduler
+
+import pytest
+
+
+class ThrottledTransport(MemoryTransport):
+    """ Streams ranges from the first byte slowly, like a throttled connection.
+    """
+
+    def request(self, method, url, headers=None, stream=False, **kwargs):
+        response = super().request(method, url, headers=headers, **kwargs)
+        if not (headers or {}).get("range", "").startswith("bytes=0-"):
+            return response
+
+        def iter_stream(chunk_size):
+            for start in range(0, len(response.content), chunk_size):
+                time.sleep(0.01)
+                stop = start + chunk_size
+                yield response.content[start:stop]
+
+        return Response(
+            response.status_code, response.headers, url=url, stream=iter_stream
+        )
+
 
 def test_download(http_downloader, sample_http_content, connection_count):
     (content, checksum) = sample_http_content
@@ -21,3 +50,95 @@ def test_download(http_downloader, sample_http_content, connection_count):
                 md5.update(chunk)
 
         assert md5.hexdigest().lower() == checksum.lower()
+
+
+def test_memory_download(monkeypatch, tmp_path):
+    body = bytes(index % 251 for index in range(100000))
+    transport = MemoryTransport()
+    transport.add("https://example.com/file.bin", body)
+    monkeypatch.setattr(HTTPDownloader, "transport", transport)
+
+    (content,) = next(GenericExtractor().extract("https://example.com/file.bin"))
+    to_path = tmp_path / "file.bin"
+    HTTPDownloader().download(content, to_path.as_posix(), max_connections=4)
+
+    assert to_path.read_bytes() == body
+    ranges = [headers["Range"] for (method, _, headers) in transport.requests[1:]]
+    assert len(ranges) == 4
+
+
+def test_instance_transport(memory_transport, tmp_path):
+    memory_transport.add("https://example.com/file.bin", b"content")
+    (content,) = next(GenericExtractor().extract("https://example.com/file.bin"))
+    downloader = HTTPDownloader()
+    downloader.transport = memory_transport
+    downloader.download(content, (tmp_path / "file.bin").as_posix())
+
+    assert (tmp_path / "file.bin").read_bytes() == b"content"
+    assert len(memory_transport.requests) > 0
+    assert HTTPDownloader.transport is not memory_transport
+    assert HTTPDownloader().session is not memory_transport
+
+    downloader.transport = "memory"
+    assert downloader.session is not memory_transport
+    assert downloader.session is downloader.session
+
+
+def test_completion_wait(monkeypatch, tmp_path):
+    transport = MemoryTransport()
+    transport.add("https://example.com/file.bin", b"content")
+    monkeypatch.setattr(HTTPDownloader, "transport", transport)
+
+    (content,) = next(GenericExtractor().extract("https://example.com/file.bin"))
+    downloader = HTTPDownloader()
+    started = time.monotonic()
+    downloader.download(content, (tmp_path / "file.bin").as_posix(), update_delay=5)
+
+    assert time.monotonic() - started < 1
+    assert not downloader.download_state
+
+
+def test_fragment_failure(monkeypatch, tmp_path):
+    transport = MemoryTransport(latency=0.05)
+    transport.add("https://example.com/0.bin", b"content")
+    transport.add("https://example.com/2.bin", b"content")
+    monkeypatch.setattr(HTTPDownloader, "transport", transport)
+
+    (content,) = next(GenericExtractor().extract("https://example.com/0.bin"))
+    content.fragments = [f"https://example.com/{index}.bin" for index in range(3)]
+    with pytest.raises(KeyError):
+        HTTPDownloader().download(content, (tmp_path / "file.bin").as_posix())
+
+    requested = {url for (_, url, _) in transport.requests}
+    assert "https://example.com/1.bin" in requested
+    assert "https://example.com/2.bin" not in requested
+
+
+def test_range_scheduler():
+    scheduler = RangeScheduler([(0, 100)], min_segment=10)
+    first = scheduler.next()
+    assert (first.start, first.end, first.advance(20)) == (0, 100, 20)
+
+    second = scheduler.next()
+    assert (second.start, second.end, first.end) == (60, 100, 60)
+    assert first.advance(50) == 40
+
+    scheduler.release(first)
+    assert second.advance(25) == 25
+    assert scheduler.next() is None
+
+
+def test_range_stealing(monkeypatch, tmp_path):
+    body = bytes(index % 251 for index in range(65536))
+    transport = ThrottledTransport()
+    transport.add("https://example.com/file.bin", body)
+    monkeypatch.setattr(HTTPDownloader, "transport", transport)
+    monkeypatch.setattr(HTTPDownloader, "min_segment", 1024)
+
+    (content,) = next(GenericExtractor().extract("https://example.com/file.bin"))
+    to_path = tmp_path / "file.bin"
+    HTTPDownloader().download(content, to_path.as_posix(), max_connections=2)
+
+    assert to_path.read_bytes() == body
+    ranges = [headers["Range"] for (method, _, headers) in transport.requests[1:]]
+    assert len(ranges) > 2
@@ -0,0 +1,100 @@
+# Copyright (c) 2018 Stephen Bunn <stephen@bunn.io>
+# MIT License <https://opensource.org/licenses/MIT>
+
+import threading
+
+from qetch.downloaders import HTTPDownloader
+from qetch.extractors import GenericExtractor
+from qetch.transports import MemoryTransport
+from qetch.downloaders._common import ProgressTracker
+
+import blinker
+
+
+class Clock(object):
+    """ A fake clock which only advances when told to.
+    """
+
+    def __init__(self):
+        self.now = 0.0
+
+    def __call__(self):
+        return self.now
+
+
+def test_coalesced_events():
+    events = []
+    clock = Clock()
+    tracker = ProgressTracker(
+        "download",
+        total=10,
+        update_delay=1.0,
+        hooks=[lambda download_id, **kwargs: events.append(kwargs)],
+        clock=clock,
+    )
+    (first, second) = (tracker.counter(), tracker.counter())
+
+    first.add(2)
+    second.add(3)
+    clock.now = 1.5
+    second.add(1)
+    first.add(4)
+    tracker.finish()
+
+    assert events == [
+        {"current": 2, "total": 10},
+        {"current": 6, "total": 10},
+        {"current": 10, "total": 10},
+    ]
+
+
+def test_concurrent_counts():
+    signal = blinker.Signal()
+    received = []
+
+    def receive(sender, current, total):
+        received.append(current)
+
+    signal.connect(receive)
+    tracker = ProgressTracker("download", update_delay=0.0, signal=signal)
+
+    def count():
+        counter = tracker.counter()
+        for _ in range(10000):
+            counter.add(1)
+
+    threads = [threading.Thread(target=count) for _ in range(8)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    tracker.finish()
+
+    assert tracker.current == 80000
+    assert received == sorted(received)
+    assert received[-1] == 80000
+
+
+def test_download_progress(monkeypatch, tmp_path):
+    body = bytes(index % 251 for index in range(50000))
+    transport = MemoryTransport()
+    transport.add("https://example.com/file.bin", body)
+    monkeypatch.setattr(HTTPDownloader, "transport", transport)
+
+    events = []
+    downloader = HTTPDownloader()
+    (content,) = next(GenericExtractor().extract("https://example.com/file.bin"))
+    downloader.download(
+        content,
+        (tmp_path / "file.bin").as_posix(),
+        max_connections=4,
+        progress_hook=lambda download_id, **kwargs: events.append(kwargs),
+        update_delay=0.0,
+    )
+
+    assert events[-1] == {"current": len(body), "total": len(body)}
+    assert [event["current"] for event in events] == sorted(
+        event["current"] for event in events
+    )
+    assert not downloader._trackers
+    assert not HTTPDownloader.on_progress.receivers
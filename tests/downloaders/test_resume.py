@@ -0,0 +1,144 @@
+# Copyright (c) 2018 Stephen Bunn <stephen@bunn.io>
+# MIT License <https://opensource.org/licenses/MIT>
+
+import time
+
+from qetch.exceptions import DownloadError
+from qetch.downloaders import HTTPDownloader
+from qetch.extractors import GenericExtractor
+from qetch.transports import MemoryTransport
+from qetch.downloaders._common import ChunkJournal, DownloadState
+
+import pytest
+
+URL = "https://example.com/file.bin"
+BODY = bytes(index % 251 for index in range(100000))
+
+
+def fail_from(offset: int):
+    handle_chunk = HTTPDownloader.handle_chunk
+
+    def failing_chunk(self, download_id, url, to_path, start, end, **kwargs):
+        if start >= offset:
+            # NOTE: fails once the chunks before the offset are written
+            time.sleep(0.1)
+            raise ConnectionError("connection dropped")
+        return handle_chunk(self, download_id, url, to_path, start, end, **kwargs)
+
+    return failing_chunk
+
+
+@pytest.fixture
+def transport(monkeypatch):
+    transport = MemoryTransport()
+    transport.add(URL, BODY, headers={"ETag": '"v1"'})
+    monkeypatch.setattr(HTTPDownloader, "transport", transport)
+    monkeypatch.setattr(HTTPDownloader, "journal_interval", 1000)
+    return transport
+
+
+def test_journal(tmp_path):
+    path = (tmp_path / "0.journal").as_posix()
+    journal = ChunkJournal(path, URL, 100, '"v1"')
+    journal.add(10, 20)
+    journal.add(30, 40)
+    journal.add(20, 25)
+
+    loaded = ChunkJournal.load(path)
+    assert loaded.ranges == [(10, 25), (30, 40)]
+    assert loaded.completed == 25
+    assert loaded.pending([(0, 50), (50, 100)]) == [
+        (0, 10),
+        (25, 30),
+        (40, 50),
+        (50, 100),
+    ]
+    assert loaded.matches(URL, 100, '"v1"')
+    assert not loaded.matches(URL, 100, '"v2"')
+
+    assert ChunkJournal.get_validator({"ETag": 'W/"v1"', "Last-Modified": "x"}) == "x"
+    loaded.discard()
+    assert ChunkJournal.load(path) is None
+
+
+def test_resume(monkeypatch, transport, tmp_path):
+    (content,) = next(GenericExtractor().extract(URL))
+    to_path = tmp_path / "file.bin"
+    with monkeypatch.context() as patch:
+        patch.setattr(HTTPDownloader, "handle_chunk", fail_from(50000))
+        with pytest.raises(ConnectionError):
+            HTTPDownloader().download(
+                content, to_path.as_posix(), max_connections=4, resume=True
+            )
+
+    journal = ChunkJournal.load((tmp_path / "file.bin.part" / "0.journal").as_posix())
+    assert journal.completed == 50000
+    del transport.requests[:]
+
+    events = []
+    HTTPDownloader().download(
+        content,
+        to_path.as_posix(),
+        max_connections=4,
+        progress_hook=lambda download_id, **kwargs: events.append(kwargs),
+        resume=True,
+    )
+    assert to_path.read_bytes() == BODY
+    assert not (tmp_path / "file.bin.part").exists()
+    assert events[-1] == {"current": len(BODY), "total": len(BODY)}
+
+    requested = 0
+    for (method, _, headers) in transport.requests:
+        if method == "GET":
+            assert headers["If-Range"] == '"v1"'
+            (start, end) = headers["Range"].replace("bytes=", "").split("-")
+            requested += int(end) + 1 - int(start)
+    assert requested == len(BODY) - journal.completed
+
+
+def test_resume_changed(monkeypatch, transport, tmp_path):
+    (content,) = next(GenericExtractor().extract(URL))
+    to_path = tmp_path / "file.bin"
+    with monkeypatch.context() as patch:
+        patch.setattr(HTTPDownloader, "handle_chunk", fail_from(50000))
+        with pytest.raises(ConnectionError):
+            HTTPDownloader().download(content, to_path.as_posix(), resume=True)
+
+    changed = bytes(reversed(BODY))
+    transport.add(URL, changed, headers={"ETag": '"v2"'})
+    HTTPDownloader().download(content, to_path.as_posix(), resume=True)
+    assert to_path.read_bytes() == changed
+
+
+def test_resume_reallocated(monkeypatch, transport, tmp_path):
+    (content,) = next(GenericExtractor().extract(URL))
+    to_path = tmp_path / "file.bin"
+    partial_path = tmp_path / "file.bin.part" / "0"
+    for offset in (50000, 0):
+        with monkeypatch.context() as patch:
+            patch.setattr(HTTPDownloader, "handle_chunk", fail_from(offset))
+            with pytest.raises(ConnectionError):
+                HTTPDownloader().download(content, to_path.as_posix(), resume=True)
+        # NOTE: the partial file is lost, then reallocated before any write
+        if offset:
+            partial_path.unlink()
+
+    assert ChunkJournal.load(f"{partial_path}.journal") is None
+    HTTPDownloader().download(content, to_path.as_posix(), resume=True)
+    assert to_path.read_bytes() == BODY
+
+
+def test_changed_chunk(transport, tmp_path):
+    to_path = tmp_path / "0"
+    to_path.write_bytes(bytes(len(BODY)))
+    journal = ChunkJournal(f"{to_path}.journal", URL, len(BODY), '"v0"')
+    journal.add(0, 10)
+
+    downloader = HTTPDownloader()
+    downloader.download_state["download"] = DownloadState.RUNNING
+    with pytest.raises(DownloadError):
+        downloader.handle_chunk(
+            "download", URL, to_path.as_posix(), 10, 100, journal=journal
+        )
+    assert ChunkJournal.load(journal.path) is None
+    del downloader.download_state["download"]
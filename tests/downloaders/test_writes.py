@@ -0,0 +1,62 @@
+# Copyright (c) 2018 Stephen Bunn <stephen@bunn.io>
+# MIT License <https://opensource.org/licenses/MIT>
+
+import shutil
+import collections
+
+from qetch.exceptions import DownloadError
+from qetch.downloaders._common import ChunkWriter, PartialFile, ChunkJournal
+
+import pytest
+
+
+class RecordingFile(object):
+    """ A file recording its writes and syncs.
+    """
+
+    def __init__(self):
+        self.writes = []
+        self.syncs = 0
+
+    def write(self, data, offset):
+        self.writes.append((offset, bytes(data)))
+
+    def sync(self):
+        self.syncs += 1
+
+
+def test_aligned_writes(tmp_path):
+    file_ = RecordingFile()
+    journal = ChunkJournal((tmp_path / "0.journal").as_posix(), "url", 64, "etag")
+    writer = ChunkWriter(file_, 5, block_size=8, journal=journal, journal_interval=16)
+    for index in range(10):
+        writer.write(bytes([index] * 3))
+    writer.close()
+
+    assert [(offset, len(data)) for (offset, data) in file_.writes] == [
+        (5, 3),
+        (8, 8),
+        (16, 8),
+        (24, 8),
+        (32, 3),
+    ]
+    assert b"".join(data for (_, data) in file_.writes) == b"".join(
+        bytes([index] * 3) for index in range(10)
+    )
+    assert (file_.syncs, journal.ranges) == (2, [(5, 35)])
+
+
+def test_partial_file(monkeypatch, tmp_path):
+    path = tmp_path / "0"
+    path.write_bytes(b"stale content")
+    with PartialFile(path.as_posix()) as partial_file:
+        partial_file.preallocate(10)
+        partial_file.write(b"world", 5)
+        partial_file.write(b"hello", 0)
+    assert path.read_bytes() == b"helloworld"
+
+    usage = collections.namedtuple("usage", ["total", "used", "free"])
+    monkeypatch.setattr(shutil, "disk_usage", lambda path: usage(100, 95, 5))
+    with PartialFile(path.as_posix()) as partial_file:
+        with pytest.raises(DownloadError):
+            partial_file.preallocate(10)
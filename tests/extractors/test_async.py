@@ -0,0 +1,159 @@
+# Copyright (c) 2018 Stephen Bunn (stephen@bunn.io)
+# MIT License <https://opensource.org/licenses/MIT>
+
+import asyncio
+
+import qetch
+from qetch.auth import TokenCache
+from qetch.content import Content
+from qetch.extractors.gfycat import AsyncGfycatExtractor
+from qetch.extractors.fourchan import AsyncFourChanExtractor
+from qetch.extractors._common import AsyncBaseExtractor
+
+import ujson
+import pytest
+
+GFYCAT_URL = "https://gfycat.com/ExampleGfycatName"
+GFYCAT_DATA = {
+    "gfyItem": {
+        "gfyId": "examplegfycatname",
+        "title": "example",
+        "userName": "anonymous",
+        "createDate": 1520000000,
+        "mp4Url": "https://giant.gfycat.com/ExampleGfycatName.mp4",
+        "webmUrl": "https://giant.gfycat.com/ExampleGfycatName.webm",
+    }
+}
+FOURCHAN_URL = "https://boards.4chan.org/g/thread/12345678"
+FOURCHAN_DATA = {
+    "posts": [
+        {
+            "no": 12345678,
+            "time": 1520000000,
+            "tim": 1520000000000,
+            "ext": ".png",
+            "md5": "abc",
+            "filename": "first",
+            "name": "Anonymous",
+        },
+        {"no": 12345679, "time": 1520000001, "com": "no file"},
+        {
+            "no": 12345680,
+            "time": 1520000002,
+            "tim": 1520000002000,
+            "ext": ".webm",
+            "md5": "def",
+            "filename": "second",
+            "name": "Anonymous",
+        },
+    ]
+}
+
+
+def collect(extractor, url, *args, **kwargs):
+    """ Collects the content lists of an asynchronous extraction.
+    """
+
+    async def extract():
+        return [
+            content_list
+            async for content_list in extractor.extract(url, *args, **kwargs)
+        ]
+
+    return asyncio.run(extract())
+
+
+def fake_fetch(responses, requested):
+    """ Builds a fake fetch coroutine returning canned responses.
+    """
+
+    async def fetch(url, method="GET", **kwargs):
+        requested.append((method, url))
+        return responses[url]
+
+    return fetch
+
+
+class TestAsyncExtractors(object):
+    """ Test the asynchronous extractors.
+    """
+
+    def test_get_extractor(self):
+        """ Test getting the asynchronous counterpart of an extractor.
+        """
+
+        assert qetch.get_extractor(GFYCAT_URL, asynchronous=True) is (
+            AsyncGfycatExtractor
+        )
+        assert issubclass(
+            qetch.get_extractor("https://example.com/a.mp4", asynchronous=True),
+            AsyncBaseExtractor,
+        )
+
+    def test_gfycat_extract(self):
+        """ Test asynchronously extracting gfycat content.
+        """
+
+        requested = []
+        TokenCache().clear()
+        extractor = AsyncGfycatExtractor()
+        extractor.fetch = fake_fetch(
+            {
+                "https://api.gfycat.com/v1/oauth/token/": (
+                    200,
+                    ujson.dumps({"access_token": "token"}),
+                ),
+                "https://api.gfycat.com/v1/gfycats/ExampleGfycatName": (
+                    200,
+                    ujson.dumps(GFYCAT_DATA),
+                ),
+            },
+            requested,
+        )
+        (content_list,) = collect(extractor, GFYCAT_URL, auth_tuple=("key", "secret"))
+
+        assert [content.quality for content in content_list] == [1.0, 0.5]
+        assert all(isinstance(content, Content) for content in content_list)
+        assert extractor.headers["Authorization"] == "Bearer token"
+        assert [method for (method, _) in requested] == ["POST", "GET"]
+
+    def test_fourchan_extract(self):
+        """ Test asynchronously extracting 4chan content.
+        """
+
+        requested = []
+        extractor = AsyncFourChanExtractor()
+        extractor.fetch = fake_fetch(
+            {
+                "https://a.4cdn.org/g/thread/12345678.json": (
+                    200,
+                    ujson.dumps(FOURCHAN_DATA),
+                )
+            },
+            requested,
+        )
+        content_lists = collect(extractor, FOURCHAN_URL)
+
+        assert len(content_lists) == 2
+        assert content_lists[1][0].fragments == [
+            "https://i.4cdn.org/g/1520000002000.webm"
+        ]
+        assert len(requested) == 1
+
+    def test_shared_session(self):
+        """ Test asynchronous extractors share a single session per loop.
+        """
+
+        pytest.importorskip("aiohttp")
+
+        async def get_sessions():
+            sessions = (
+                AsyncGfycatExtractor().session,
+                AsyncFourChanExtractor().session,
+            )
+            await AsyncBaseExtractor.close_session()
+            return sessions
+
+        (first, second) = asyncio.run(get_sessions())
+        assert first is second
+        assert first.closed
@@ -0,0 +1,305 @@
+# Copyright (c) 2018 Stephen Bunn (stephen@bunn.io)
+# MIT License <https://opensource.org/licenses/MIT>
+
+import asyncio
+
+from qetch import exceptions
+from qetch.extractors.fourchan import (
+    FourChanPoller,
+    FourChanExtractor,
+    AsyncFourChanExtractor,
+)
+
+import ujson
+import pytest
+
+THREAD_URL = "https://boards.4chan.org/g/thread/{id}"
+QUERY_URL = "https://a.4cdn.org/g/thread/{id}.json"
+BOARD_URL = "https://boards.4chan.org/g/catalog"
+BOARD_QUERY_URL = "https://a.4cdn.org/g/threads.json"
+
+
+def get_post(no, **kwargs):
+    """ Builds the API data of a post with a file.
+    """
+
+    post = {
+        "no": no,
+        "time": 1520000000,
+        "tim": 1520000000000 + no,
+        "ext": ".png",
+        "md5": str(no),
+        "filename": str(no),
+    }
+    post.update(kwargs)
+    return post
+
+
+def add_thread(transport, id, status=200, posts=None, last_modified=None):
+    """ Adds the API data of a thread answering a single request.
+    """
+
+    transport.add(
+        QUERY_URL.format(id=id),
+        ujson.dumps({"posts": posts or []}),
+        status=status,
+        headers={} if last_modified is None else {"Last-Modified": last_modified},
+        once=True,
+    )
+
+
+class Clock(object):
+    """ A fake clock which only advances by sleeping.
+    """
+
+    def __init__(self):
+        self.now = 0.0
+
+    def __call__(self):
+        return self.now
+
+    def sleep(self, seconds):
+        self.now += seconds
+
+
+def get_poller(transport, **kwargs):
+    """ Gets a poller requesting through a transport using a fake clock.
+    """
+
+    clock = Clock()
+    return FourChanPoller(
+        extractor=FourChanExtractor(transport=transport),
+        clock=clock,
+        sleep=clock.sleep,
+        **kwargs,
+    )
+
+
+class TestFourChanWatch(object):
+    """ Test watching 4chan threads.
+    """
+
+    def test_poll_thread(self, memory_transport):
+        """ Test polling a thread only returns new posts.
+        """
+
+        add_thread(
+            memory_transport,
+            1,
+            posts=[get_post(1, com="&gt;&gt;0<br>hello"), {"no": 2}],
+            last_modified="Mon, 01 Jan 2018",
+        )
+        add_thread(memory_transport, 1, status=304)
+        add_thread(memory_transport, 1, posts=[get_post(1), {"no": 2}, get_post(3)])
+        poller = get_poller(memory_transport)
+        cursor = poller.watch(THREAD_URL.format(id=1))
+        extractor = poller.extractor
+
+        (content_list,) = extractor.poll_thread(cursor)
+        assert cursor.last_no == 2
+        assert content_list[0]._description is content_list[1]._description
+        assert content_list[1].description == ">>0\nhello"
+        assert extractor.poll_thread(cursor) == []
+        (content_list,) = extractor.poll_thread(cursor)
+        assert content_list[0].metadata["no"] == 3
+        assert cursor.last_no == 3
+
+        assert [dict(headers) for (_, _, headers) in memory_transport.requests] == [
+            {},
+            {"If-Modified-Since": "Mon, 01 Jan 2018"},
+            {"If-Modified-Since": "Mon, 01 Jan 2018"},
+        ]
+
+    def test_poll(self, memory_transport):
+        """ Test the poller spaces requests and backs off quiet threads.
+        """
+
+        add_thread(memory_transport, 1, posts=[get_post(1)])
+        add_thread(memory_transport, 1, status=304)
+        add_thread(memory_transport, 1, status=304)
+        add_thread(memory_transport, 1, posts=[get_post(1, archived=1), get_post(2)])
+        add_thread(memory_transport, 2, posts=[get_post(5)])
+        add_thread(memory_transport, 2, status=404)
+        poller = get_poller(memory_transport, min_interval=10.0, backoff=2.0)
+        for id in (1, 2):
+            poller.watch(THREAD_URL.format(id=id))
+        clock = poller.clock
+        polls = []
+        original_poll_thread = poller.extractor.poll_thread
+
+        def poll_thread(cursor):
+            polls.append((clock(), cursor.id))
+            return original_poll_thread(cursor)
+
+        poller.extractor.poll_thread = poll_thread
+        results = [
+            (cursor.id, content_list[0].metadata["no"])
+            for (cursor, content_list) in poller.poll()
+        ]
+
+        assert results == [("1", 1), ("2", 5), ("1", 2)]
+        assert polls == [
+            (0.0, "1"),
+            (1.0, "2"),
+            (10.0, "1"),
+            (11.0, "2"),
+            (30.0, "1"),
+            (70.0, "1"),
+        ]
+        assert len(poller) == 0
+
+    def test_poll_errors(self, memory_transport):
+        """ Test failed polls are given to the error hook or raised.
+        """
+
+        add_thread(memory_transport, 1, status=500)
+        add_thread(memory_transport, 1, status=404)
+        errors = []
+        poller = get_poller(
+            memory_transport, error_hook=lambda cursor, exc: errors.append(cursor.id)
+        )
+        poller.watch(THREAD_URL.format(id=1))
+        assert list(poller.poll()) == []
+        assert errors == ["1"]
+
+        add_thread(memory_transport, 1, status=500)
+        poller = get_poller(memory_transport)
+        poller.watch(THREAD_URL.format(id=1))
+        with pytest.raises(exceptions.ExtractionError):
+            list(poller.poll())
+
+        with pytest.raises(exceptions.ExtractionError):
+            poller.watch("https://example.com/")
+
+    def test_poll_dropped(self, monkeypatch, memory_transport):
+        """ Test polls failing without a response back off instead of raising.
+        """
+
+        add_thread(memory_transport, 1, posts=[get_post(1, archived=1)])
+        request = memory_transport.request
+        failures = [TimeoutError("timed out")]
+
+        def fail_once(*args, **kwargs):
+            if len(failures) > 0:
+                raise failures.pop()
+            return request(*args, **kwargs)
+
+        monkeypatch.setattr(memory_transport, "request", fail_once)
+        errors = []
+        poller = get_poller(
+            memory_transport,
+            min_interval=10.0,
+            backoff=2.0,
+            error_hook=lambda cursor, exc: errors.append(type(exc)),
+        )
+        poller.watch(THREAD_URL.format(id=1))
+        assert [
+            content_list[0].metadata["no"] for (_, content_list) in poller.poll()
+        ] == [1]
+        assert errors == [TimeoutError]
+        assert poller.clock() == 20.0
+
+        failures.append(ConnectionResetError("connection reset"))
+        poller = get_poller(memory_transport)
+        poller.watch(THREAD_URL.format(id=1))
+        with pytest.raises(ConnectionResetError):
+            list(poller.poll())
+
+
+class TestFourChanBoard(object):
+    """ Test crawling 4chan boards.
+    """
+
+    def get_responses(self, last_modified):
+        """ Gets the responses of a board with threads 1, 2 and a pruned 3.
+        """
+
+        return {
+            BOARD_QUERY_URL: (
+                200,
+                ujson.dumps(
+                    [
+                        {
+                            "page": 1,
+                            "threads": [
+                                {"no": 1, "last_modified": last_modified},
+                                {"no": 2, "last_modified": 100},
+                                {"no": 3, "last_modified": 100},
+                            ],
+                        }
+                    ]
+                ),
+            ),
+            QUERY_URL.format(id=1): (200, ujson.dumps({"posts": [get_post(1)]})),
+            QUERY_URL.format(id=2): (
+                200,
+                ujson.dumps({"posts": [get_post(2), get_post(4)]}),
+            ),
+            QUERY_URL.format(id=3): (404, ""),
+        }
+
+    def test_handle(self):
+        """ Test board and catalog urls are handled by the board handle.
+        """
+
+        for url in (BOARD_URL, "https://boards.4chan.org/g/", "http://4chan.org/g"):
+            (handle_name, match) = FourChanExtractor.get_handle(url)
+            assert handle_name == "board"
+            assert match.groupdict()["board"] == "g"
+        assert FourChanExtractor.get_handle(THREAD_URL.format(id=1))[0] == "thread"
+
+    def test_handle_board(self):
+        """ Test crawling a board skips threads unchanged since the last crawl.
+        """
+
+        requested = []
+        extractor = FourChanExtractor()
+        extractor.request_interval = 0.0
+
+        def fetch(url, method="GET", **kwargs):
+            requested.append(url)
+            return responses[url]
+
+        extractor.fetch = fetch
+        responses = self.get_responses(100)
+        content_lists = list(extractor.extract(BOARD_URL))
+
+        assert [
+            (content_list[0].source.url, content_list[0].metadata["no"])
+            for content_list in content_lists
+        ] == [
+            (THREAD_URL.format(id=1), 1),
+            (THREAD_URL.format(id=2), 2),
+            (THREAD_URL.format(id=2), 4),
+        ]
+        assert extractor.crawled == {"g/1": 100, "g/2": 100}
+
+        requested.clear()
+        responses = self.get_responses(200)
+        content_lists = list(extractor.extract(BOARD_URL))
+        assert len(content_lists) == 1
+        assert requested == [
+            BOARD_QUERY_URL,
+            QUERY_URL.format(id=1),
+            QUERY_URL.format(id=3),
+        ]
+
+    def test_async_handle_board(self):
+        """ Test asynchronously crawling a board.
+        """
+
+        extractor = AsyncFourChanExtractor()
+        extractor.request_interval = 0.0
+        responses = self.get_responses(100)
+
+        async def fetch(url, method="GET", **kwargs):
+            return responses[url]
+
+        async def extract():
+            return [
+                content_list async for content_list in extractor.extract(BOARD_URL)
+            ]
+
+        extractor.fetch = fetch
+        assert len(asyncio.run(extract())) == 3
+        assert extractor.crawled == {"g/1": 100, "g/2": 100}
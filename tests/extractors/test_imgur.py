@@ -0,0 +1,238 @@
+# Copyright (c) 2018 Stephen Bunn (stephen@bunn.io)
+# MIT License <https://opensource.org/licenses/MIT>
+
+import time
+import asyncio
+import threading
+
+from qetch import exceptions
+from qetch.cache import MemoryCache
+from qetch.extractors.imgur import (
+    EndpointMemory,
+    ImgurExtractor,
+    AsyncImgurExtractor,
+)
+
+import ujson
+import pytest
+import aiohttp
+
+GALLERY_URL = "https://api.imgur.com/3/gallery/image/{id}"
+IMAGE_URL = "https://api.imgur.com/3/image/{id}"
+
+
+def get_image(id):
+    """ Builds the API response of an image.
+    """
+
+    return ujson.dumps({"data": {"id": id, "datetime": 1520000000}})
+
+
+def get_extractor(
+    extractor_class, requested, is_gallery=False, delays=None, dropped=()
+):
+    """ Gets an imgur extractor whose images are not (or only) gallery items.
+    """
+
+    delays = delays or {}
+
+    def get_response(url):
+        requested.append(url)
+        id = url.split("/")[-1]
+        if ("/gallery/" in url) == is_gallery:
+            return (200, get_image(id))
+        return (404, "")
+
+    if issubclass(extractor_class, AsyncImgurExtractor):
+
+        async def fetch(url, method="GET", **kwargs):
+            await asyncio.sleep(delays.get(url, 0.0))
+            if url in dropped:
+                raise aiohttp.ClientConnectionError(f"{url!r} dropped")
+            return get_response(url)
+
+    else:
+
+        def fetch(url, method="GET", **kwargs):
+            time.sleep(delays.get(url, 0.0))
+            if url in dropped:
+                raise ConnectionResetError(f"{url!r} dropped")
+            return get_response(url)
+
+    extractor = extractor_class()
+    extractor.endpoint_memory = EndpointMemory()
+    extractor.fetch = fetch
+    return extractor
+
+
+class TestImgurEndpoints(object):
+    """ Test selecting the imgur API endpoints to request.
+    """
+
+    def test_learned_endpoints(self):
+        """ Test the endpoint which answered is requested first next time.
+        """
+
+        requested = []
+        extractor = get_extractor(ImgurExtractor, requested)
+
+        assert extractor._get_data("first", is_raw=True)["id"] == "first"
+        assert requested == [
+            GALLERY_URL.format(id="first"),
+            IMAGE_URL.format(id="first"),
+        ]
+
+        requested.clear()
+        extractor._get_data("first", is_raw=True)
+        extractor._get_data("second", is_raw=True)
+        assert requested == [
+            IMAGE_URL.format(id="first"),
+            IMAGE_URL.format(id="second"),
+        ]
+
+        # basic links have a single endpoint which is never requested twice
+        requested.clear()
+        extractor.fetch = lambda url, **kwargs: (requested.append(url) or (404, ""))
+        with pytest.raises(exceptions.ExtractionError):
+            extractor._get_data("basic")
+        assert requested == [IMAGE_URL.format(id="basic")]
+
+    def test_memory(self):
+        """ Test only the most recently seen ids are remembered.
+        """
+
+        memory = EndpointMemory(max_ids=2)
+        endpoints = [("query", "gallery"), ("default", "image")]
+        for id in ("first", "second", "third"):
+            memory.record("raw", id, "query")
+        memory.record("raw", "fourth", "default")
+
+        assert memory.get("raw", "first") is None
+        assert memory.get("raw", "fourth") == "default"
+        assert memory.get("album", "fourth") is None
+        assert memory.order("raw", "fourth", endpoints)[0] == ("default", "image")
+        assert memory.order("raw", "unknown", endpoints)[0] == ("query", "gallery")
+
+        memory.clear()
+        assert memory.get("raw", "fourth") is None
+
+    def test_race_endpoints(self):
+        """ Test racing the endpoints of unknown ids keeps the first to answer.
+        """
+
+        requested = []
+        extractor = get_extractor(
+            ImgurExtractor,
+            requested,
+            is_gallery=True,
+            delays={IMAGE_URL.format(id="first"): 0.5},
+        )
+        extractor.race_endpoints = True
+
+        started = time.monotonic()
+        assert extractor._get_data("first", is_raw=True)["id"] == "first"
+        assert time.monotonic() - started < 0.5
+        assert extractor.endpoint_memory.get("raw", "first") == "query"
+
+        requested.clear()
+        extractor._get_data("first", is_raw=True)
+        assert requested == [GALLERY_URL.format(id="first")]
+
+    def test_race_executor(self):
+        """ Test every race of an extractor shares the same worker threads.
+        """
+
+        extractor = get_extractor(
+            ImgurExtractor,
+            [],
+            is_gallery=True,
+            delays={IMAGE_URL.format(id=id): 0.05 for id in ("first", "second")},
+        )
+        extractor.race_endpoints = True
+        extractor._get_data("first", is_raw=True)
+        executor = extractor._race_executor
+        extractor._get_data("second", is_raw=True)
+        assert extractor._race_executor is executor
+        assert len(executor._threads) <= 2
+
+    def test_race_cancelled_fetch(self, memory_transport):
+        """ Test losing requests are closed without reading or caching them.
+        """
+
+        # NOTE: the losing endpoint's 404 would otherwise be negatively cached
+        url = IMAGE_URL.format(id="first")
+        memory_transport.latency = 0.1
+        extractor = ImgurExtractor(cache=MemoryCache(), transport=memory_transport)
+
+        finished = threading.Event()
+        threading.Timer(0.05, finished.set).start()
+        assert extractor.fetch(url, cancel=finished) is None
+        assert extractor.cache.get(url) is None
+        assert extractor.fetch(url, cancel=finished) is None
+        assert len(memory_transport.requests) == 1
+
+        assert extractor.fetch(url, cancel=threading.Event()) == (404, "")
+        assert extractor.cache.get(url).status == 404
+
+    def test_async_race_endpoints(self):
+        """ Test asynchronously racing endpoints cancels the loser.
+        """
+
+        requested = []
+        extractor = get_extractor(
+            AsyncImgurExtractor,
+            requested,
+            delays={GALLERY_URL.format(id="first"): 10.0},
+        )
+        extractor.race_endpoints = True
+
+        started = time.monotonic()
+        data = asyncio.run(extractor._get_data("first", is_raw=True))
+        assert data["id"] == "first"
+        assert time.monotonic() - started < 5.0
+        assert extractor.endpoint_memory.get("raw", "first") == "default"
+
+    def test_race_dropped_endpoints(self):
+        """ Test endpoints failing without a response only lose the race.
+        """
+
+        dropped = [GALLERY_URL.format(id="first"), IMAGE_URL.format(id="second")]
+        extractor = get_extractor(
+            ImgurExtractor,
+            [],
+            delays={IMAGE_URL.format(id="first"): 0.1},
+            dropped=dropped,
+        )
+        extractor.race_endpoints = True
+        assert extractor._get_data("first", is_raw=True)["id"] == "first"
+        assert extractor.endpoint_memory.get("raw", "first") == "default"
+        with pytest.raises(exceptions.ExtractionError):
+            extractor._get_data("second", is_raw=True)
+
+        dropped.append(IMAGE_URL.format(id="third"))
+        dropped.append(GALLERY_URL.format(id="third"))
+        with pytest.raises(ConnectionResetError):
+            extractor._get_data("third", is_raw=True)
+
+    def test_async_race_dropped_endpoints(self):
+        """ Test asynchronously racing endpoints failing without a response.
+        """
+
+        dropped = [GALLERY_URL.format(id="first"), IMAGE_URL.format(id="second")]
+        extractor = get_extractor(
+            AsyncImgurExtractor,
+            [],
+            delays={IMAGE_URL.format(id="first"): 0.1},
+            dropped=dropped,
+        )
+        extractor.race_endpoints = True
+        data = asyncio.run(extractor._get_data("first", is_raw=True))
+        assert data["id"] == "first"
+        assert extractor.endpoint_memory.get("raw", "first") == "default"
+        with pytest.raises(exceptions.ExtractionError):
+            asyncio.run(extractor._get_data("second", is_raw=True))
+
+        dropped.append(IMAGE_URL.format(id="third"))
+        dropped.append(GALLERY_URL.format(id="third"))
+        with pytest.raises(aiohttp.ClientConnectionError):
+            asyncio.run(extractor._get_data("third", is_raw=True))
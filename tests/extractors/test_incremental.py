@@ -0,0 +1,124 @@
+# Copyright (c) 2018 Stephen Bunn (stephen@bunn.io)
+# MIT License <https://opensource.org/licenses/MIT>
+
+import asyncio
+
+from qetch import exceptions
+from qetch.extractors import ImgurExtractor, FourChanExtractor
+from qetch.extractors.fourchan import AsyncFourChanExtractor
+
+import ujson
+import pytest
+
+ALBUM_URL = "https://imgur.com/a/abcdef"
+ALBUM_QUERY_URL = "https://api.imgur.com/3/album/abcdef"
+THREAD_URL = "https://boards.4chan.org/g/thread/1"
+THREAD_QUERY_URL = "https://a.4cdn.org/g/thread/1.json"
+
+
+def get_album(count):
+    """ Builds the API data of an album with a number of images.
+    """
+
+    return {
+        "data": {
+            "id": "abcdef",
+            "title": "album",
+            "datetime": 1520000000,
+            "images": [
+                {"id": f"image{index}", "link": f"https://i.imgur.com/{index}.png"}
+                for index in range(count)
+            ],
+        }
+    }
+
+
+def get_thread(count):
+    """ Builds the API data of a thread with a number of posts.
+    """
+
+    return {
+        "posts": [
+            {
+                "no": index,
+                "time": 1520000000,
+                "tim": 1520000000000 + index,
+                "ext": ".png",
+                "md5": str(index),
+            }
+            for index in range(count)
+        ]
+    }
+
+
+class TestIncremental(object):
+    """ Test incrementally parsing large API responses.
+    """
+
+    def test_imgur_album(self, memory_transport):
+        """ Test album images are yielded before the whole album is read.
+        """
+
+        text = ujson.dumps(get_album(50))
+        memory_transport.add(ALBUM_QUERY_URL, text)
+        extractor = ImgurExtractor(incremental=True, transport=memory_transport)
+        content_lists = extractor.extract(ALBUM_URL, auth_tuple=("id", "secret"))
+
+        first = next(content_lists)
+        assert first[0].fragments == ["https://i.imgur.com/0.png"]
+        assert first[0].title == "album"
+        assert len(list(content_lists)) == 49
+
+        # NOTE: an album cut off halfway still yields the images before the cut
+        half = len(text) // 2
+        memory_transport.add(ALBUM_QUERY_URL, text[:half])
+        content_lists = extractor.extract(ALBUM_URL, auth_tuple=("id", "secret"))
+        assert next(content_lists)[0].fragments == ["https://i.imgur.com/0.png"]
+        with pytest.raises(ValueError):
+            list(content_lists)
+
+    def test_fourchan_thread(self, memory_transport):
+        """ Test thread posts are yielded before the whole thread is read.
+        """
+
+        text = ujson.dumps(get_thread(50))
+        half = len(text) // 2
+        memory_transport.add(THREAD_QUERY_URL, text[:half])
+        extractor = FourChanExtractor(incremental=True, transport=memory_transport)
+        content_lists = extractor.extract(THREAD_URL)
+        assert next(content_lists)[0].metadata["no"] == 0
+        with pytest.raises(ValueError):
+            list(content_lists)
+
+        memory_transport.add(THREAD_QUERY_URL, text)
+        assert [
+            content_list[0].metadata["no"]
+            for content_list in extractor.extract(THREAD_URL)
+        ] == list(range(50))
+
+        memory_transport.add(THREAD_QUERY_URL, "{}", status=404)
+        with pytest.raises(exceptions.ExtractionError):
+            list(extractor.extract(THREAD_URL))
+
+    def test_async_fourchan_thread(self):
+        """ Test asynchronously streaming thread posts.
+        """
+
+        text = ujson.dumps(get_thread(5))
+
+        async def fetch_stream(url, **kwargs):
+            async def iter_chunks():
+                for index in range(0, len(text), 7):
+                    yield text[index : index + 7]
+
+            return (200, iter_chunks())
+
+        async def extract():
+            return [
+                content_list[0].metadata["no"]
+                async for content_list in extractor.extract(THREAD_URL)
+            ]
+
+        extractor = AsyncFourChanExtractor(incremental=True)
+        extractor.fetch_stream = fetch_stream
+        assert asyncio.run(extract()) == list(range(5))
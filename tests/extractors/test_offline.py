@@ -0,0 +1,138 @@
+# Copyright (c) 2018 Stephen Bunn (stephen@bunn.io)
+# MIT License <https://opensource.org/licenses/MIT>
+
+import asyncio
+
+from qetch import exceptions
+from qetch.extractors import ImgurExtractor, GfycatExtractor
+from qetch.extractors.gfycat import AsyncGfycatExtractor
+
+import ujson
+import pytest
+
+GFYCAT_RAW_URL = "https://giant.gfycat.com/ExampleGfycatName.mp4"
+GFYCAT_QUERY_URL = "https://api.gfycat.com/v1/gfycats/ExampleGfycatName"
+GFYCAT_TOKEN_URL = "https://api.gfycat.com/v1/oauth/token/"
+GFYCAT_DATA = {
+    "gfyItem": {
+        "gfyId": "examplegfycatname",
+        "title": "example",
+        "userName": "uploader",
+        "createDate": 1520000000,
+    }
+}
+
+
+@pytest.fixture
+def transport(memory_transport):
+    memory_transport.add(GFYCAT_TOKEN_URL, ujson.dumps({"access_token": "token"}))
+    return memory_transport
+
+
+def get_requested(transport):
+    """ Gets the urls of the API data requested through a transport.
+    """
+
+    return [url for (method, url, _) in transport.requests if method == "GET"]
+
+
+class TestOffline(object):
+    """ Test extracting raw links without metadata.
+    """
+
+    def test_offline_extract(self, memory_transport):
+        """ Test raw links are built without any request or authentication.
+        """
+
+        extractor = GfycatExtractor(transport=memory_transport)
+        (content_list,) = extractor.extract(GFYCAT_RAW_URL, metadata=False)
+
+        assert content_list.metadata is None
+        assert content_list[0].uid == "gfycat-examplegfycatname-mp4"
+        assert content_list[0].fragments == [GFYCAT_RAW_URL]
+        assert list(
+            extractor.extract(GFYCAT_RAW_URL, metadata=False, extensions=["gif"])
+        ) == []
+
+        extractor = ImgurExtractor(transport=memory_transport)
+        (content_list,) = extractor.extract(
+            "https://i.imgur.com/abcdef.mp4", metadata=False
+        )
+        assert content_list[0].quality == 1.0
+
+        with pytest.raises(exceptions.AuthenticationError):
+            list(extractor.extract("https://i.imgur.com/abcdef.mp4"))
+        assert memory_transport.requests == []
+
+    def test_enrich(self, transport):
+        """ Test enriching requests the metadata of each id once.
+        """
+
+        transport.add(GFYCAT_QUERY_URL, ujson.dumps(GFYCAT_DATA))
+        extractor = GfycatExtractor(transport=transport)
+        content_lists = [
+            content_list
+            for url in (GFYCAT_RAW_URL, GFYCAT_RAW_URL.replace(".mp4", ".webm"))
+            for content_list in extractor.extract(url, metadata=False)
+        ]
+        built = content_lists[0][0]
+
+        assert extractor.enrich(content_lists, ("id", "secret")) == content_lists
+        assert get_requested(transport) == [GFYCAT_QUERY_URL]
+        assert [content_list.title for content_list in content_lists] == [
+            "example",
+            "example",
+        ]
+        assert built.uploaded_by == "uploader"
+        assert content_lists[1][0].metadata == GFYCAT_DATA["gfyItem"]
+
+        extractor.enrich(content_lists, ("id", "secret"))
+        assert len(get_requested(transport)) == 1
+
+    def test_enrich_errors(self, transport):
+        """ Test failed enrichments are given to the error hook or raised.
+        """
+
+        extractor = GfycatExtractor(transport=transport)
+        content_lists = list(extractor.extract(GFYCAT_RAW_URL, metadata=False))
+
+        errors = []
+        extractor.enrich(
+            content_lists,
+            ("id", "secret"),
+            error_hook=lambda id, exc: errors.append(id),
+        )
+        assert errors == ["ExampleGfycatName"]
+        assert content_lists[0].metadata is None
+
+        with pytest.raises(exceptions.ExtractionError):
+            extractor.enrich(content_lists, ("id", "secret"))
+
+    def test_async_enrich(self):
+        """ Test asynchronously extracting without metadata and enriching.
+        """
+
+        requested = []
+        extractor = AsyncGfycatExtractor()
+
+        async def fetch(url, method="GET", **kwargs):
+            requested.append(url)
+            return (200, ujson.dumps(GFYCAT_DATA))
+
+        async def authenticate(auth_tuple):
+            pass
+
+        async def extract():
+            content_lists = [
+                content_list
+                async for content_list in extractor.extract(
+                    GFYCAT_RAW_URL, metadata=False
+                )
+            ]
+            assert requested == []
+            return await extractor.enrich(content_lists, ("id", "secret"))
+
+        (extractor.fetch, extractor.authenticate) = (fetch, authenticate)
+        (content_list,) = asyncio.run(extract())
+        assert content_list.title == "example"
+        assert requested == [GFYCAT_QUERY_URL]
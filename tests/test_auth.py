@@ -0,0 +1,228 @@
+# Copyright (c) 2018 Stephen Bunn (stephen@bunn.io)
+# MIT License <https://opensource.org/licenses/MIT>
+
+import os
+import time
+import stat
+import asyncio
+import threading
+
+from qetch import auth
+from qetch.extractors import GfycatExtractor
+
+import ujson
+import pytest
+
+
+@pytest.fixture
+def token_cache():
+    cache = auth.TokenCache()
+    (cache.path, cache.refresh_margin) = (None, 60.0)
+    cache.clear()
+    yield cache
+    (cache.path, cache.refresh_margin) = (None, 60.0)
+    (cache._loaded_path, cache._loaded_stamp) = (None, None)
+    cache.clear()
+
+
+class Requester(object):
+    """ Requests numbered tokens, counting the requests.
+    """
+
+    def __init__(self, expires_in=3600, delay=0.0):
+        self.expires_in = expires_in
+        self.delay = delay
+        self.count = 0
+        self.lock = threading.Lock()
+
+    def __call__(self):
+        time.sleep(self.delay)
+        with self.lock:
+            self.count += 1
+            return (f"token-{self.count}", self.expires_in)
+
+
+class TestTokenCache(object):
+    """ Test the shared access token cache.
+    """
+
+    def test_shared(self, token_cache):
+        """ Test tokens are shared between instances until they expire.
+        """
+
+        request = Requester(expires_in=3600)
+        assert token_cache.get("client", request) == "token-1"
+        assert auth.TokenCache().get("client", request) == "token-1"
+        assert auth.TokenCache().get("other", request) == "token-2"
+
+        token_cache.set_token("client", "expired", expires_in=-1)
+        assert token_cache.get_token("client") is None
+        assert token_cache.get("client", request) == "token-3"
+
+        token_cache.invalidate("client")
+        assert token_cache.get("client", request) == "token-4"
+
+    def test_single_flight(self, token_cache):
+        """ Test concurrent refreshes of a token result in a single request.
+        """
+
+        request = Requester(delay=0.05)
+        tokens = []
+
+        def get_token():
+            tokens.append(token_cache.get("client", request))
+
+        threads = [threading.Thread(target=get_token) for _ in range(8)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+        assert tokens == ["token-1"] * 8
+        assert request.count == 1
+
+    def test_background_refresh(self, token_cache):
+        """ Test tokens about to expire are refreshed in the background.
+        """
+
+        token_cache.refresh_margin = 10.0
+        token_cache.set_token("client", "old", expires_in=5)
+        request = Requester(delay=0.05)
+
+        assert token_cache.get("client", request) == "old"
+        assert token_cache.get("client", request) == "old"
+        for _ in range(100):
+            if token_cache.get_token("client").value != "old":
+                break
+            time.sleep(0.01)
+        assert token_cache.get("client", request) == "token-1"
+        assert request.count == 1
+
+    def test_disk(self, token_cache, tmp_path):
+        """ Test tokens are stored in and loaded from the token file.
+        """
+
+        path = str(tmp_path / "tokens" / "tokens.json")
+        token_cache.path = path
+        token_cache.get("client", Requester())
+
+        assert stat.S_IMODE(os.stat(path).st_mode) == 0o600
+        with open(path, "r") as file_handle:
+            assert ujson.load(file_handle)["client"]["value"] == "token-1"
+
+        # a new process only knows the tokens in the file
+        token_cache._tokens.clear()
+        token_cache._loaded_path = None
+        request = Requester()
+        assert token_cache.get("client", request) == "token-1"
+        assert request.count == 0
+
+    def test_disk_shared(self, token_cache, tmp_path):
+        """ Test tokens written to the token file by other processes are kept.
+        """
+
+        path = str(tmp_path / "tokens.json")
+        expires = time.time() + 3600
+
+        def write(entries):
+            with open(path, "w") as file_handle:
+                ujson.dump(entries, file_handle)
+
+        # newer tokens in the file replace older tokens kept in memory
+        token_cache.set_token("client", "memory", expires_in=60)
+        write({"client": {"value": "disk", "expires": expires}})
+        token_cache.path = path
+        assert token_cache.get_token("client").value == "disk"
+
+        # another process stores a token for another client and refreshes ours
+        write(
+            {
+                "client": {"value": "refreshed", "expires": expires},
+                "other": {"value": "other", "expires": None},
+            }
+        )
+        assert token_cache.get_token("client").value == "refreshed"
+        token_cache.set_token("third", "third")
+        with open(path, "r") as file_handle:
+            entries = ujson.load(file_handle)
+        assert {key: entry["value"] for (key, entry) in entries.items()} == {
+            "client": "refreshed",
+            "other": "other",
+            "third": "third",
+        }
+
+        # tokens removed by another process are not written back
+        write({"third": {"value": "third", "expires": None}})
+        token_cache.invalidate("third")
+        assert token_cache.get_token("client") is None
+        with open(path, "r") as file_handle:
+            assert ujson.load(file_handle) == {}
+
+    def test_async(self, token_cache):
+        """ Test concurrent asynchronous refreshes result in a single request.
+        """
+
+        requested = []
+
+        async def request():
+            requested.append(True)
+            await asyncio.sleep(0.01)
+            return ("async-token", None)
+
+        async def get_tokens():
+            return await asyncio.gather(
+                *[token_cache.aget("client", request) for _ in range(8)]
+            )
+
+        assert asyncio.run(get_tokens()) == ["async-token"] * 8
+        assert len(requested) == 1
+        assert token_cache.get_token("client").expires is None
+
+    def test_gfycat(self, token_cache):
+        """ Test gfycat extractors share a single credential request.
+        """
+
+        requested = []
+
+        def fetch(url, method="GET", **kwargs):
+            requested.append(method)
+            return (200, ujson.dumps({"access_token": "token", "expires_in": 3600}))
+
+        for _ in range(3):
+            extractor = GfycatExtractor()
+            extractor.fetch = fetch
+            extractor.authenticate(("key", "secret"))
+            assert extractor.session.headers["Authorization"] == "Bearer token"
+        assert requested == ["POST"]
+
+        assert extractor._check_token(401, extractor.session.headers)
+        assert token_cache.get_token("gfycat:key") is None
+        assert "Authorization" not in extractor.session.headers
+
+    def test_gfycat_revoked(self, token_cache, memory_transport):
+        """ Test gfycat extractors authenticate again when a token is revoked.
+        """
+
+        api_url = f"{GfycatExtractor._api_base}abc"
+        for token in ("revoked", "fresh"):
+            memory_transport.add(
+                GfycatExtractor._auth_base,
+                ujson.dumps({"access_token": token, "expires_in": 3600}),
+                once=True,
+            )
+        memory_transport.add(api_url, "{}", status=401, once=True)
+        memory_transport.add(api_url, ujson.dumps({"gfyItem": {"gfyId": "abc"}}))
+
+        extractor = GfycatExtractor(transport=memory_transport)
+        extractor.authenticate(("key", "secret"))
+        assert extractor._get_data("abc") == {"gfyId": "abc"}
+        assert token_cache.get_token("gfycat:key").value == "fresh"
+        assert [
+            (method, headers.get("Authorization"))
+            for (method, url, headers) in memory_transport.requests
+        ] == [
+            ("POST", None),
+            ("GET", "Bearer revoked"),
+            ("POST", None),
+            ("GET", "Bearer fresh"),
+        ]
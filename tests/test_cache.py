@@ -0,0 +1,117 @@
+# Copyright (c) 2018 Stephen Bunn (stephen@bunn.io)
+# MIT License <https://opensource.org/licenses/MIT>
+
+import time
+
+from qetch import cache, exceptions
+from qetch.extractors import GfycatExtractor
+
+import ujson
+import pytest
+
+GFYCAT_URL = "https://api.gfycat.com/v1/gfycats/ExampleGfycatName"
+GFYCAT_DATA = {"gfyItem": {"gfyId": "examplegfycatname"}}
+
+
+@pytest.fixture(params=["memory", "sqlite", "directory"])
+def response_cache(request, tmp_path):
+    if request.param == "sqlite":
+        return cache.SQLiteCache(path=str(tmp_path / "cache.db"))
+    elif request.param == "directory":
+        return cache.DirectoryCache(path=str(tmp_path / "cache"))
+    return cache.MemoryCache()
+
+
+@pytest.fixture
+def extractor(response_cache, memory_transport):
+    return GfycatExtractor(cache=response_cache, transport=memory_transport)
+
+
+class TestCache(object):
+    """ Test the extractor response cache.
+    """
+
+    def test_parse_cache_control(self):
+        """ Test parsing Cache-Control directives.
+        """
+
+        assert cache.parse_cache_control('Public, max-age=60, no-cache="a"') == {
+            "public": None,
+            "max-age": "60",
+            "no-cache": "a",
+        }
+
+    def test_get_expires(self):
+        """ Test getting the freshness of responses.
+        """
+
+        assert cache.get_expires({"Cache-Control": "max-age=60"}, 100.0) == 160.0
+        assert cache.get_expires({"Cache-Control": "no-cache"}, 100.0) == 100.0
+        assert cache.get_expires({"Cache-Control": "no-store"}, 100.0) is None
+        assert cache.get_expires(
+            {"Expires": "Thu, 01 Jan 1970 00:01:40 GMT"}, 0.0
+        ) == 100.0
+        assert cache.get_expires({}, 100.0, default_ttl=5) == 105.0
+
+    def test_fresh(self, extractor, memory_transport):
+        """ Test fresh responses are served without a request.
+        """
+
+        memory_transport.add(
+            GFYCAT_URL,
+            ujson.dumps(GFYCAT_DATA),
+            headers={"Cache-Control": "max-age=60"},
+        )
+        for _ in range(3):
+            assert extractor._get_data("ExampleGfycatName") == GFYCAT_DATA["gfyItem"]
+        assert len(memory_transport.requests) == 1
+
+    def test_revalidate(self, extractor, memory_transport):
+        """ Test stale responses are revalidated and served on 304.
+        """
+
+        memory_transport.add(
+            GFYCAT_URL,
+            ujson.dumps(GFYCAT_DATA),
+            headers={"ETag": '"abc"', "Last-Modified": "Thu, 01 Jan 1970 00:00:00 GMT"},
+            once=True,
+        )
+        memory_transport.add(
+            GFYCAT_URL, status=304, headers={"Cache-Control": "max-age=60"}
+        )
+        for _ in range(3):
+            assert extractor._get_data("ExampleGfycatName") == GFYCAT_DATA["gfyItem"]
+
+        ((_, _, first_headers), (_, _, second_headers)) = memory_transport.requests
+        assert "If-None-Match" not in first_headers
+        assert second_headers == {
+            "If-None-Match": '"abc"',
+            "If-Modified-Since": "Thu, 01 Jan 1970 00:00:00 GMT",
+        }
+
+    def test_negative(self, extractor, response_cache, memory_transport):
+        """ Test 404 responses are served from the cache until they expire.
+        """
+
+        for _ in range(2):
+            with pytest.raises(exceptions.ExtractionError):
+                extractor._get_data("ExampleGfycatName")
+        assert len(memory_transport.requests) == 1
+
+        response_cache.set(GFYCAT_URL, cache.CacheEntry(404, "", expires=time.time()))
+        with pytest.raises(exceptions.ExtractionError):
+            extractor._get_data("ExampleGfycatName")
+        ((_, _, headers),) = memory_transport.requests[1:]
+        assert headers == {}
+
+    def test_no_store(self, extractor, response_cache, memory_transport):
+        """ Test responses marked as no-store are not cached.
+        """
+
+        memory_transport.add(
+            GFYCAT_URL, ujson.dumps(GFYCAT_DATA), headers={"Cache-Control": "no-store"}
+        )
+        for _ in range(2):
+            extractor._get_data("ExampleGfycatName")
+        assert len(memory_transport.requests) == 2
+        assert response_cache.get(GFYCAT_URL) is None
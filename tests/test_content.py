@@ -0,0 +1,205 @@
+# Copyright (c) 2018 Stephen Bunn (stephen@bunn.io)
+# MIT License <https://opensource.org/licenses/MIT>
+
+import gc
+import copy
+
+from qetch.utils import LazyText
+from qetch.content import Content, Variant, ContentGroup, VariantSelector
+from qetch.extractors import GfycatExtractor, GenericExtractor
+
+import ujson
+import pytest
+from furl import furl
+
+SOURCE_URL = "https://example.com/media/file.mp4"
+GFYCAT_URL = "https://gfycat.com/ExampleGfycatName"
+GFYCAT_DATA = {
+    "gfyItem": {
+        "gfyId": "examplegfycatname",
+        "createDate": 1520000000,
+        "mp4Url": "https://giant.gfycat.com/ExampleGfycatName.mp4",
+        "webmUrl": "https://giant.gfycat.com/ExampleGfycatName.webm",
+        "gifUrl": "https://giant.gfycat.com/ExampleGfycatName.gif",
+    }
+}
+
+
+class TestContent(object):
+    """ Test the compact content representation.
+    """
+
+    def test_slotted(self):
+        """ Test content does not carry an instance dictionary.
+        """
+
+        content = Content(
+            uid="slotted", source=SOURCE_URL, fragments=[], extractor=None
+        )
+        assert not hasattr(content, "__dict__")
+
+    def test_lazy_source(self):
+        """ Test the source is stored as a string and parsed on first access.
+        """
+
+        content = Content(
+            uid="lazy", source=furl(SOURCE_URL), fragments=[], extractor=None
+        )
+        assert content._source == SOURCE_URL
+        assert content._source_furl is None
+        assert content.source.host == "example.com"
+        assert content.source is content.source
+
+        content.source = "https://example.org/other.mp4"
+        assert content.source.host == "example.org"
+        assert content == Content(
+            uid="lazy",
+            source="https://example.org/other.mp4",
+            fragments=[],
+            extractor=None,
+        )
+
+    def test_extracted(self):
+        """ Test extracted content keeps its source url.
+        """
+
+        (content,) = next(GenericExtractor().extract(SOURCE_URL))
+        assert content.source.url == SOURCE_URL
+
+
+class TestContentGroup(object):
+    """ Test content groups of quality variants.
+    """
+
+    def get_group(self):
+        """ Gets a group of variants given in no particular order.
+        """
+
+        return ContentGroup(
+            source=SOURCE_URL,
+            extractor=None,
+            variants=[
+                Variant("gif", ["https://example.com/file.gif"], "gif", 0.25),
+                Variant("mp4", ["https://example.com/file.mp4"], "mp4", 1.0),
+                ("jpg", ["https://example.com/file.jpg"], "jpg", 0.0),
+                Variant("webm", ["https://example.com/file.webm"], "webm", 0.5),
+            ],
+            title="title",
+            metadata={"id": "file"},
+        )
+
+    def test_sequence(self):
+        """ Test groups behave like a list of content sorted by quality.
+        """
+
+        group = self.get_group()
+        assert isinstance(group, list)
+        assert group == list(group) and group + [] == list(group)
+        assert len(group) == 4
+        assert [content.uid for content in group] == ["mp4", "webm", "gif", "jpg"]
+        assert [content.uid for content in group[1:3]] == ["webm", "gif"]
+        assert group[0] is group[0]
+        assert group[0].title == group[-1].title == "title"
+        assert group[0].metadata is group[-1].metadata
+        assert group[0].source.url == SOURCE_URL
+
+        (first, *_) = group
+        assert first.quality == 1.0
+        assert [] + group == list(group) and copy.copy(group) == group
+        for mutate in (
+            lambda: group.append(first),
+            lambda: group.sort(),
+            lambda: group.__iadd__([first]),
+        ):
+            with pytest.raises(TypeError):
+                mutate()
+        assert [variant.uid for variant in group.variants] == [
+            "mp4",
+            "webm",
+            "gif",
+            "jpg",
+        ]
+
+    def test_lazy(self):
+        """ Test content is only built for a variant when it is first accessed.
+        """
+
+        def count_content():
+            return sum(isinstance(item, Content) for item in gc.get_objects())
+
+        built = count_content()
+        group = self.get_group()
+        assert count_content() == built
+        assert group[1].uid == "webm"
+        assert count_content() == built + 1
+        filtered = group.filter(extensions=["mp4", "webm"])
+        assert len(filtered) == 2 and count_content() == built + 1
+
+    def test_select(self):
+        """ Test selecting the best, worst and filtered variants.
+        """
+
+        group = self.get_group()
+        assert group.best().uid == "mp4"
+        assert group.worst().uid == "jpg"
+
+        group.update(description=LazyText("description", render=str))
+        assert group.description == group[0].description == "description"
+
+        filtered = group.filter(extensions=["WEBM", "gif"])
+        assert [content.uid for content in filtered] == ["webm", "gif"]
+        assert filtered.title == group.title
+        assert len(group.filter(extensions=[])) == 0
+        assert group.filter(extensions=[]).best() is None
+
+
+class TestVariantSelector(object):
+    """ Test selecting variants before they are built.
+    """
+
+    def test_select(self):
+        """ Test candidates are filtered and limited by quality.
+        """
+
+        qualities = {"mp4": 1.0, "webm": 0.5, "gif": 0.25, "jpg": 0.0}
+        candidates = ["gif", "mp4", "jpg", "webm"]
+
+        def select(**kwargs):
+            return VariantSelector(**kwargs).select(
+                candidates, quality=qualities.get, extension=str
+            )
+
+        assert select() == candidates
+        assert select(min_quality=0.5) == ["mp4", "webm"]
+        assert select(extensions=[".GIF", "jpg"]) == ["gif", "jpg"]
+        assert select(max_variants=2) == ["mp4", "webm"]
+        assert select(max_variants=1, prefer="smallest") == ["jpg"]
+
+        with pytest.raises(ValueError):
+            VariantSelector(max_variants=0)
+        with pytest.raises(ValueError):
+            VariantSelector(prefer="largest")
+
+    def test_extract(self):
+        """ Test extractors only build the selected variants.
+        """
+
+        extractor = GfycatExtractor()
+        extractor.fetch = lambda url, **kwargs: (200, ujson.dumps(GFYCAT_DATA))
+        extractor.authenticate = lambda auth_tuple: None
+        auth_tuple = ("key", "secret")
+
+        (content_list,) = extractor.extract(GFYCAT_URL, auth_tuple)
+        assert len(content_list.variants) == 3
+        (content_list,) = extractor.extract(GFYCAT_URL, auth_tuple, max_variants=1)
+        assert [content.extension for content in content_list] == ["mp4"]
+        (content_list,) = extractor.extract(
+            GFYCAT_URL,
+            auth_tuple,
+            extensions=["gif", "webm"],
+            prefer="smallest",
+            max_variants=1,
+        )
+        assert [content.extension for content in content_list] == ["gif"]
+
+        assert list(GenericExtractor().extract(SOURCE_URL, extensions=["gif"])) == []
@@ -0,0 +1,112 @@
+# Copyright (c) 2018 Stephen Bunn (stephen@bunn.io)
+# MIT License <https://opensource.org/licenses/MIT>
+
+import sys
+import subprocess
+
+import qetch
+from qetch import extractors
+
+import pytest
+
+# cumulative microseconds allowed for ``import qetch`` (measured ~45ms)
+IMPORT_BUDGET = 250000
+HEAVY_MODULES = (
+    "requests_html",
+    "pyppeteer",
+    "lxml",
+    "furl",
+    "blinker",
+    "ujson",
+    "qetch.content",
+    "qetch.extractors.imgur",
+    "qetch.extractors.gfycat",
+    "qetch.extractors.fourchan",
+    "qetch.extractors.generic",
+    "qetch.downloaders.http",
+    "qetch.sessions",
+    "qetch.transports.requests",
+    "qetch.transports.urllib3",
+)
+
+
+def get_import_times(statement: str) -> dict:
+    """ Gets the cumulative import times of the modules imported by a statement.
+    """
+
+    process = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", statement],
+        stdout=subprocess.PIPE,
+        stderr=subprocess.PIPE,
+        universal_newlines=True,
+        check=True,
+    )
+    import_times = {}
+    for line in process.stderr.splitlines():
+        if not line.startswith("import time:") or "cumulative" in line:
+            continue
+        (_, cumulative, name) = line[len("import time:"):].split("|")
+        import_times[name.strip()] = int(cumulative)
+    return import_times
+
+
+def get_imported_modules(statement: str) -> set:
+    """ Gets the names of all modules loaded after running a statement.
+    """
+
+    process = subprocess.run(
+        [
+            sys.executable,
+            "-c",
+            f"{statement}; import sys; print(chr(10).join(sys.modules))",
+        ],
+        stdout=subprocess.PIPE,
+        universal_newlines=True,
+        check=True,
+    )
+    return set(process.stdout.splitlines())
+
+
+class TestImport(object):
+    """ Test the startup cost of importing the Qetch framework.
+    """
+
+    def test_import_budget(self):
+        """ Test importing qetch stays within the import time budget.
+        """
+
+        import_times = get_import_times("import qetch")
+        assert import_times["qetch"] < IMPORT_BUDGET, (
+            f"importing qetch took {import_times['qetch']}us, budget is "
+            f"{IMPORT_BUDGET}us"
+        )
+
+        imported_modules = get_imported_modules("import qetch")
+        for module_name in HEAVY_MODULES:
+            assert module_name not in imported_modules, (
+                f"importing qetch eagerly imported {module_name!r}"
+            )
+
+    def test_route_imports_matched_extractor(self):
+        """ Test routing a url only imports the matched extractor's module.
+        """
+
+        imported_modules = get_imported_modules(
+            "import qetch; qetch.route('https://gfycat.com/ExampleGfycatName')"
+        )
+        assert "qetch.extractors.gfycat" in imported_modules
+        for module_name in (
+            "requests_html",
+            "qetch.extractors.imgur",
+            "qetch.extractors.fourchan",
+            "qetch.downloaders.http",
+        ):
+            assert module_name not in imported_modules
+
+    def test_plugin_domains(self):
+        """ Test the declared plugin domains match the extractor's domains.
+        """
+
+        for plugin in extractors.PLUGINS + (extractors.FALLBACK_PLUGIN,):
+            assert tuple(plugin.domains) == tuple(plugin.load().domains)
+            assert plugin.name == plugin.load().name
@@ -0,0 +1,331 @@
+# Copyright (c) 2018 Stephen Bunn (stephen@bunn.io)
+# MIT License <https://opensource.org/licenses/MIT>
+
+import time
+import threading
+import collections
+
+import qetch
+from qetch import routing, exceptions, extractors, downloaders
+from qetch.downloaders._common import DownloadCapabilities
+from qetch.sessions import SessionManager
+from qetch.transports import MemoryTransport
+
+import pytest
+
+ROUTED_URLS = {
+    "https://gfycat.com/ExampleGfycatName": (extractors.GfycatExtractor, "basic"),
+    "https://giant.gfycat.com/ExampleGfycatName.webm": (
+        extractors.GfycatExtractor,
+        "raw",
+    ),
+    "https://imgur.com/a/abc123": (extractors.ImgurExtractor, "album"),
+    "https://i.imgur.com/abc123.jpg": (extractors.ImgurExtractor, "basic"),
+    "https://boards.4chan.org/g/thread/12345678": (
+        extractors.FourChanExtractor,
+        "thread",
+    ),
+    "https://i.4cdn.org/g/1520000000000.png": (extractors.FourChanExtractor, "raw"),
+    "https://boards.4chan.org/g/catalog": (extractors.FourChanExtractor, "board"),
+    "https://example.com/media/file.mp4": (extractors.GenericExtractor, "all"),
+}
+
+
+class TestRouting(object):
+    """ Test the indexed url router.
+    """
+
+    def test_iter_domains(self):
+        """ Test iterating the parent domains of a host.
+        """
+
+        assert list(routing.iter_domains("i.imgur.com")) == [
+            "i.imgur.com",
+            "imgur.com",
+            "com",
+        ]
+
+    def test_get_host(self):
+        """ Test normalizing the host of a url.
+        """
+
+        assert routing.get_host("https://WWW.Imgur.com/a/abc") == "imgur.com"
+        assert routing.get_host("not a url") is None
+
+    def test_route(self):
+        """ Test routing urls to the expected extractor handles.
+        """
+
+        for (url, (extractor_class, handle_name)) in ROUTED_URLS.items():
+            (routed_class, routed_handle, match) = qetch.route(url)
+            assert routed_class is extractor_class
+            assert routed_handle == handle_name
+            (handle_name, handle_match) = extractor_class.get_handle(url)
+            assert match.groups() == handle_match.groups()
+
+    def test_route_unhandled(self):
+        """ Test routing a url that no extractor can handle.
+        """
+
+        assert qetch.ROUTER.route("ftp://example.com/file") is None
+        with pytest.raises(exceptions.ExtractionError):
+            qetch.get_extractor("ftp://example.com/file")
+
+    def test_get_extractor(self):
+        """ Test getting extractors through the router.
+        """
+
+        for (url, (extractor_class, _)) in ROUTED_URLS.items():
+            assert qetch.get_extractor(url) is extractor_class
+
+    def test_route_many(self):
+        """ Test routing many urls into buckets of shared extractors.
+        """
+
+        urls = list(ROUTED_URLS.keys()) * 3 + ["ftp://example.com/file"]
+        rejected = []
+        buckets = list(
+            qetch.route_many(urls, batch_size=2, reject_hook=rejected.append)
+        )
+
+        assert rejected == ["ftp://example.com/file"]
+        assert sum(len(bucket) for (_, _, bucket) in buckets) == len(urls) - 1
+        assert all(0 < len(bucket) <= 2 for (_, _, bucket) in buckets)
+
+        instances = {}
+        for (extractor, handle_name, bucket) in buckets:
+            for url in bucket:
+                assert ROUTED_URLS[url] == (extractor.__class__, handle_name)
+            assert instances.setdefault(extractor.__class__, extractor) is extractor
+
+    def test_get_downloader(self):
+        """ Test dispatching downloaders without making any requests.
+        """
+
+        (content,) = next(
+            extractors.GenericExtractor().extract("https://example.com/file.mp4")
+        )
+        assert qetch.get_downloader(content) is downloaders.HTTPDownloader
+        assert qetch.get_downloader(
+            content, requires=[DownloadCapabilities.RANGES]
+        ) is downloaders.HTTPDownloader
+
+        content.fragments = ["ftp://example.com/file.mp4"]
+        with pytest.raises(exceptions.DownloadError):
+            qetch.get_downloader(content)
+
+    def test_get_downloader_probe(self, monkeypatch):
+        """ Test probing fragments is memoized.
+        """
+
+        transport = MemoryTransport()
+        transport.add("https://example.com/probe.mp4", b"probe")
+
+        downloaders.HTTPDownloader.clear_probes()
+        monkeypatch.setattr(downloaders.HTTPDownloader, "transport", transport)
+        (content,) = next(
+            extractors.GenericExtractor().extract("https://example.com/probe.mp4")
+        )
+        for _ in range(3):
+            assert qetch.get_downloader(content, probe=True) is (
+                downloaders.HTTPDownloader
+            )
+        assert [(method, url) for (method, url, _) in transport.requests] == [
+            ("HEAD", "https://example.com/probe.mp4")
+        ]
+        downloaders.HTTPDownloader.clear_probes()
+
+    def test_get_downloader_probe_failed(self, monkeypatch):
+        """ Test failed probes are not memoized and never raise.
+        """
+
+        transport = MemoryTransport()
+        monkeypatch.setattr(downloaders.HTTPDownloader, "transport", transport)
+        (content,) = next(
+            extractors.GenericExtractor().extract("https://example.com/probe.mp4")
+        )
+        with pytest.raises(exceptions.DownloadError):
+            qetch.get_downloader(content, probe=True)
+
+        transport.add("https://example.com/probe.mp4", b"probe")
+        assert qetch.get_downloader(content, probe=True) is (
+            downloaders.HTTPDownloader
+        )
+        downloaders.HTTPDownloader.clear_probes()
+
+        def refuse(*args, **kwargs):
+            raise ConnectionRefusedError("connection refused")
+
+        monkeypatch.setattr(transport, "request", refuse)
+        assert not downloaders.HTTPDownloader.can_handle(content)
+
+
+class TestExtractMany(object):
+    """ Test concurrently extracting many urls.
+    """
+
+    def test_domain_queue(self):
+        """ Test the domain queue limits the active items of each group.
+        """
+
+        queue = routing.DomainQueue(per_domain=2)
+        for index in range(3):
+            queue.put("a", f"a{index}")
+        queue.put("b", "b0")
+
+        assert len(queue) == 4
+        assert queue.pop_ready(10) == [("a", "a0"), ("a", "a1"), ("b", "b0")]
+        assert queue.pop_ready(10) == []
+        queue.release("a")
+        assert queue.pop_ready(10) == [("a", "a2")]
+        assert len(queue) == 0
+
+        with pytest.raises(ValueError):
+            routing.DomainQueue(per_domain=0)
+
+    def test_extract_many(self, monkeypatch):
+        """ Test extracting many urls respects the per domain limit.
+        """
+
+        lock = threading.Lock()
+        active = collections.Counter()
+        peaks = collections.Counter()
+        handle_all = extractors.GenericExtractor.handle_all
+
+        def slow_handle_all(self, source, match, **kwargs):
+            host = routing.get_host(source)
+            with lock:
+                active[host] += 1
+                peaks[host] = max(peaks[host], active[host])
+            time.sleep(0.01)
+            with lock:
+                active[host] -= 1
+            yield from handle_all(self, source, match, **kwargs)
+
+        monkeypatch.setattr(extractors.GenericExtractor, "handle_all", slow_handle_all)
+        urls = [
+            f"https://{host}.example.com/{index}.mp4"
+            for index in range(10)
+            for host in ("a", "b", "c")
+        ]
+        rejected = []
+        results = dict(
+            qetch.extract_many(
+                urls + ["ftp://example.com/file"],
+                max_workers=6,
+                per_domain=2,
+                reject_hook=rejected.append,
+            )
+        )
+
+        assert rejected == ["ftp://example.com/file"]
+        assert set(results.keys()) == set(urls)
+        for (url, content_lists) in results.items():
+            assert content_lists[0][0].fragments == [url]
+        assert max(peaks.values()) <= 2
+
+    def test_extract_many_errors(self, monkeypatch):
+        """ Test extraction errors are given to the error hook or raised.
+        """
+
+        handle_all = extractors.GenericExtractor.handle_all
+
+        def broken_handle_all(self, source, match, **kwargs):
+            raise exceptions.ExtractionError(source)
+            yield
+
+        monkeypatch.setattr(
+            extractors.GenericExtractor, "handle_all", broken_handle_all
+        )
+        errors = []
+        assert (
+            list(
+                qetch.extract_many(
+                    ["https://example.com/file.mp4"],
+                    error_hook=lambda url, exc: errors.append(url),
+                )
+            )
+            == []
+        )
+        assert errors == ["https://example.com/file.mp4"]
+
+        with pytest.raises(exceptions.ExtractionError):
+            list(qetch.extract_many(["https://example.com/file.mp4"]))
+
+        # NOTE: extractions running when one fails are yielded before it raises
+        def slow_handle_all(self, source, match, **kwargs):
+            if "broken" in source:
+                raise exceptions.ExtractionError(source)
+            time.sleep(0.05)
+            yield from handle_all(self, source, match, **kwargs)
+
+        monkeypatch.setattr(extractors.GenericExtractor, "handle_all", slow_handle_all)
+        results = []
+        with pytest.raises(exceptions.ExtractionError):
+            for (url, _) in qetch.extract_many(
+                ["https://a.example.com/file.mp4", "https://b.example.com/broken.mp4"]
+            ):
+                results.append(url)
+        assert results == ["https://a.example.com/file.mp4"]
+
+    def test_extract_many_pools(self, monkeypatch, http_server):
+        """ Test extracting many urls never waits for a pooled connection.
+        """
+
+        manager = SessionManager()
+        manager.close()
+        manager.reset_stats()
+        http_server.handler.delay = 0.05
+        handle_all = extractors.GenericExtractor.handle_all
+
+        def fetching_handle_all(self, source, match, **kwargs):
+            assert self.session.get(http_server.url).text == "ok"
+            yield from handle_all(self, source, match, **kwargs)
+
+        monkeypatch.setattr(
+            extractors.GenericExtractor, "handle_all", fetching_handle_all
+        )
+        urls = [f"{http_server.url}/{index}.mp4" for index in range(32)]
+        try:
+            results = dict(qetch.extract_many(urls, max_workers=16, per_domain=16))
+            assert set(results.keys()) == set(urls)
+            stats = manager.get_stats(http_server.url)
+            assert stats.new_connections > 10
+            assert stats.waits == 0
+        finally:
+            manager.close()
+            manager.reset_stats()
+
+    def test_extract_many_busy_domain(self, monkeypatch):
+        """ Test urls of a busy domain never hold back the urls of other domains.
+        """
+
+        handle_all = extractors.GenericExtractor.handle_all
+
+        def slow_handle_all(self, source, match, **kwargs):
+            if routing.get_host(source) == "a.example.com":
+                time.sleep(0.02)
+            yield from handle_all(self, source, match, **kwargs)
+
+        monkeypatch.setattr(extractors.GenericExtractor, "handle_all", slow_handle_all)
+        read = []
+
+        def iter_urls():
+            for index in range(20):
+                read.append(index)
+                yield f"https://a.example.com/{index}.mp4"
+            yield "https://b.example.com/file.mp4"
+
+        results = [
+            url
+            for (url, _) in qetch.extract_many(iter_urls(), max_workers=2, per_domain=1)
+        ]
+        assert results.index("https://b.example.com/file.mp4") < 2
+
+        read.clear()
+        extracted = qetch.extract_many(
+            iter_urls(), max_workers=2, per_domain=1, backlog=3
+        )
+        next(extracted)
+        assert len(read) <= 5
+        extracted.close()
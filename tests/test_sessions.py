@@ -0,0 +1,86 @@
+# Copyright (c) 2018 Stephen Bunn (stephen@bunn.io)
+# MIT License <https://opensource.org/licenses/MIT>
+
+import threading
+
+from qetch.sessions import PoolStats, SessionManager
+from qetch.extractors import ImgurExtractor, GfycatExtractor
+
+import pytest
+
+
+@pytest.fixture
+def manager():
+    manager = SessionManager()
+    manager.close()
+    manager.reset_stats()
+    yield manager
+    manager.close()
+    manager.reset_stats()
+
+
+class TestSessionManager(object):
+    """ Test the shared sessions and connection pools.
+    """
+
+    def test_shared_pools(self, manager, http_server):
+        """ Test connections are reused across sessions of extractors.
+        """
+
+        extractors = [ImgurExtractor(), GfycatExtractor()]
+        assert extractors[0].session is not extractors[1].session
+        for extractor in extractors * 2:
+            assert extractor.session.get(http_server.url).text == "ok"
+
+        assert manager.get_stats() == PoolStats(hits=3, new_connections=1)
+        assert list(manager.get_host_stats()) == [http_server.url]
+        assert manager.get_stats("http://example.com:80") == PoolStats()
+
+    def test_thread_sessions(self, manager, http_server):
+        """ Test each thread gets its own session sharing the same pools.
+        """
+
+        sessions = []
+
+        def get_session():
+            sessions.append(manager.session)
+            manager.session.get(http_server.url)
+
+        threads = [threading.Thread(target=get_session) for _ in range(4)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+        assert len(set(map(id, sessions))) == 4
+        adapters = [session.get_adapter(http_server.url) for session in sessions]
+        assert all(adapter is manager.adapter for adapter in adapters)
+        assert manager.get_stats().waits == 0
+
+    def test_reserve(self, manager, http_server):
+        """ Test full pools make checkouts wait until they are grown.
+        """
+
+        http_server.handler.delay = 0.1
+        manager.pool_maxsize = 1
+
+        def get_concurrently(count):
+            threads = [
+                threading.Thread(target=lambda: manager.session.get(http_server.url))
+                for _ in range(count)
+            ]
+            for thread in threads:
+                thread.start()
+            for thread in threads:
+                thread.join()
+
+        get_concurrently(3)
+        stats = manager.get_stats()
+        assert stats.waits == 2
+        assert stats.wait_time > 0.1
+
+        assert manager.reserve(3) == 3
+        assert manager.reserve(2) == 3
+        manager.reset_stats()
+        get_concurrently(3)
+        assert manager.get_stats().waits == 0
@@ -0,0 +1,158 @@
+# Copyright (c) 2018 Stephen Bunn (stephen@bunn.io)
+# MIT License <https://opensource.org/licenses/MIT>
+
+import socket
+
+from qetch import transports
+from qetch.sessions import SessionManager
+from qetch.extractors import ImgurExtractor
+from qetch.transports import Headers, MemoryTransport, Urllib3Transport
+
+import pytest
+
+URL = "https://example.com/file.bin"
+
+
+class TestMemoryTransport(object):
+    """ Test serving resources from memory.
+    """
+
+    def test_request(self):
+        """ Test resources are served with their headers and requests recorded.
+        """
+
+        transport = MemoryTransport(headers={"User-Agent": "qetch"})
+        transport.add(URL, "hello", headers={"Content-Type": "text/plain"})
+
+        response = transport.get(URL, headers={"X-Test": "1"})
+        assert (response.status_code, response.text) == (200, "hello")
+        assert response.headers["content-length"] == "5"
+        assert transport.head(URL).content == b""
+        assert transport.get("https://example.com/missing").status_code == 404
+
+        (method, url, headers) = transport.requests[0]
+        assert (method, url) == ("GET", URL)
+        assert dict(headers) == {"User-Agent": "qetch", "X-Test": "1"}
+
+    def test_once(self):
+        """ Test resources added once answer a single request in order.
+        """
+
+        transport = MemoryTransport()
+        transport.add(URL, "first", once=True)
+        transport.add(URL, "second", status=500, once=True)
+        assert [
+            (response.status_code, response.text)
+            for response in (transport.get(URL), transport.get(URL))
+        ] == [(200, "first"), (500, "second")]
+        assert transport.get(URL).status_code == 404
+
+        transport.add(URL, "always")
+        transport.add(URL, "once", once=True)
+        responses = [transport.get(URL) for _ in range(3)]
+        assert [response.text for response in responses] == ["once", "always", "always"]
+
+    def test_ranges(self):
+        """ Test range requests are answered with partial content.
+        """
+
+        transport = MemoryTransport()
+        transport.add(URL, bytes(range(10)))
+
+        for (value, expected) in (
+            ("bytes=2-4", bytes([2, 3, 4])),
+            ("bytes=8-", bytes([8, 9])),
+            ("bytes=-3", bytes([7, 8, 9])),
+        ):
+            with transport.get(URL, headers={"range": value}, stream=True) as response:
+                assert response.status_code == 206
+                assert b"".join(response.iter_content(1)) == expected
+        assert response.headers["Content-Range"] == "bytes 7-9/10"
+
+        transport.add(URL, bytes(range(10)), accept_ranges=False)
+        response = transport.get(URL, headers={"Range": "bytes=2-4"})
+        assert (response.status_code, len(response.content)) == (200, 10)
+
+    def test_extractor(self):
+        """ Test extractors request through their transport.
+        """
+
+        transport = MemoryTransport()
+        transport.add("https://api.imgur.com/3/image/abcdef", "{}", status=404)
+        extractor = ImgurExtractor(transport=transport)
+
+        assert extractor.session is transport
+        assert extractor.fetch("https://api.imgur.com/3/image/abcdef") == (404, "{}")
+        assert transports.get_transport("memory") is not transport
+        with pytest.raises(ValueError):
+            transports.get_transport("missing")
+
+
+class TestUrllib3Transport(object):
+    """ Test requesting through urllib3 pools.
+    """
+
+    def test_socket_options(self):
+        """ Test the socket options of connections are tunable.
+        """
+
+        options = Urllib3Transport(receive_buffer=4096, no_delay=False).socket_options
+        assert (socket.IPPROTO_TCP, socket.TCP_NODELAY, 0) in options
+        assert (socket.SOL_SOCKET, socket.SO_RCVBUF, 4096) in options
+
+        options = Urllib3Transport(receive_buffer=None, keep_alive=False).socket_options
+        assert options == [(socket.IPPROTO_TCP, socket.TCP_NODELAY, 1)]
+
+    def test_request(self, http_server):
+        """ Test requests are made and streamed through tracked pools.
+        """
+
+        manager = SessionManager()
+        manager.reset_stats()
+        transport = Urllib3Transport()
+
+        with transport.get(http_server.url, stream=True) as response:
+            assert b"".join(response.iter_content(1)) == b"ok"
+        response = transport.post(http_server.url, data={"key": "value"})
+        assert response.text == "key=value"
+        assert response.headers["content-type"] == "application/x-www-form-urlencoded"
+
+        assert manager.get_stats(http_server.url).hits == 1
+        assert transport.reserve(manager.pool_maxsize + 1) == manager.pool_maxsize
+        assert transport.pool_manager.connection_pool_kw["maxsize"] == (
+            manager.pool_maxsize
+        )
+        manager.close()
+
+
+class TestHTTPXTransport(object):
+    """ Test requesting through httpx clients.
+    """
+
+    def test_request(self, http_server):
+        """ Test requests are made and streamed through the client.
+        """
+
+        pytest.importorskip("httpx")
+        transport = transports.get_transport("httpx")
+
+        with transport.get(http_server.url, stream=True) as response:
+            assert b"".join(response.iter_content(1)) == b"ok"
+        assert response.http_version == "HTTP/1.1"
+        response = transport.post(http_server.url, data={"key": "value"})
+        assert response.text == "key=value"
+        assert transport.reserve(64) == 64
+
+        transport.close()
+        assert transport.get(http_server.url).status_code == 200
+        transport.close()
+
+
+def test_headers():
+    """ Test headers are case-insensitive and keep their original names.
+    """
+
+    headers = Headers({"Content-Type": "text/plain"}, accept="*/*")
+    headers["content-type"] = "text/html"
+    assert dict(headers) == {"content-type": "text/html", "accept": "*/*"}
+    assert "CONTENT-TYPE" in headers
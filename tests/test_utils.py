@@ -0,0 +1,89 @@
+# Copyright (c) 2018 Stephen Bunn (stephen@bunn.io)
+# MIT License <https://opensource.org/licenses/MIT>
+
+from qetch import utils
+
+import ujson
+import pytest
+from qetch.content import Content
+from qetch.extractors import GenericExtractor
+
+
+class TestUtils(object):
+    """ Test the Qetch utilities.
+    """
+
+    def test_html_to_text(self):
+        """ Test rendering 4chan comment markup as text.
+        """
+
+        assert utils.html_to_text(
+            '<a href="#p123" class="quotelink">&gt;&gt;123</a><br>'
+            '<span class="quote">&gt;implying</span><br/>'
+            "it&#039;s a <s>spoiler</s> &amp; a long<wbr>word"
+        ) == ">>123\n>implying\nit's a spoiler & a longword"
+        assert utils.html_to_text("") == ""
+
+    def test_lazy_text(self):
+        """ Test lazy text is rendered once on first access.
+        """
+
+        rendered = []
+
+        def render(raw):
+            rendered.append(raw)
+            return raw.upper()
+
+        description = utils.LazyText("description", render=render)
+        (first, second) = (
+            Content(
+                uid=f"lazy-{index}",
+                source="https://example.com/file.mp4",
+                fragments=[],
+                extractor=GenericExtractor(),
+                description=description,
+            )
+            for index in range(2)
+        )
+
+        assert rendered == []
+        assert first.description == second.description == "DESCRIPTION"
+        assert rendered == ["description"]
+
+        first.description = "changed"
+        assert first.description == "changed"
+
+    def test_json_array_splitter(self):
+        """ Test splitting the items of a JSON array as the document is fed.
+        """
+
+        document = {
+            "data": {
+                "title": 'an "album" [with, brackets]',
+                "tags": [{"name": "}"}],
+                "images": [{"id": index, "nested": [index, {}]} for index in range(5)]
+                + [None, "\\\"", []],
+                "after": None,
+            }
+        }
+        text = ujson.dumps(document)
+        for size in (1, 3, len(text)):
+            splitter = utils.JSONArraySplitter(["data", "images"])
+            items = []
+            for index in range(0, len(text), size):
+                items.extend(splitter.feed(text[index : index + size]))
+                # only the text of the current item is ever buffered
+                assert len(splitter._buffer) < 64
+            splitter.close()
+
+            assert items == document["data"]["images"]
+            assert splitter.siblings == {
+                "title": document["data"]["title"],
+                "tags": document["data"]["tags"],
+                "after": None,
+            }
+
+        assert list(utils.iter_json_array(["[1, [2", "], {}]"], [])) == [1, [2], {}]
+        assert list(utils.iter_json_array(['{"posts": []}'], ["posts"])) == []
+        with pytest.raises(ValueError):
+            list(utils.iter_json_array(['{"posts": [{"no": 1}, {'], ["posts"]))